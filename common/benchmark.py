@@ -1,46 +1,269 @@
 from __future__ import annotations
 
+import argparse
+import gc
+import importlib
 import inspect
+import multiprocessing
+import pstats
+import re
+import sys
 import timeit
+import tracemalloc
 from abc import ABC
-from typing import Any, Callable, List, Optional, Tuple, Union, get_type_hints
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from multiprocessing.context import BaseContext
+from pathlib import Path
+from types import ModuleType
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_type_hints,
+)
+
+from common.benchmark_results import (
+    BenchmarkComparison,
+    BenchmarkEnvironment,
+    BenchmarkReport,
+    BenchmarkReportSerializer,
+    BenchmarkResult,
+    BenchmarkStats,
+    MemoryUsage,
+    compare_reports,
+    fit_sweep,
+)
+from common.complexity import ComplexityFit
+from common.fixtures import DEFAULT_CACHE_DIRECTORY, DEFAULT_SEED, Fixtures
+from common.instrumentation import OperationCounts
+from common.memory import current_rss, format_size, peak_rss, traced_blocks
+from common.profiling import profile_callback, save_profile
 
 VoidCallback = Callable[[], None]
 BenchmarkCallback = Union[Tuple[VoidCallback, int], Tuple[VoidCallback, int, int]]
 BenchmarkMethod = Callable[["Benchmark"], BenchmarkCallback]
+BenchmarkSelection = List[Tuple[Type["Benchmark"], List[BenchmarkMethod]]]
+F = TypeVar("F", bound=Callable[..., object])
+
+
+@dataclass(frozen=True)
+class BenchmarkOptions:
+    warmup: int = 0
+    repeats: int = 1
+    memory: bool = False
+    profile: Optional[str] = None
+    operations: bool = False
+    seed: int = DEFAULT_SEED
+    cache_directory: Optional[str] = DEFAULT_CACHE_DIRECTORY
+
+    def __post_init__(self) -> None:
+        if self.warmup < 0:
+            raise ValueError("Warmup rounds must be greater than or equal to 0")
+        if self.repeats < 1:
+            raise ValueError("Repeats must be greater than or equal to 1")
 
 
 class Benchmark(ABC):
+    def __init__(self) -> None:
+        self.fixtures: Fixtures = Fixtures()
+        self.operations: Optional[OperationCounts] = None
+
     @classmethod
-    def run_benchmarks(cls) -> None:
-        benchmark_methods: List[BenchmarkMethod] = cls._get_benchmark_methods()
-
-        for method in benchmark_methods:
-            instance: Benchmark = cls()
-            instance.setUp()
-
-            result: BenchmarkCallback = method(instance)
-            callback: VoidCallback
-            iterations: int
-            count_of_elements: Optional[int] = None
-
-            if len(result) == 2:
-                callback, iterations = result
-            else:
-                callback, iterations, count_of_elements = result
-
-            postfix: str = f" and {count_of_elements} elements" if count_of_elements else ""
-            print(
-                f"Running {cls.__name__}.{method.__name__} with {iterations} iterations{postfix}..."
-            )
-            time_taken = timeit.timeit(callback, number=iterations)
-            print(
-                f"Completed {iterations} iterations in {time_taken:.6f} seconds",
-                end="\n\n",
-            )
+    def run_benchmarks(
+        cls,
+        options: BenchmarkOptions = BenchmarkOptions(),
+        methods: Optional[Sequence[BenchmarkMethod]] = None,
+    ) -> List[BenchmarkResult]:
+        results: List[BenchmarkResult] = []
+
+        for method in cls._get_benchmark_methods() if methods is None else methods:
+            sweep_: Optional[Sweep] = _get_sweep(method)
+
+            if sweep_ is None:
+                results.append(cls._run_benchmark(method, options))
+                continue
+
+            sweep_results: List[BenchmarkResult] = [
+                cls._run_benchmark(method, options, sweep_.attribute, size) for size in sweep_.sizes
+            ]
+            _print_sweep(sweep_results, sweep_)
+            results.extend(sweep_results)
+
+        return results
+
+    @classmethod
+    def _run_benchmark(
+        cls,
+        method: BenchmarkMethod,
+        options: BenchmarkOptions,
+        attribute: Optional[str] = None,
+        size: Optional[int] = None,
+        verbose: bool = True,
+    ) -> BenchmarkResult:
+        result: Optional[BenchmarkResult] = None
+
+        for attempt in range(options.warmup + options.repeats):
+            instance: Benchmark = cls._set_up(method, options, attribute, size)
+
+            try:
+                callback, iterations, count_of_elements = cls._unpack(method(instance))
+
+                if result is None:
+                    sweep_: Optional[Sweep] = _get_sweep(method)
+                    result = BenchmarkResult(
+                        cls.__name__,
+                        method.__name__,
+                        iterations,
+                        count_of_elements,
+                        size=size,
+                        fit=sweep_ is None or sweep_.fit,
+                    )
+                    if verbose:
+                        _print_header(result, options)
+
+                time_taken: float = timeit.timeit(callback, number=iterations)
+            finally:
+                instance.tearDown()
+
+            if attempt >= options.warmup:
+                result.samples.append(time_taken)
+
+        assert result is not None
+        if options.memory:
+            result.memory = cls._measure_memory(method, options, attribute, size)
+        if options.operations:
+            result.operations = cls._count_operations(method, options, attribute, size)
+        if options.profile is not None:
+            result.profile = cls._profile(method, options, attribute, size, result.name)
+        if verbose:
+            _print_result(result)
+        return result
+
+    @classmethod
+    def _measure_memory(
+        cls,
+        method: BenchmarkMethod,
+        options: BenchmarkOptions,
+        attribute: Optional[str],
+        size: Optional[int],
+    ) -> MemoryUsage:
+        gc.collect()
+        tracemalloc.start()
+        instance: Optional[Benchmark] = None
+
+        try:
+            instance = cls._set_up(method, options, attribute, size)
+            callback, iterations, _ = cls._unpack(method(instance))
+
+            setup_bytes, _ = tracemalloc.get_traced_memory()
+            setup_blocks: int = traced_blocks()
+            tracemalloc.reset_peak()
+
+            for _ in range(iterations):
+                callback()
+
+            current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+            blocks: int = traced_blocks()
+        finally:
+            tracemalloc.stop()
+            if instance is not None:
+                instance.tearDown()
+
+        return MemoryUsage(
+            setup_bytes=setup_bytes,
+            peak_bytes=peak_bytes - setup_bytes,
+            bytes_per_op=(current_bytes - setup_bytes) / iterations,
+            blocks_per_op=(blocks - setup_blocks) / iterations,
+            rss_bytes=current_rss(),
+            peak_rss_bytes=peak_rss(),
+        )
+
+    @classmethod
+    def _count_operations(
+        cls,
+        method: BenchmarkMethod,
+        options: BenchmarkOptions,
+        attribute: Optional[str],
+        size: Optional[int],
+    ) -> Optional[OperationCounts]:
+        operations: OperationCounts = OperationCounts()
+        instance: Benchmark = cls._set_up(method, options, attribute, size, operations)
 
+        try:
+            callback, iterations, _ = cls._unpack(method(instance))
+            operations.reset()
+            for _ in range(iterations):
+                callback()
+        finally:
             instance.tearDown()
 
+        return operations if operations else None
+
+    @classmethod
+    def _profile(
+        cls,
+        method: BenchmarkMethod,
+        options: BenchmarkOptions,
+        attribute: Optional[str],
+        size: Optional[int],
+        name: str,
+    ) -> str:
+        assert options.profile is not None
+        instance: Benchmark = cls._set_up(method, options, attribute, size)
+
+        try:
+            callback, iterations, _ = cls._unpack(method(instance))
+            stats: pstats.Stats = profile_callback(callback, iterations)
+        finally:
+            instance.tearDown()
+
+        prof, _ = save_profile(stats, options.profile, name)
+        return prof
+
+    @classmethod
+    def _set_up(
+        cls,
+        method: BenchmarkMethod,
+        options: BenchmarkOptions,
+        attribute: Optional[str],
+        size: Optional[int],
+        operations: Optional[OperationCounts] = None,
+    ) -> Benchmark:
+        instance: Benchmark = cls()
+        instance.fixtures = Fixtures(
+            options.seed,
+            cls.__name__,
+            method.__name__,
+            size,
+            cache_directory=options.cache_directory,
+        )
+        instance.operations = operations
+        # Before setUp, so it can size its data, and after, so a default it assigns does not win
+        if attribute is not None:
+            setattr(instance, attribute, size)
+        instance.setUp()
+        if attribute is not None:
+            setattr(instance, attribute, size)
+        return instance
+
+    @staticmethod
+    def _unpack(result: BenchmarkCallback) -> Tuple[VoidCallback, int, Optional[int]]:
+        if len(result) == 2:
+            callback, iterations = result
+            return callback, iterations, None
+
+        return result
+
     @classmethod
     def _get_benchmark_methods(cls) -> List[BenchmarkMethod]:
         methods: List[BenchmarkMethod] = []
@@ -60,8 +283,433 @@ class Benchmark(ABC):
     def tearDown(self) -> None: ...
 
 
-def main() -> None:
-    module = __import__("__main__")
-    for name, obj in module.__dict__.items():
-        if inspect.isclass(obj) and issubclass(obj, Benchmark) and obj is not Benchmark:
-            obj.run_benchmarks()
+@dataclass(frozen=True)
+class Sweep:
+    sizes: Tuple[int, ...]
+    attribute: str
+    fit: bool = True
+
+
+_SWEEP_ATTRIBUTE = "__benchmark_sweep__"
+
+
+def _get_sweep(method: BenchmarkMethod) -> Optional[Sweep]:
+    return getattr(method, _SWEEP_ATTRIBUTE, None)
+
+
+def sweep(sizes: Iterable[int], attribute: str = "n", fit: bool = True) -> Callable[[F], F]:
+    """Repeats the benchmark method for every size, assigned to `attribute` around setUp.
+
+    setUp already sees the size, so it may build sized data from it, as long as it does not
+    assign its own default to `attribute` first; a default it does assign is overwritten after.
+
+    The results are fitted to a complexity class; pass `fit=False` when `attribute` is not the
+    input size, e.g. a thread count, to get a plain table instead.
+    """
+
+    def decorator(method: F) -> F:
+        setattr(method, _SWEEP_ATTRIBUTE, Sweep(tuple(sizes), attribute, fit))
+        return method
+
+    return decorator
+
+
+def discover_benchmarks(packages: Optional[Sequence[str]] = None) -> List[Type[Benchmark]]:
+    """Imports `<package>.benchmark` for every given package, or for every lab by default."""
+    if packages is None:
+        common: Path = Path(__file__).resolve().parent
+        packages = sorted(
+            path.parent.name
+            for path in common.parent.glob("*/benchmark.py")
+            if path.parent != common
+        )
+
+    benchmarks: List[Type[Benchmark]] = []
+    for package in packages:
+        module: ModuleType = importlib.import_module(f"{package}.benchmark")
+        benchmarks.extend(
+            benchmark
+            for benchmark in _collect_benchmarks(module)
+            if benchmark.__module__ == module.__name__
+        )
+
+    return benchmarks
+
+
+def select_benchmarks(
+    benchmarks: Sequence[Type[Benchmark]],
+    patterns: Sequence[str] = (),
+    regex: Optional[str] = None,
+) -> BenchmarkSelection:
+    """Keeps methods whose `Class.method`, class or method name matches any glob and the regex."""
+    compiled: Optional[re.Pattern[str]] = re.compile(regex) if regex is not None else None
+    selection: BenchmarkSelection = []
+
+    for benchmark in benchmarks:
+        methods: List[BenchmarkMethod] = [
+            method
+            for method in benchmark._get_benchmark_methods()
+            if _is_selected(benchmark.__name__, method.__name__, patterns, compiled)
+        ]
+        if methods:
+            selection.append((benchmark, methods))
+
+    return selection
+
+
+def _is_selected(
+    benchmark: str,
+    method: str,
+    patterns: Sequence[str],
+    regex: Optional[re.Pattern[str]],
+) -> bool:
+    name: str = f"{benchmark}.{method}"
+
+    if patterns and not any(
+        fnmatchcase(candidate, pattern)
+        for pattern in patterns
+        for candidate in (name, benchmark, method)
+    ):
+        return False
+
+    return regex is None or regex.search(name) is not None
+
+
+def _collect_benchmarks(module: ModuleType) -> List[Type[Benchmark]]:
+    return [
+        obj
+        for obj in module.__dict__.values()
+        if inspect.isclass(obj) and issubclass(obj, Benchmark) and obj is not Benchmark
+    ]
+
+
+def run_in_processes(
+    selection: BenchmarkSelection,
+    options: BenchmarkOptions,
+    jobs: int,
+) -> List[BenchmarkResult]:
+    """Runs every benchmark method (and every sweep size) in its own fresh worker process."""
+    results: List[BenchmarkResult] = []
+    context: BaseContext = multiprocessing.get_context("spawn")
+
+    with ProcessPoolExecutor(jobs, mp_context=context, max_tasks_per_child=1) as executor:
+        groups: List[Tuple[Optional[Sweep], List[Future[BenchmarkResult]]]] = []
+
+        for benchmark, methods in selection:
+            for method in methods:
+                sweep_: Optional[Sweep] = _get_sweep(method)
+                sizes: Sequence[Optional[int]] = sweep_.sizes if sweep_ is not None else [None]
+                groups.append(
+                    (
+                        sweep_,
+                        [
+                            executor.submit(
+                                _run_in_process, benchmark, method.__name__, size, options
+                            )
+                            for size in sizes
+                        ],
+                    )
+                )
+
+        for sweep_, group in groups:
+            group_results: List[BenchmarkResult] = [future.result() for future in group]
+
+            for result in group_results:
+                _print_header(result, options)
+                _print_result(result)
+
+            if sweep_ is not None:
+                _print_sweep(group_results, sweep_)
+
+            results.extend(group_results)
+
+    return results
+
+
+def _run_in_process(
+    benchmark: Type[Benchmark],
+    method_name: str,
+    size: Optional[int],
+    options: BenchmarkOptions,
+) -> BenchmarkResult:
+    method: BenchmarkMethod = getattr(benchmark, method_name)
+    sweep_: Optional[Sweep] = _get_sweep(method)
+    attribute: Optional[str] = sweep_.attribute if sweep_ is not None else None
+
+    return benchmark._run_benchmark(method, options, attribute, size, verbose=False)
+
+
+def _format_duration(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
+
+
+def _print_header(result: BenchmarkResult, options: BenchmarkOptions) -> None:
+    postfix: str = f" and {result.count_of_elements} elements" if result.count_of_elements else ""
+    rounds: str = ""
+    if options.warmup or options.repeats > 1:
+        rounds = f" ({options.warmup} warmup rounds, {options.repeats} repeats)"
+
+    print(f"Running {result.name} with {result.iterations} iterations{postfix}{rounds}...")
+
+
+def _print_result(result: BenchmarkResult) -> None:
+    if len(result.samples) == 1:
+        print(f"Completed {result.iterations} iterations in {result.total_time:.6f} seconds")
+    else:
+        stats: BenchmarkStats = result.per_op
+        print(
+            f"Completed {len(result.samples)} x {result.iterations} iterations "
+            f"in {result.total_time:.6f} seconds"
+        )
+        print(
+            f"Per op: min {_format_duration(stats.min)}, "
+            f"median {_format_duration(stats.median)}, "
+            f"p95 {_format_duration(stats.p95)}, "
+            f"p99 {_format_duration(stats.p99)}, "
+            f"stddev {_format_duration(stats.stddev)}"
+        )
+
+    if result.memory is not None:
+        memory: MemoryUsage = result.memory
+        rss: str = ""
+        if memory.rss_bytes is not None and memory.peak_rss_bytes is not None:
+            rss = (
+                f", RSS {format_size(memory.rss_bytes)} (peak {format_size(memory.peak_rss_bytes)})"
+            )
+        print(
+            f"Memory: setup {format_size(memory.setup_bytes)}, "
+            f"peak +{format_size(memory.peak_bytes)}, "
+            f"{format_size(memory.bytes_per_op)}/op, "
+            f"{memory.blocks_per_op:.2f} blocks/op{rss}"
+        )
+
+    if result.operations is not None:
+        operations: OperationCounts = result.operations
+        print(
+            f"Operations per op: {operations.comparisons / result.iterations:.2f} comparisons, "
+            f"{operations.reads / result.iterations:.2f} reads, "
+            f"{operations.writes / result.iterations:.2f} writes, "
+            f"{operations.node_hops / result.iterations:.2f} node hops"
+        )
+
+    if result.profile is not None:
+        print(f"Profile: {result.profile}")
+
+    print()
+
+
+def _print_sweep(results: List[BenchmarkResult], sweep_: Sweep) -> None:
+    if len(results) < 2:
+        return
+
+    if not sweep_.fit:
+        print(f"{results[0].benchmark}.{results[0].method} by {sweep_.attribute} (median per op):")
+        for result in results:
+            print(f"{result.size}: {_format_duration(result.per_op.median)}")
+        print()
+        return
+
+    fits: List[ComplexityFit] = fit_sweep(results)
+    print(f"{results[0].benchmark}.{results[0].method} scales as {fits[0]}")
+    print("Other candidates: " + ", ".join(str(fit) for fit in fits[1:]), end="\n\n")
+
+
+def _print_comparisons(comparisons: List[BenchmarkComparison], threshold: float) -> None:
+    print(f"Comparison with baseline (median per op, threshold +{threshold:.0%}):")
+    for comparison in comparisons:
+        status: str = "REGRESSION" if comparison.is_regression(threshold) else "ok"
+        print(
+            f"{comparison.name}: {_format_duration(comparison.baseline)} -> "
+            f"{_format_duration(comparison.current)} ({comparison.ratio - 1:+.1%}) {status}"
+        )
+    print()
+
+
+def _print_benchmarks(selection: BenchmarkSelection) -> None:
+    for benchmark, methods in selection:
+        for method in methods:
+            sweep_: Optional[Sweep] = _get_sweep(method)
+            sizes: str = f" (sizes: {', '.join(map(str, sweep_.sizes))})" if sweep_ else ""
+            print(f"{benchmark.__module__}: {benchmark.__name__}.{method.__name__}{sizes}")
+
+
+def _build_parser(description: str) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "-l",
+        "--list",
+        action="store_true",
+        help="list selected benchmark methods and exit",
+    )
+    parser.add_argument(
+        "-k",
+        "--filter",
+        action="append",
+        default=[],
+        metavar="GLOB",
+        help="run methods whose Class.method, class or method name matches; repeatable",
+    )
+    parser.add_argument(
+        "-e",
+        "--regex",
+        help="run methods whose Class.method matches this regular expression",
+    )
+    parser.add_argument(
+        "-w",
+        "--warmup",
+        type=int,
+        default=0,
+        help="untimed rounds to run before measuring (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeats",
+        type=int,
+        default=1,
+        help="timed rounds per benchmark method (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-m",
+        "--memory",
+        action="store_true",
+        help="add an untimed tracemalloc round reporting memory per benchmark method",
+    )
+    parser.add_argument(
+        "-c",
+        "--count-operations",
+        action="store_true",
+        help="add an untimed round counting comparisons, element reads/writes and node hops "
+        "in benchmarks that support instrumentation",
+    )
+    parser.add_argument(
+        "-p",
+        "--profile",
+        metavar="DIRECTORY",
+        help="add an untimed cProfile round per benchmark method, saving .prof and "
+        "flamegraph-ready .collapsed files into this directory",
+    )
+    parser.add_argument(
+        "-s",
+        "--seed",
+        type=int,
+        default=DEFAULT_SEED,
+        help="seed of the generated benchmark inputs (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=DEFAULT_CACHE_DIRECTORY,
+        help="directory caching large generated datasets between runs (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="regenerate datasets instead of reading them from the cache directory",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=0,
+        help="run each benchmark method in a fresh process using this many workers "
+        "(default: run everything in the current process)",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=("text", "json", "csv"),
+        default="text",
+        help="format printed to stdout; progress goes to stderr for json and csv "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="write results to a .json or .csv file",
+    )
+    parser.add_argument(
+        "-b",
+        "--baseline",
+        help="compare results with a .json file saved by a previous run",
+    )
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="allowed slowdown against the baseline before failing (default: %(default)s)",
+    )
+
+    return parser
+
+
+def _run(args: argparse.Namespace, benchmarks: Sequence[Type[Benchmark]]) -> None:
+    selection: BenchmarkSelection = select_benchmarks(benchmarks, args.filter, args.regex)
+
+    if args.list:
+        _print_benchmarks(selection)
+        return
+
+    options: BenchmarkOptions = BenchmarkOptions(
+        warmup=args.warmup,
+        repeats=args.repeats,
+        memory=args.memory,
+        profile=args.profile,
+        operations=args.count_operations,
+        seed=args.seed,
+        cache_directory=None if args.no_cache else args.cache_dir,
+    )
+    report: BenchmarkReport = BenchmarkReport(BenchmarkEnvironment.current())
+    is_regressed: bool = False
+
+    with redirect_stdout(sys.stdout if args.format == "text" else sys.stderr):
+        if args.jobs > 0:
+            report.results.extend(run_in_processes(selection, options, args.jobs))
+        else:
+            for benchmark, methods in selection:
+                report.results.extend(benchmark.run_benchmarks(options, methods))
+
+        if args.baseline is not None:
+            baseline = BenchmarkReportSerializer.load_report_from_file(args.baseline)
+            comparisons: List[BenchmarkComparison] = compare_reports(report, baseline)
+            _print_comparisons(comparisons, args.threshold)
+            is_regressed = any(
+                comparison.is_regression(args.threshold) for comparison in comparisons
+            )
+
+    if args.format != "text":
+        BenchmarkReportSerializer.dump_report(report, sys.stdout, args.format)
+
+    if args.output is not None:
+        BenchmarkReportSerializer.save_report_to_file(report, args.output)
+
+    if is_regressed:
+        sys.exit(1)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Runs the benchmarks declared in the `__main__` module, i.e. a labN/benchmark.py script."""
+    parser: argparse.ArgumentParser = _build_parser("Run benchmarks declared in this module.")
+    _run(parser.parse_args(argv), _collect_benchmarks(sys.modules["__main__"]))
+
+
+def cli(argv: Optional[Sequence[str]] = None) -> None:
+    """Discovers and runs the benchmarks of every lab: `python -m common.benchmark`."""
+    parser: argparse.ArgumentParser = _build_parser("Discover and run benchmarks of the labs.")
+    parser.add_argument(
+        "packages",
+        nargs="*",
+        help="packages to search for a benchmark module, e.g. lab2 lab5 (default: all)",
+    )
+    args: argparse.Namespace = parser.parse_args(argv)
+    _run(args, discover_benchmarks(args.packages or None))
+
+
+if __name__ == "__main__":
+    # Re-import under the package name, so that the runner and the discovered lab modules
+    # share a single Benchmark class instead of `__main__.Benchmark` and its copy.
+    from common import benchmark
+
+    benchmark.cli()
@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import csv
+import json
+import math
+import os
+import platform
+import statistics
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, TextIO
+
+from common.complexity import ComplexityFit, fit_complexity
+from common.instrumentation import OperationCounts
+
+
+@dataclass(frozen=True)
+class BenchmarkStats:
+    min: float
+    median: float
+    mean: float
+    p95: float
+    p99: float
+    stddev: float
+
+    @classmethod
+    def from_samples(cls, samples: Sequence[float]) -> BenchmarkStats:
+        if not samples:
+            raise ValueError("At least one sample is required")
+
+        ordered: List[float] = sorted(samples)
+        return cls(
+            min=ordered[0],
+            median=statistics.median(ordered),
+            mean=statistics.fmean(ordered),
+            p95=_percentile(ordered, 95),
+            p99=_percentile(ordered, 99),
+            stddev=statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+        )
+
+
+@dataclass(frozen=True)
+class MemoryUsage:
+    setup_bytes: int
+    peak_bytes: int
+    bytes_per_op: float
+    blocks_per_op: float
+    rss_bytes: Optional[int] = None
+    peak_rss_bytes: Optional[int] = None
+
+
+@dataclass
+class BenchmarkResult:
+    benchmark: str
+    method: str
+    iterations: int
+    count_of_elements: Optional[int] = None
+    samples: List[float] = field(default_factory=list)
+    size: Optional[int] = None
+    memory: Optional[MemoryUsage] = None
+    profile: Optional[str] = None
+    operations: Optional[OperationCounts] = None
+    # False for sweeps over something other than the input size, which are not fitted
+    fit: bool = True
+
+    @property
+    def name(self) -> str:
+        postfix: str = f"[n={self.size}]" if self.size is not None else ""
+        return f"{self.benchmark}.{self.method}{postfix}"
+
+    @property
+    def total_time(self) -> float:
+        return sum(self.samples)
+
+    @property
+    def per_op(self) -> BenchmarkStats:
+        return BenchmarkStats.from_samples([sample / self.iterations for sample in self.samples])
+
+
+@dataclass(frozen=True)
+class BenchmarkEnvironment:
+    python_version: str
+    python_implementation: str
+    platform: str
+    machine: str
+    processor: str
+    hostname: str
+    cpu_count: int
+    created_at: str
+
+    @classmethod
+    def current(cls) -> BenchmarkEnvironment:
+        return cls(
+            python_version=platform.python_version(),
+            python_implementation=platform.python_implementation(),
+            platform=platform.platform(),
+            machine=platform.machine(),
+            processor=platform.processor(),
+            hostname=platform.node(),
+            cpu_count=os.cpu_count() or 1,
+            created_at=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        )
+
+
+@dataclass
+class BenchmarkReport:
+    environment: BenchmarkEnvironment
+    results: List[BenchmarkResult] = field(default_factory=list)
+
+    def find(self, name: str) -> Optional[BenchmarkResult]:
+        for result in self.results:
+            if result.name == name:
+                return result
+        return None
+
+    def sweeps(self) -> Dict[str, List[BenchmarkResult]]:
+        sweeps: Dict[str, List[BenchmarkResult]] = {}
+        for result in self.results:
+            if result.size is not None:
+                sweeps.setdefault(f"{result.benchmark}.{result.method}", []).append(result)
+        return sweeps
+
+
+def fit_sweep(results: Sequence[BenchmarkResult]) -> List[ComplexityFit]:
+    return fit_complexity(
+        [result.size for result in results if result.size is not None],
+        [result.per_op.median for result in results],
+    )
+
+
+@dataclass(frozen=True)
+class BenchmarkComparison:
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline > 0 else math.inf
+
+    def is_regression(self, threshold: float) -> bool:
+        return self.ratio > 1 + threshold
+
+
+def compare_reports(
+    current: BenchmarkReport,
+    baseline: BenchmarkReport,
+) -> List[BenchmarkComparison]:
+    comparisons: List[BenchmarkComparison] = []
+
+    for result in current.results:
+        previous: Optional[BenchmarkResult] = baseline.find(result.name)
+        if previous is None:
+            continue
+
+        comparisons.append(
+            BenchmarkComparison(result.name, previous.per_op.median, result.per_op.median)
+        )
+
+    return comparisons
+
+
+class BenchmarkReportSerializer:
+    _CSV_FIELDS = [
+        "benchmark",
+        "method",
+        "iterations",
+        "count_of_elements",
+        "size",
+        "repeats",
+        "total_time",
+        *(f"per_op_{name}" for name in BenchmarkStats.__dataclass_fields__),
+        *(f"memory_{name}" for name in MemoryUsage.__dataclass_fields__),
+        *(f"operations_{name}" for name in OperationCounts.__dataclass_fields__),
+        *BenchmarkEnvironment.__dataclass_fields__,
+    ]
+
+    @classmethod
+    def save_report_to_file(cls, report: BenchmarkReport, filename: str) -> None:
+        with open(filename, "w", encoding="utf-8", newline="") as file:
+            cls.dump_report(report, file, "csv" if filename.endswith(".csv") else "json")
+
+    @classmethod
+    def dump_report(cls, report: BenchmarkReport, file: TextIO, format: str = "json") -> None:
+        if format == "csv":
+            cls._dump_report_to_csv(report, file)
+        elif format == "json":
+            json.dump(cls.report_to_dict(report), file, ensure_ascii=False, indent=4)
+            file.write("\n")
+        else:
+            raise ValueError(f"Unsupported report format {format}")
+
+    @classmethod
+    def _dump_report_to_csv(cls, report: BenchmarkReport, file: TextIO) -> None:
+        writer = csv.DictWriter(file, fieldnames=cls._CSV_FIELDS)
+        writer.writeheader()
+        for result in report.results:
+            writer.writerow(
+                {
+                    "benchmark": result.benchmark,
+                    "method": result.method,
+                    "iterations": result.iterations,
+                    "count_of_elements": result.count_of_elements,
+                    "size": result.size,
+                    "repeats": len(result.samples),
+                    "total_time": result.total_time,
+                    **{f"per_op_{k}": v for k, v in asdict(result.per_op).items()},
+                    **(
+                        {f"memory_{k}": v for k, v in asdict(result.memory).items()}
+                        if result.memory is not None
+                        else {}
+                    ),
+                    **(
+                        {f"operations_{k}": v for k, v in asdict(result.operations).items()}
+                        if result.operations is not None
+                        else {}
+                    ),
+                    **asdict(report.environment),
+                }
+            )
+
+    @classmethod
+    def load_report_from_file(cls, filename: str) -> BenchmarkReport:
+        with open(filename, "r", encoding="utf-8") as file:
+            return cls.dict_to_report(json.load(file))
+
+    @classmethod
+    def report_to_dict(cls, report: BenchmarkReport) -> Dict[str, Any]:
+        return {
+            "environment": asdict(report.environment),
+            "results": [
+                {
+                    "name": result.name,
+                    **asdict(result),
+                    "total_time": result.total_time,
+                    "per_op": asdict(result.per_op),
+                }
+                for result in report.results
+            ],
+            "complexity": {
+                name: str(fit_sweep(results)[0].complexity)
+                for name, results in report.sweeps().items()
+                if len(results) > 1 and results[0].fit
+            },
+        }
+
+    @classmethod
+    def dict_to_report(cls, data: Dict[str, Any]) -> BenchmarkReport:
+        return BenchmarkReport(
+            environment=BenchmarkEnvironment(**data["environment"]),
+            results=[
+                BenchmarkResult(
+                    benchmark=result["benchmark"],
+                    method=result["method"],
+                    iterations=result["iterations"],
+                    count_of_elements=result["count_of_elements"],
+                    samples=result["samples"],
+                    size=result.get("size"),
+                    memory=MemoryUsage(**result["memory"]) if result.get("memory") else None,
+                    profile=result.get("profile"),
+                    operations=(
+                        OperationCounts(**result["operations"])
+                        if result.get("operations")
+                        else None
+                    ),
+                    fit=result.get("fit", True),
+                )
+                for result in data["results"]
+            ],
+        )
+
+
+def _percentile(ordered: Sequence[float], percent: float) -> float:
+    position: float = (len(ordered) - 1) * percent / 100
+    lower: int = math.floor(position)
+    upper: int = math.ceil(position)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
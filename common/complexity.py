@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Dict, List, Sequence
+
+
+class Complexity(Enum):
+    CONSTANT = "O(1)"
+    LOGARITHMIC = "O(log n)"
+    LINEAR = "O(n)"
+    LINEARITHMIC = "O(n log n)"
+    QUADRATIC = "O(n^2)"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+_MODELS: Dict[Complexity, Callable[[float], float]] = {
+    Complexity.CONSTANT: lambda n: 1.0,
+    Complexity.LOGARITHMIC: lambda n: math.log2(n),
+    Complexity.LINEAR: lambda n: n,
+    Complexity.LINEARITHMIC: lambda n: n * math.log2(n),
+    Complexity.QUADRATIC: lambda n: n * n,
+}
+
+
+@dataclass(frozen=True)
+class ComplexityFit:
+    complexity: Complexity
+    coefficient: float
+    error: float
+
+    def __str__(self) -> str:
+        return f"{self.complexity} (rms relative error {self.error:.1%})"
+
+
+def fit_complexity(sizes: Sequence[int], timings: Sequence[float]) -> List[ComplexityFit]:
+    """Fits `timing ~ coefficient * f(size)` for every known class, best fit first.
+
+    Least squares are taken over relative residuals, so the smallest sizes weigh as much as
+    the largest ones instead of being drowned by them.
+    """
+    if len(sizes) != len(timings):
+        raise ValueError("Sizes and timings must have the same length")
+    if len(sizes) < 2:
+        raise ValueError("At least two sizes are required to fit complexity")
+    if min(sizes) < 2 or min(timings) <= 0:
+        raise ValueError("Sizes must be greater than 1 and timings must be positive")
+
+    fits: List[ComplexityFit] = []
+
+    for complexity, model in _MODELS.items():
+        ratios: List[float] = [model(n) / t for n, t in zip(sizes, timings)]
+        coefficient: float = sum(ratios) / sum(r * r for r in ratios)
+        residual: float = sum((1 - coefficient * r) ** 2 for r in ratios)
+        fits.append(ComplexityFit(complexity, coefficient, math.sqrt(residual / len(ratios))))
+
+    return sorted(fits, key=lambda fit: fit.error)
+
+
+def geometric_sizes(start: int, stop: int, count: int) -> List[int]:
+    if start < 1 or stop < start or count < 1:
+        raise ValueError("Expected 1 <= start <= stop and count >= 1")
+    if count == 1:
+        return [start]
+
+    ratio: float = (stop / start) ** (1 / (count - 1))
+    return sorted({round(start * ratio**i) for i in range(count)})
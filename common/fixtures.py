@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import os
+import pickle
+import string
+from pathlib import Path
+from random import Random
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_SEED = 2024
+DEFAULT_CACHE_DIRECTORY = str(Path(__file__).resolve().parent.parent / ".benchmark_cache")
+
+_datasets: Dict[str, Any] = {}
+
+
+class Fixtures:
+    """Seeded inputs for a benchmark method, generated before the timed region.
+
+    `random` is derived from the seed and the key (benchmark, method, size), so every round of a
+    method sees the same data. Datasets from `cached` depend only on the seed, name and parameters,
+    so they are shared between methods and, with a cache directory, between runs.
+    """
+
+    def __init__(
+        self,
+        seed: int = DEFAULT_SEED,
+        *key: object,
+        cache_directory: Optional[str] = None,
+    ) -> None:
+        self.seed: int = seed
+        self.random: Random = Random(repr((seed, *key)))
+        self.cache_directory: Optional[str] = cache_directory
+
+    def integers(self, count: int, lower: int, upper: int) -> List[int]:
+        return [self.random.randint(lower, upper) for _ in range(count)]
+
+    def pairs(self, count: int, lower: int, upper: int) -> List[Tuple[int, int]]:
+        return [
+            (self.random.randint(lower, upper), self.random.randint(lower, upper))
+            for _ in range(count)
+        ]
+
+    def permutation(self, n: int) -> List[int]:
+        return self.random.sample(range(n), n)
+
+    def strings(
+        self,
+        count: int,
+        length: int,
+        alphabet: str = string.ascii_lowercase,
+    ) -> List[str]:
+        def factory(random: Random) -> List[str]:
+            return ["".join(random.choices(alphabet, k=length)) for _ in range(count)]
+
+        return self.cached("strings", factory, count, length, alphabet)
+
+    def edges(
+        self,
+        n: int,
+        count: int,
+        max_weight: int = 100,
+    ) -> List[Tuple[int, int, int]]:
+        """Random weighted edges between distinct vertices `0..n-1`, without duplicates."""
+        if count > n * (n - 1):
+            raise ValueError("Too many edges for the number of vertices")
+
+        def factory(random: Random) -> List[Tuple[int, int, int]]:
+            pairs: Dict[Tuple[int, int], int] = {}
+            while len(pairs) < count:
+                from_vertex, to_vertex = random.randrange(n), random.randrange(n)
+                if from_vertex != to_vertex:
+                    pairs.setdefault((from_vertex, to_vertex), random.randint(1, max_weight))
+            return [(u, v, weight) for (u, v), weight in pairs.items()]
+
+        return self.cached("edges", factory, n, count, max_weight)
+
+    def cached(self, name: str, factory: Callable[[Random], T], *parameters: object) -> T:
+        """Returns a copy of the dataset built by `factory`, memoized in memory and on disk."""
+        key: str = hashlib.sha1(repr((self.seed, name, parameters)).encode()).hexdigest()[:16]
+        filename: str = f"{name}-{key}"
+
+        if filename not in _datasets:
+            _datasets[filename] = self._load_or_create(
+                filename, factory, (self.seed, name, *parameters)
+            )
+
+        dataset: T = copy.copy(_datasets[filename])
+        return dataset
+
+    def _load_or_create(
+        self,
+        filename: str,
+        factory: Callable[[Random], T],
+        seed: Tuple[object, ...],
+    ) -> T:
+        if self.cache_directory is None:
+            return factory(Random(repr(seed)))
+
+        path: Path = Path(self.cache_directory) / f"{filename}.pickle"
+        try:
+            with open(path, "rb") as file:
+                dataset: T = pickle.load(file)
+                return dataset
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            pass
+
+        dataset = factory(Random(repr(seed)))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary: Path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temporary, "wb") as file:
+            pickle.dump(dataset, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path)
+
+        return dataset
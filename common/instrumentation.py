@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from collections.abc import MutableSequence
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, List, Optional, Protocol, TypeVar, Union, overload
+
+T = TypeVar("T")
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Indexable(Protocol):
+    def __getitem__(self, index: Any) -> Any: ...
+
+    def __setitem__(self, index: Any, value: Any) -> None: ...
+
+    def __len__(self) -> int: ...
+
+
+S = TypeVar("S", bound=Indexable)
+
+
+@dataclass
+class OperationCounts:
+    comparisons: int = 0
+    reads: int = 0
+    writes: int = 0
+    node_hops: int = 0
+
+    def reset(self) -> None:
+        self.comparisons = self.reads = self.writes = self.node_hops = 0
+
+    def __bool__(self) -> bool:
+        return any((self.comparisons, self.reads, self.writes, self.node_hops))
+
+
+def counting_compare(compare: F, counts: Optional[OperationCounts]) -> F:
+    """Wraps a `compare`/`compare_to` callable, or returns it as is when counting is off."""
+    if counts is None:
+        return compare
+
+    def wrapper(*args: Any) -> Any:
+        counts.comparisons += 1
+        return compare(*args)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def counting_sequence(sequence: S, counts: Optional[OperationCounts]) -> S:
+    """Wraps a list or an array to count element reads and writes when counting is on.
+
+    The proxy only supports indexing, slicing and `len`, which is what the algorithms use.
+    """
+    if counts is None:
+        return sequence
+
+    proxy: Any = CountingSequence(sequence, counts)
+    return proxy  # type: ignore[no-any-return]
+
+
+class CountingSequence(MutableSequence[T]):
+    """Proxy counting element reads and writes; slices are copies, so they count as writes."""
+
+    def __init__(self, sequence: Indexable, counts: OperationCounts) -> None:
+        self._sequence: Any = sequence
+        self._counts: OperationCounts = counts
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> CountingSequence[T]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, CountingSequence[T]]:
+        if isinstance(index, slice):
+            copy: List[T] = list(self._sequence[index])
+            self._counts.writes += len(copy)
+            return CountingSequence(copy, self._counts)
+
+        self._counts.reads += 1
+        value: T = self._sequence[index]
+        return value
+
+    @overload
+    def __setitem__(self, index: int, value: T) -> None: ...
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[T]) -> None: ...
+
+    def __setitem__(self, index: Union[int, slice], value: Any) -> None:
+        if isinstance(index, slice):
+            values: List[T] = list(value)
+            self._counts.writes += len(values)
+            self._sequence[index] = values
+        else:
+            self._counts.writes += 1
+            self._sequence[index] = value
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        del self._sequence[index]
+
+    def __len__(self) -> int:
+        return len(self._sequence)
+
+    def insert(self, index: int, value: T) -> None:
+        self._counts.writes += 1
+        self._sequence.insert(index, value)
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import os
+import sys
+import tracemalloc
+from typing import Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+
+def traced_blocks() -> int:
+    return len(tracemalloc.take_snapshot().traces) if tracemalloc.is_tracing() else 0
+
+
+def current_rss() -> Optional[int]:
+    """Resident set size of this process in bytes, where /proc is available."""
+    try:
+        with open("/proc/self/statm", "r", encoding="utf-8") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def peak_rss() -> Optional[int]:
+    """Highest resident set size of this process so far in bytes, over its whole lifetime.
+
+    `ru_maxrss` (KiB on Linux, bytes on macOS) is sampled by the kernel and may lag behind
+    `current_rss`, so the larger of the two is returned.
+    """
+    if resource is None:
+        return None
+
+    max_rss: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak: int = max_rss if sys.platform == "darwin" else max_rss * 1024
+    current: Optional[int] = current_rss()
+    return peak if current is None else max(peak, current)
+
+
+def format_size(size: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
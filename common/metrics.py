@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import functools
+import json
+import time
+import weakref
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, TextIO, Type
+
+Gauge = Callable[[Any], float]
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class GaugeValue:
+    total: float
+    max: float
+
+
+@dataclass(frozen=True)
+class ClassMetrics:
+    instances: int
+    operations: Dict[str, int]
+    ops_per_second: float
+    events: Dict[str, int]
+    gauges: Dict[str, GaugeValue]
+
+
+@dataclass
+class _Registration:
+    cls: Type[Any]
+    operations: Sequence[str]
+    events: Mapping[str, Sequence[str]]
+    gauges: Mapping[str, Gauge]
+    calls: Dict[str, int] = field(default_factory=dict)
+    instances: weakref.WeakSet[Any] = field(default_factory=weakref.WeakSet)
+    originals: Dict[str, object] = field(default_factory=dict)
+
+
+class MetricsRegistry:
+    """Counters and gauges for registered containers, patched in only while enabled.
+
+    Classes register the methods to count and the gauges to read. `enable` wraps those methods
+    (and `__init__`, to track live instances); `disable` restores the originals, so a disabled
+    registry costs nothing on hot paths.
+
+    Only instances constructed while enabled are tracked for `instances` and the gauges, so
+    enable the registry before building the containers, or hand earlier ones to `track`.
+    """
+
+    def __init__(self) -> None:
+        self._registrations: Dict[str, _Registration] = {}
+        self._enabled_at: Optional[float] = None
+
+    @property
+    def is_enabled(self) -> bool:
+        return self._enabled_at is not None
+
+    def register(
+        self,
+        cls: Type[Any],
+        operations: Sequence[str] = (),
+        events: Optional[Mapping[str, Sequence[str]]] = None,
+        gauges: Optional[Mapping[str, Gauge]] = None,
+    ) -> None:
+        if cls.__name__ in self._registrations:
+            raise ValueError(f"{cls.__name__} is already registered")
+
+        registration = _Registration(cls, tuple(operations), events or {}, gauges or {})
+        self._registrations[cls.__name__] = registration
+        if self.is_enabled:
+            self._patch(registration)
+
+    def enable(self) -> None:
+        if self.is_enabled:
+            return
+
+        self._enabled_at = time.perf_counter()
+        for registration in self._registrations.values():
+            self._patch(registration)
+
+    def disable(self) -> None:
+        if not self.is_enabled:
+            return
+
+        for registration in self._registrations.values():
+            self._unpatch(registration)
+        self._enabled_at = None
+
+    def track(self, *instances: Any) -> None:
+        """Tracks containers constructed while the registry was disabled."""
+        for instance in instances:
+            registration: Optional[_Registration] = self._registrations.get(type(instance).__name__)
+            if registration is None or type(instance) is not registration.cls:
+                raise ValueError(f"{type(instance).__name__} is not registered")
+            registration.instances.add(instance)
+
+    def reset(self) -> None:
+        for registration in self._registrations.values():
+            for method in registration.calls:
+                registration.calls[method] = 0
+        if self.is_enabled:
+            self._enabled_at = time.perf_counter()
+
+    def snapshot(self) -> Dict[str, ClassMetrics]:
+        elapsed: float = (
+            time.perf_counter() - self._enabled_at if self._enabled_at is not None else 0.0
+        )
+        return {
+            name: self._collect(registration, elapsed)
+            for name, registration in self._registrations.items()
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: asdict(metrics) for name, metrics in self.snapshot().items()}
+
+    def export_json(self, file: TextIO) -> None:
+        json.dump(self.to_dict(), file, ensure_ascii=False, indent=4)
+        file.write("\n")
+
+    def _collect(self, registration: _Registration, elapsed: float) -> ClassMetrics:
+        operations: Dict[str, int] = {
+            name: registration.calls.get(name, 0) for name in registration.operations
+        }
+        instances: List[Any] = list(registration.instances)
+        gauges: Dict[str, GaugeValue] = {}
+        for name, gauge in registration.gauges.items():
+            values: List[float] = [gauge(instance) for instance in instances]
+            gauges[name] = GaugeValue(sum(values), max(values, default=0))
+
+        return ClassMetrics(
+            instances=len(instances),
+            operations=operations,
+            ops_per_second=sum(operations.values()) / elapsed if elapsed > 0 else 0.0,
+            events={
+                name: sum(registration.calls.get(method, 0) for method in methods)
+                for name, methods in registration.events.items()
+            },
+            gauges=gauges,
+        )
+
+    def _patch(self, registration: _Registration) -> None:
+        cls: Type[Any] = registration.cls
+        methods: List[str] = [*registration.operations]
+        methods.extend(method for names in registration.events.values() for method in names)
+
+        for method in dict.fromkeys(methods):
+            registration.calls.setdefault(method, 0)
+            self._replace(
+                registration, method, _counting(getattr(cls, method), registration, method)
+            )
+
+        self._replace(registration, "__init__", _tracking(cls.__init__, registration))
+
+    def _replace(self, registration: _Registration, name: str, function: object) -> None:
+        registration.originals[name] = registration.cls.__dict__.get(name, _MISSING)
+        setattr(registration.cls, name, function)
+
+    def _unpatch(self, registration: _Registration) -> None:
+        for name, original in registration.originals.items():
+            if original is _MISSING:
+                delattr(registration.cls, name)
+            else:
+                setattr(registration.cls, name, original)
+        registration.originals.clear()
+
+
+def _counting(method: Callable[..., Any], registration: _Registration, name: str) -> Any:
+    calls: Dict[str, int] = registration.calls
+
+    @functools.wraps(method)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        calls[name] += 1
+        return method(*args, **kwargs)
+
+    return wrapper
+
+
+def _tracking(init: Callable[..., None], registration: _Registration) -> Any:
+    instances: weakref.WeakSet[Any] = registration.instances
+
+    @functools.wraps(init)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> None:
+        init(self, *args, **kwargs)
+        instances.add(self)
+
+    return wrapper
+
+
+registry = MetricsRegistry()
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import cProfile
+import pstats
+import re
+from pathlib import Path
+from typing import Callable, Dict, List, Set, Tuple
+
+Function = Tuple[str, int, str]
+Edge = Tuple[int, int, float, float]
+
+_MIN_SECONDS = 1e-6
+
+
+def profile_callback(callback: Callable[[], None], iterations: int) -> pstats.Stats:
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        for _ in range(iterations):
+            callback()
+    finally:
+        profiler.disable()
+
+    return pstats.Stats(profiler)
+
+
+def save_profile(stats: pstats.Stats, directory: str, name: str) -> Tuple[str, str]:
+    """Writes `<name>.prof` for pstats/snakeviz and `<name>.collapsed` for flamegraph tools."""
+    path: Path = Path(directory)
+    path.mkdir(parents=True, exist_ok=True)
+    stem: str = re.sub(r"[^\w.-]+", "_", name).strip("_")
+
+    prof: Path = path / f"{stem}.prof"
+    stats.dump_stats(prof)
+
+    collapsed: Path = path / f"{stem}.collapsed"
+    with open(collapsed, "w", encoding="utf-8") as file:
+        for stack, microseconds in sorted(collapse_stats(stats).items()):
+            file.write(f"{stack} {microseconds}\n")
+
+    return str(prof), str(collapsed)
+
+
+def collapse_stats(stats: pstats.Stats) -> Dict[str, int]:
+    """Builds `caller;callee;... microseconds` stacks from the cProfile call graph.
+
+    cProfile keeps only caller-callee edges, so the own time of a function is split between
+    its callers proportionally to the time spent under each of them. Recursive calls are folded
+    into the outermost frame.
+    """
+    raw: Dict[Function, Tuple[int, int, float, float, Dict[Function, Edge]]] = getattr(
+        stats, "stats"
+    )
+    callees: Dict[Function, Dict[Function, float]] = {}
+    for function, (_, _, _, _, callers) in raw.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, {})[function] = edge[3]
+
+    stacks: Dict[str, int] = {}
+    path: List[str] = []
+    visiting: Set[Function] = set()
+
+    def walk(function: Function, share: float) -> None:
+        _, _, total, cumulative, _ = raw[function]
+        path.append(_label(function))
+        visiting.add(function)
+
+        own: int = round(total * share * 1e6)
+        if own > 0:
+            key: str = ";".join(path)
+            stacks[key] = stacks.get(key, 0) + own
+
+        for callee, edge in callees.get(function, {}).items():
+            callee_cumulative: float = raw[callee][3]
+            if callee in visiting or callee_cumulative <= 0:
+                continue
+            if edge * share >= _MIN_SECONDS:
+                walk(callee, share * min(edge / callee_cumulative, 1.0))
+
+        visiting.remove(function)
+        path.pop()
+
+    for function, (_, _, _, _, callers) in raw.items():
+        if not any(caller in raw for caller in callers):
+            walk(function, 1.0)
+
+    return stacks
+
+
+def _label(function: Function) -> str:
+    filename, line, name = function
+    if filename == "~":
+        return name.replace(";", ",")
+    return f"{Path(filename).stem}.{name}:{line}".replace(";", ",")
@@ -0,0 +1,528 @@
+from __future__ import annotations
+
+import argparse
+import io
+import math
+import os
+import pstats
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from random import Random
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from common import fixtures
+from common.benchmark import (
+    Benchmark,
+    BenchmarkCallback,
+    BenchmarkMethod,
+    BenchmarkOptions,
+    BenchmarkSelection,
+    _build_parser,
+    _run,
+    run_in_processes,
+    select_benchmarks,
+    sweep,
+)
+from common.benchmark_results import (
+    BenchmarkComparison,
+    BenchmarkEnvironment,
+    BenchmarkReport,
+    BenchmarkReportSerializer,
+    BenchmarkResult,
+    BenchmarkStats,
+    MemoryUsage,
+    compare_reports,
+)
+from common.complexity import Complexity, ComplexityFit, fit_complexity, geometric_sizes
+from common.extra_typing import override
+from common.fixtures import Fixtures
+from common.instrumentation import OperationCounts, counting_compare, counting_sequence
+from common.profiling import Edge, Function, collapse_stats, profile_callback
+
+
+def _report(*results: BenchmarkResult) -> BenchmarkReport:
+    return BenchmarkReport(BenchmarkEnvironment.current(), [*results])
+
+
+def _result(method: str, samples: Sequence[float], size: Optional[int] = None) -> BenchmarkResult:
+    return BenchmarkResult("SomeBenchmark", method, 10, samples=[*samples], size=size)
+
+
+class _NoopBenchmark(Benchmark):
+    def benchmark_noop(self) -> BenchmarkCallback:
+        def callback() -> None:
+            pass
+
+        return callback, 10
+
+
+class _SortBenchmark(Benchmark):
+    def benchmark_insertion_sort(self) -> BenchmarkCallback:
+        return _NoopBenchmark().benchmark_noop()
+
+    def benchmark_merge_sort(self) -> BenchmarkCallback:
+        return _NoopBenchmark().benchmark_noop()
+
+
+class _SweepBenchmark(Benchmark):
+    @override
+    def setUp(self) -> None:
+        self.n: int = 1
+        self.threads: int = 1
+
+    @sweep((2, 4))
+    def benchmark_sized(self) -> BenchmarkCallback:
+        return _NoopBenchmark().benchmark_noop()
+
+    @sweep((2, 4), attribute="threads", fit=False)
+    def benchmark_threads(self) -> BenchmarkCallback:
+        return _NoopBenchmark().benchmark_noop()
+
+
+class _SizedSetUpBenchmark(Benchmark):
+    n: int = 1
+
+    @override
+    def setUp(self) -> None:
+        self.values: List[int] = [*range(self.n)]
+
+    @sweep((2, 8))
+    def benchmark_sum(self) -> BenchmarkCallback:
+        def callback() -> None:
+            sum(self.values)
+
+        return callback, 1, len(self.values)
+
+
+class _AllocatingBenchmark(Benchmark):
+    SIZE: int = 1 << 20
+
+    @override
+    def setUp(self) -> None:
+        self.buffers: List[bytearray] = []
+
+    def benchmark_allocate(self) -> BenchmarkCallback:
+        def callback() -> None:
+            self.buffers.append(bytearray(self.SIZE))
+
+        return callback, 4
+
+
+class SelectBenchmarksTest(unittest.TestCase):
+    def _select(self, patterns: Sequence[str] = (), regex: Optional[str] = None) -> List[str]:
+        return [
+            f"{benchmark.__name__}.{method.__name__}"
+            for benchmark, methods in select_benchmarks(
+                [_NoopBenchmark, _SortBenchmark], patterns, regex
+            )
+            for method in methods
+        ]
+
+    def test_select_all(self) -> None:
+        self.assertListEqual(
+            self._select(),
+            [
+                "_NoopBenchmark.benchmark_noop",
+                "_SortBenchmark.benchmark_insertion_sort",
+                "_SortBenchmark.benchmark_merge_sort",
+            ],
+        )
+
+    def test_select_by_glob(self) -> None:
+        self.assertListEqual(self._select(["_Noop*"]), ["_NoopBenchmark.benchmark_noop"])
+        self.assertListEqual(
+            self._select(["*merge*", "benchmark_noop"]),
+            ["_NoopBenchmark.benchmark_noop", "_SortBenchmark.benchmark_merge_sort"],
+        )
+        self.assertListEqual(
+            self._select(["_SortBenchmark.benchmark_insertion_sort"]),
+            ["_SortBenchmark.benchmark_insertion_sort"],
+        )
+        self.assertListEqual(self._select(["*quick*"]), [])
+
+    def test_select_by_regex(self) -> None:
+        self.assertListEqual(
+            self._select(regex=r"(insertion|merge)_sort$"),
+            ["_SortBenchmark.benchmark_insertion_sort", "_SortBenchmark.benchmark_merge_sort"],
+        )
+        self.assertListEqual(
+            self._select(["_Sort*"], regex="insertion"), ["_SortBenchmark.benchmark_insertion_sort"]
+        )
+
+
+class BenchmarkStatsTest(unittest.TestCase):
+    def test_from_samples(self) -> None:
+        stats: BenchmarkStats = BenchmarkStats.from_samples([*range(10, 0, -1)])
+        self.assertEqual(stats.min, 1)
+        self.assertEqual(stats.median, 5.5)
+        self.assertEqual(stats.mean, 5.5)
+        self.assertAlmostEqual(stats.p95, 9.55)
+        self.assertAlmostEqual(stats.p99, 9.91)
+        self.assertAlmostEqual(stats.stddev, 3.0276503540974917)
+
+    def test_single_sample(self) -> None:
+        stats: BenchmarkStats = BenchmarkStats.from_samples([2.0])
+        self.assertEqual(stats, BenchmarkStats(2.0, 2.0, 2.0, 2.0, 2.0, 0.0))
+        self.assertRaises(ValueError, BenchmarkStats.from_samples, [])
+
+    def test_per_op(self) -> None:
+        result: BenchmarkResult = _result("a", [1.0, 3.0])
+        self.assertEqual(result.total_time, 4.0)
+        self.assertAlmostEqual(result.per_op.median, 0.2)
+        self.assertAlmostEqual(result.per_op.min, 0.1)
+
+
+class BenchmarkReportTest(unittest.TestCase):
+    @override
+    def setUp(self) -> None:
+        self.directory: tempfile.TemporaryDirectory[str] = tempfile.TemporaryDirectory()
+
+    @override
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_json_round_trip(self) -> None:
+        report: BenchmarkReport = _report(
+            BenchmarkResult(
+                "SomeBenchmark",
+                "insert",
+                100,
+                count_of_elements=1000,
+                samples=[0.5, 0.25],
+                memory=MemoryUsage(1, 2, 3.5, 1.0, 4, 5),
+                operations=OperationCounts(1, 2, 3, 4),
+            ),
+            _result("delete", [0.1], size=10),
+            _result("delete", [0.4], size=20),
+        )
+        filename: str = os.path.join(self.directory.name, "report.json")
+        BenchmarkReportSerializer.save_report_to_file(report, filename)
+        loaded: BenchmarkReport = BenchmarkReportSerializer.load_report_from_file(filename)
+        self.assertEqual(loaded, report)
+        self.assertEqual(loaded.find("SomeBenchmark.delete[n=20]"), report.results[2])
+
+    def test_complexity_only_for_fitted_sweeps(self) -> None:
+        report: BenchmarkReport = _report(
+            _result("insert", [0.1], size=10),
+            _result("insert", [0.2], size=20),
+            BenchmarkResult("SomeBenchmark", "contend", 1, samples=[0.1], size=2, fit=False),
+            BenchmarkResult("SomeBenchmark", "contend", 1, samples=[0.2], size=4, fit=False),
+        )
+        data: Dict[str, Any] = BenchmarkReportSerializer.report_to_dict(report)
+        self.assertListEqual([*data["complexity"]], ["SomeBenchmark.insert"])
+        self.assertFalse(BenchmarkReportSerializer.dict_to_report(data).results[3].fit)
+
+    def test_sweep_size_reaches_set_up(self) -> None:
+        with redirect_stdout(io.StringIO()):
+            results: List[BenchmarkResult] = _SizedSetUpBenchmark.run_benchmarks()
+        self.assertListEqual([result.size for result in results], [2, 8])
+        self.assertListEqual([result.count_of_elements for result in results], [2, 8])
+
+    def test_run_in_processes(self) -> None:
+        selection: BenchmarkSelection = select_benchmarks([_SortBenchmark, _SweepBenchmark])
+        with redirect_stdout(io.StringIO()):
+            results: List[BenchmarkResult] = run_in_processes(selection, BenchmarkOptions(), 2)
+        self.assertListEqual(
+            [result.name for result in results],
+            [
+                "_SortBenchmark.benchmark_insertion_sort",
+                "_SortBenchmark.benchmark_merge_sort",
+                "_SweepBenchmark.benchmark_sized[n=2]",
+                "_SweepBenchmark.benchmark_sized[n=4]",
+                "_SweepBenchmark.benchmark_threads[n=2]",
+                "_SweepBenchmark.benchmark_threads[n=4]",
+            ],
+        )
+        self.assertTrue(
+            all(len(result.samples) == 1 and result.iterations == 10 for result in results)
+        )
+        self.assertListEqual([result.fit for result in results], [True] * 4 + [False] * 2)
+
+    def test_measure_memory(self) -> None:
+        method: BenchmarkMethod = getattr(_AllocatingBenchmark, "benchmark_allocate")
+        memory: MemoryUsage = _AllocatingBenchmark._measure_memory(
+            method, BenchmarkOptions(), None, None
+        )
+        self.assertGreaterEqual(memory.peak_bytes, 4 * _AllocatingBenchmark.SIZE)
+        self.assertGreaterEqual(memory.bytes_per_op, _AllocatingBenchmark.SIZE)
+        self.assertLess(memory.bytes_per_op, 2 * _AllocatingBenchmark.SIZE)
+        self.assertGreaterEqual(memory.blocks_per_op, 1)
+        if memory.rss_bytes is not None and memory.peak_rss_bytes is not None:
+            self.assertGreaterEqual(memory.peak_rss_bytes, memory.rss_bytes)
+
+    def test_sweep_fit_flag_reaches_results(self) -> None:
+        results: List[BenchmarkResult] = []
+        with redirect_stdout(io.StringIO()):
+            for benchmark, methods in select_benchmarks([_SweepBenchmark]):
+                results.extend(benchmark.run_benchmarks(BenchmarkOptions(), methods))
+        self.assertListEqual(
+            [(result.method, result.fit) for result in results],
+            [("benchmark_sized", True)] * 2 + [("benchmark_threads", False)] * 2,
+        )
+
+    def test_csv_has_row_per_result(self) -> None:
+        file: io.StringIO = io.StringIO()
+        BenchmarkReportSerializer.dump_report(
+            _report(_result("a", [1]), _result("b", [2])), file, "csv"
+        )
+        self.assertEqual(len(file.getvalue().splitlines()), 3)
+        with self.assertRaises(ValueError):
+            BenchmarkReportSerializer.dump_report(_report(), file, "xml")
+
+    def test_is_regression_threshold(self) -> None:
+        self.assertFalse(BenchmarkComparison("a", 1.0, 1.1).is_regression(0.1))
+        self.assertTrue(BenchmarkComparison("a", 1.0, 1.1001).is_regression(0.1))
+        self.assertFalse(BenchmarkComparison("a", 1.0, 0.5).is_regression(0.1))
+        self.assertFalse(BenchmarkComparison("a", 1.0, 1.0).is_regression(0.0))
+        self.assertTrue(BenchmarkComparison("a", 0.0, 1.0).is_regression(0.1))
+        self.assertEqual(BenchmarkComparison("a", 0.0, 1.0).ratio, math.inf)
+
+    def test_compare_reports_skips_unmatched(self) -> None:
+        current: BenchmarkReport = _report(_result("kept", [2.0]), _result("added", [1.0]))
+        baseline: BenchmarkReport = _report(_result("kept", [1.0]), _result("removed", [1.0]))
+        comparisons: List[BenchmarkComparison] = compare_reports(current, baseline)
+        self.assertEqual(len(comparisons), 1)
+        self.assertEqual(comparisons[0].name, "SomeBenchmark.kept")
+        self.assertAlmostEqual(comparisons[0].ratio, 2.0)
+        self.assertListEqual(compare_reports(current, _report()), [])
+
+    def _run_against(self, median: float) -> None:
+        baseline: BenchmarkReport = BenchmarkReport(
+            BenchmarkEnvironment.current(),
+            [BenchmarkResult("_NoopBenchmark", "benchmark_noop", 1, samples=[median])],
+        )
+        filename: str = os.path.join(self.directory.name, "baseline.json")
+        BenchmarkReportSerializer.save_report_to_file(baseline, filename)
+        parser: argparse.ArgumentParser = _build_parser("test")
+        with redirect_stdout(io.StringIO()):
+            _run(parser.parse_args(["--no-cache", "-b", filename]), [_NoopBenchmark])
+
+    def test_regression_exit_code(self) -> None:
+        self._run_against(3600.0)
+        with self.assertRaises(SystemExit) as context:
+            self._run_against(1e-15)
+        self.assertEqual(context.exception.code, 1)
+
+
+class CollapseStatsTest(unittest.TestCase):
+    _MAIN: Function = ("/lab/module.py", 1, "main")
+    _HELPER: Function = ("/lab/module.py", 10, "helper")
+    _LEN: Function = ("~", 0, "<built-in method builtins.len>")
+
+    def _stats(
+        self, raw: Dict[Function, Tuple[int, int, float, float, Dict[Function, Edge]]]
+    ) -> pstats.Stats:
+        stats: pstats.Stats = pstats.Stats.__new__(pstats.Stats)
+        setattr(stats, "stats", raw)
+        return stats
+
+    def test_nested_calls(self) -> None:
+        stats: pstats.Stats = self._stats(
+            {
+                self._MAIN: (1, 1, 0.001, 0.004, {}),
+                self._HELPER: (1, 1, 0.002, 0.003, {self._MAIN: (1, 1, 0.002, 0.003)}),
+                self._LEN: (1, 1, 0.001, 0.001, {self._HELPER: (1, 1, 0.001, 0.001)}),
+            }
+        )
+        self.assertDictEqual(
+            collapse_stats(stats),
+            {
+                "module.main:1": 1000,
+                "module.main:1;module.helper:10": 2000,
+                "module.main:1;module.helper:10;<built-in method builtins.len>": 1000,
+            },
+        )
+
+    def test_own_time_split_between_callers(self) -> None:
+        stats: pstats.Stats = self._stats(
+            {
+                self._MAIN: (1, 1, 0.001, 0.006, {}),
+                self._HELPER: (
+                    3,
+                    2,
+                    0.002,
+                    0.004,
+                    {
+                        self._MAIN: (2, 2, 0.002, 0.004),
+                        self._HELPER: (1, 1, 0.001, 0.002),
+                    },
+                ),
+                self._LEN: (
+                    2,
+                    2,
+                    0.003,
+                    0.003,
+                    {
+                        self._MAIN: (1, 1, 0.001, 0.001),
+                        self._HELPER: (1, 1, 0.002, 0.002),
+                    },
+                ),
+            }
+        )
+        self.assertDictEqual(
+            collapse_stats(stats),
+            {
+                "module.main:1": 1000,
+                "module.main:1;<built-in method builtins.len>": 1000,
+                "module.main:1;module.helper:10": 2000,
+                "module.main:1;module.helper:10;<built-in method builtins.len>": 2000,
+            },
+        )
+
+    def test_real_profile(self) -> None:
+        def work() -> None:
+            sorted(range(1000, 0, -1))
+
+        stacks: Dict[str, int] = collapse_stats(profile_callback(work, 200))
+        self.assertTrue(
+            any(stack.endswith("<built-in method builtins.sorted>") for stack in stacks)
+        )
+        self.assertTrue(all(microseconds > 0 for microseconds in stacks.values()))
+
+
+class FixturesTest(unittest.TestCase):
+    @override
+    def setUp(self) -> None:
+        self.directory: tempfile.TemporaryDirectory[str] = tempfile.TemporaryDirectory()
+        fixtures._datasets.clear()
+
+    @override
+    def tearDown(self) -> None:
+        fixtures._datasets.clear()
+        self.directory.cleanup()
+
+    def test_deterministic(self) -> None:
+        first: Fixtures = Fixtures(7, "SomeBenchmark", "method", 10)
+        second: Fixtures = Fixtures(7, "SomeBenchmark", "method", 10)
+        self.assertListEqual(first.integers(20, 0, 100), second.integers(20, 0, 100))
+        self.assertListEqual(first.permutation(20), second.permutation(20))
+        self.assertListEqual(first.pairs(5, 0, 9), second.pairs(5, 0, 9))
+
+        other_key: Fixtures = Fixtures(7, "SomeBenchmark", "method", 20)
+        other_seed: Fixtures = Fixtures(8, "SomeBenchmark", "method", 10)
+        expected: List[int] = Fixtures(7, "SomeBenchmark", "method", 10).integers(20, 0, 10**9)
+        self.assertNotEqual(other_key.integers(20, 0, 10**9), expected)
+        self.assertNotEqual(other_seed.integers(20, 0, 10**9), expected)
+
+    def test_cached_round_trip(self) -> None:
+        calls: List[int] = []
+
+        def factory(random: Random) -> List[int]:
+            calls.append(1)
+            return [random.randrange(1000) for _ in range(10)]
+
+        cache: Fixtures = Fixtures(7, cache_directory=self.directory.name)
+        dataset: List[int] = cache.cached("numbers", factory, 10)
+        self.assertEqual(len(os.listdir(self.directory.name)), 1)
+
+        # A copy is returned, so callers cannot corrupt the memoized dataset
+        dataset.append(-1)
+        self.assertListEqual(cache.cached("numbers", factory, 10), dataset[:-1])
+
+        fixtures._datasets.clear()
+        self.assertListEqual(
+            Fixtures(7, "Other", cache_directory=self.directory.name).cached(
+                "numbers", factory, 10
+            ),
+            dataset[:-1],
+        )
+        self.assertEqual(len(calls), 1)
+
+        self.assertListEqual(Fixtures(7).cached("numbers", factory, 10), dataset[:-1])
+        self.assertNotEqual(Fixtures(7).cached("numbers", factory, 11), dataset[:-1])
+        self.assertEqual(len(calls), 2)
+
+    def test_edges(self) -> None:
+        edges: List[Tuple[int, int, int]] = Fixtures(7).edges(5, 20)
+        self.assertEqual(len({(u, v) for u, v, _ in edges}), 20)
+        self.assertTrue(all(u != v and 1 <= weight <= 100 for u, v, weight in edges))
+        self.assertRaises(ValueError, Fixtures(7).edges, 3, 7)
+
+
+class ComplexityTest(unittest.TestCase):
+    _MODELS: Dict[Complexity, Callable[[int], float]] = {
+        Complexity.CONSTANT: lambda n: 3.0,
+        Complexity.LOGARITHMIC: lambda n: 2 * math.log2(n),
+        Complexity.LINEAR: lambda n: 5.0 * n,
+        Complexity.LINEARITHMIC: lambda n: n * math.log2(n),
+        Complexity.QUADRATIC: lambda n: 0.5 * n * n,
+    }
+
+    def test_fit_exact_series(self) -> None:
+        sizes: List[int] = geometric_sizes(10, 100000, 6)
+        for complexity, model in self._MODELS.items():
+            fits: List[ComplexityFit] = fit_complexity(sizes, [model(n) for n in sizes])
+            self.assertEqual(fits[0].complexity, complexity)
+            self.assertAlmostEqual(fits[0].error, 0.0)
+            self.assertEqual(len(fits), len(Complexity))
+
+    def test_fit_noisy_series(self) -> None:
+        random: Random = Random(1)
+        sizes: List[int] = geometric_sizes(100, 1000000, 8)
+        for complexity, model in self._MODELS.items():
+            timings: List[float] = [model(n) * random.uniform(0.85, 1.15) for n in sizes]
+            fits: List[ComplexityFit] = fit_complexity(sizes, timings)
+            self.assertEqual(fits[0].complexity, complexity)
+            self.assertLess(fits[0].error, 0.15)
+
+    def test_fit_invalid_input(self) -> None:
+        self.assertRaises(ValueError, fit_complexity, [10, 20], [1.0])
+        self.assertRaises(ValueError, fit_complexity, [10], [1.0])
+        self.assertRaises(ValueError, fit_complexity, [1, 10], [1.0, 2.0])
+        self.assertRaises(ValueError, fit_complexity, [10, 20], [0.0, 1.0])
+
+    def test_geometric_sizes(self) -> None:
+        self.assertListEqual(geometric_sizes(10, 10000, 4), [10, 100, 1000, 10000])
+        self.assertListEqual(geometric_sizes(5, 100, 1), [5])
+        self.assertListEqual(geometric_sizes(1, 2, 5), [1, 2])
+        self.assertRaises(ValueError, geometric_sizes, 0, 10, 2)
+        self.assertRaises(ValueError, geometric_sizes, 10, 5, 2)
+
+
+class InstrumentationTest(unittest.TestCase):
+    def test_counting_compare(self) -> None:
+        def less(a: int, b: int) -> bool:
+            return a < b
+
+        self.assertIs(counting_compare(less, None), less)
+
+        counts: OperationCounts = OperationCounts()
+        compare: Callable[[int, int], bool] = counting_compare(less, counts)
+        self.assertTrue(compare(1, 2))
+        self.assertFalse(compare(2, 1))
+        self.assertEqual(counts, OperationCounts(comparisons=2))
+
+        counts.reset()
+        self.assertFalse(counts)
+
+    def test_counting_sequence(self) -> None:
+        values: List[int] = [3, 1, 2]
+        self.assertIs(counting_sequence(values, None), values)
+
+        counts: OperationCounts = OperationCounts()
+        sequence: List[int] = counting_sequence(values, counts)
+        self.assertEqual(len(sequence), 3)
+        self.assertEqual(counts, OperationCounts())
+
+        self.assertEqual(sequence[0], 3)
+        self.assertEqual(sequence[-1], 2)
+        self.assertEqual(counts, OperationCounts(reads=2))
+
+        sequence[0] = 4
+        self.assertListEqual(values, [4, 1, 2])
+        self.assertEqual(counts, OperationCounts(reads=2, writes=1))
+
+        # Slices are copies that keep counting into the same counters
+        head: List[int] = sequence[:2]
+        self.assertEqual(counts, OperationCounts(reads=2, writes=3))
+        self.assertEqual(head[1], 1)
+        self.assertEqual(counts, OperationCounts(reads=3, writes=3))
+
+        sequence[1:] = [5, 6]
+        self.assertListEqual(values, [4, 5, 6])
+        self.assertEqual(counts, OperationCounts(reads=3, writes=5))
+
+        sequence.insert(0, 7)
+        self.assertListEqual(values, [7, 4, 5, 6])
+        self.assertEqual(counts, OperationCounts(reads=3, writes=6))
@@ -1,15 +1,29 @@
 from __future__ import annotations
 
-from random import randint, sample
-from typing import Any, List
+import io
+import os
+import tempfile
+from dataclasses import dataclass
+from random import Random
+from threading import Lock, Thread
+from typing import Any, Callable, Dict, List, Optional
 
 from common import benchmark
-from common.benchmark import Benchmark, BenchmarkCallback
+from common.benchmark import Benchmark, BenchmarkCallback, sweep
+from common.complexity import geometric_sizes
 from common.extra_typing import override
-from lab2.linked_list.doubly_linked_list import DoublyLinkedList
+from lab2.braces import find_unbalanced_brace, find_unbalanced_brace_in_file
+from lab2.linked_list.array_deque_list import ArrayDequeList
+from lab2.linked_list.doubly_linked_list import DoubleNode, DoublyLinkedList
+from lab2.linked_list.indexed_doubly_linked_list import IndexedDoublyLinkedList
 from lab2.linked_list.linked_list import ILinkedList
+from lab2.linked_list.skip_list import SkipList
+from lab2.linked_list.unrolled_linked_list import UnrolledLinkedList
+from lab2.main import is_valid_braces_sequence
+from lab2.stack.array_stack import ArrayStack
+from lab2.stack.concurrent_stack import ConcurrentStack
 from lab2.stack.stack import IStack
-from lab2.stack.stack_linked_list import StackLinkedList
+from lab2.stack.stack_linked_list import SingleNode, StackLinkedList
 
 
 class LinkedListBenchmark(Benchmark):
@@ -24,13 +38,70 @@ class LinkedListBenchmark(Benchmark):
     def benchmark_add_in_tail(self) -> BenchmarkCallback:
         return (lambda: self.linked_list.add_in_tail(1), self.n)
 
+    @sweep(geometric_sizes(1_000, 100_000, 3))
+    def benchmark_get_item(self) -> BenchmarkCallback:
+        iterations: int = 100
+
+        self.linked_list.extend(range(self.n))
+
+        indexes: List[int] = self.fixtures.integers(iterations, 0, self.n - 1)
+        index: int = 0
+
+        def get_item() -> None:
+            nonlocal index
+            self.linked_list[indexes[index]]
+            index += 1
+
+        return (get_item, iterations)
+
+    def benchmark_sequential_get_item(self) -> BenchmarkCallback:
+        self.linked_list.extend(range(self.n))
+        index: int = 0
+
+        def get_item() -> None:
+            nonlocal index
+            self.linked_list[index]
+            index += 1
+
+        return (get_item, self.n)
+
+    def benchmark_iterate(self) -> BenchmarkCallback:
+        self.linked_list.extend(range(self.n))
+
+        def iterate() -> None:
+            for _ in self.linked_list:
+                pass
+
+        return (iterate, 10, self.n)
+
+    def benchmark_to_list(self) -> BenchmarkCallback:
+        self.linked_list.extend(range(self.n))
+
+        def to_list() -> None:
+            self.linked_list.to_list()
+
+        return (to_list, 10, self.n)
+
+    def benchmark_insert(self) -> BenchmarkCallback:
+        self.n = 10000
+
+        indexes: List[int] = [self.fixtures.random.randint(0, i) for i in range(self.n)]
+        index: int = 0
+
+        def insert() -> None:
+            nonlocal index
+            self.linked_list.insert(indexes[index], index)
+            index += 1
+
+        return (insert, self.n)
+
     def benchmark_remove(self) -> BenchmarkCallback:
         self.n = 10000
 
         for i in range(self.n):
             self.linked_list.add(i)
 
-        shuffled: List[int] = sample(range(self.n), self.n)
+        shuffled: List[int] = self.fixtures.permutation(self.n)
         index: int = 0
 
         def remove() -> None:
@@ -41,19 +112,73 @@ class LinkedListBenchmark(Benchmark):
 
         return (remove, self.n)
 
+    def benchmark_remove_if(self) -> BenchmarkCallback:
+        self.linked_list.extend(range(self.n))
+
+        def remove_if() -> None:
+            self.linked_list.remove_if(lambda value: value % 2 == 0)
+
+        return (remove_if, 1, self.n)
+
     def benchmark_remove_at(self) -> BenchmarkCallback:
         self.n = 10000
 
         for i in range(self.n):
             self.linked_list.add(i)
 
+        indexes: List[int] = [self.fixtures.random.randint(0, i - 1) for i in range(self.n, 0, -1)]
+        index: int = 0
+
         def remove_at() -> None:
-            index_to_remove: int = randint(0, len(self.linked_list) - 1)
-            self.linked_list.remove_at(index_to_remove)
+            nonlocal index
+            self.linked_list.remove_at(indexes[index])
+            index += 1
 
         return (remove_at, self.n)
 
 
+class IndexedDoublyLinkedListBenchmark(LinkedListBenchmark):
+    @override
+    def setUp(self) -> None:
+        super().setUp()
+        self.linked_list = IndexedDoublyLinkedList()
+
+    def benchmark_move_to_front(self) -> BenchmarkCallback:
+        linked_list: IndexedDoublyLinkedList[int] = IndexedDoublyLinkedList.from_iterable(
+            range(self.n)
+        )
+        values: List[int] = self.fixtures.integers(self.n, 0, self.n - 1)
+        index: int = 0
+
+        def move_to_front() -> None:
+            nonlocal index
+            linked_list.move_to_front(values[index])
+            index += 1
+
+        return (move_to_front, self.n)
+
+
+class ArrayDequeListBenchmark(LinkedListBenchmark):
+    @override
+    def setUp(self) -> None:
+        super().setUp()
+        self.linked_list = ArrayDequeList()
+
+
+class UnrolledLinkedListBenchmark(LinkedListBenchmark):
+    @override
+    def setUp(self) -> None:
+        super().setUp()
+        self.linked_list = UnrolledLinkedList()
+
+
+class SkipListBenchmark(LinkedListBenchmark):
+    @override
+    def setUp(self) -> None:
+        super().setUp()
+        self.linked_list = SkipList(seed=self.fixtures.random.getrandbits(32))
+
+
 class StackBenchmark(Benchmark):
     @override
     def setUp(self) -> None:
@@ -73,5 +198,170 @@ class StackBenchmark(Benchmark):
         return (pop, self.n)
 
 
+class ArrayStackBenchmark(StackBenchmark):
+    @override
+    def setUp(self) -> None:
+        super().setUp()
+        self.stack = ArrayStack()
+
+    def benchmark_push_many(self) -> BenchmarkCallback:
+        stack: ArrayStack[int] = ArrayStack()
+        batch: List[int] = list(range(100))
+        return (lambda: stack.push_many(batch), self.n // 100, self.n)
+
+    def benchmark_pop_many(self) -> BenchmarkCallback:
+        stack: ArrayStack[int] = ArrayStack()
+        stack.push_many(range(self.n))
+
+        def pop_many() -> None:
+            stack.pop_many(100)
+
+        return (pop_many, self.n // 100, self.n)
+
+
+class BracesBenchmark(Benchmark):
+    @override
+    def setUp(self) -> None:
+        self.n = 1_000_000
+        self.directory: Optional[tempfile.TemporaryDirectory[str]] = None
+
+    @override
+    def tearDown(self) -> None:
+        if self.directory is not None:
+            self.directory.cleanup()
+
+    def _sequence(self, depth: int) -> str:
+        random: Random = self.fixtures.random
+        opening: List[str] = random.choices("([{", k=self.n // 2)
+        closing: Dict[str, str] = {"(": ")", "[": "]", "{": "}"}
+        braces: List[str] = []
+        for start in range(0, len(opening), depth):
+            group: List[str] = opening[start : start + depth]
+            braces.extend(group)
+            braces.extend(closing[brace] for brace in reversed(group))
+        return "".join(braces)
+
+    def benchmark_nested(self) -> BenchmarkCallback:
+        braces: str = self._sequence(1000)
+
+        def validate() -> None:
+            is_valid_braces_sequence(braces)
+
+        return (validate, 1, self.n)
+
+    def benchmark_flat(self) -> BenchmarkCallback:
+        braces: str = self._sequence(1)
+
+        def validate() -> None:
+            is_valid_braces_sequence(braces)
+
+        return (validate, 1, self.n)
+
+    def benchmark_stream_nested(self) -> BenchmarkCallback:
+        braces: str = self._sequence(1000)
+
+        def validate() -> None:
+            find_unbalanced_brace(io.StringIO(braces), chunk_size=1 << 16)
+
+        return (validate, 1, self.n)
+
+    def benchmark_parallel_nested(self) -> BenchmarkCallback:
+        self.n *= 8
+        self.directory = tempfile.TemporaryDirectory()
+        path: str = os.path.join(self.directory.name, "braces.txt")
+        with open(path, "w", encoding="ascii") as file:
+            file.write(self._sequence(1000))
+
+        def validate() -> None:
+            find_unbalanced_brace_in_file(path, jobs=4)
+
+        return (validate, 1, self.n)
+
+
+class ConcurrentStackBenchmark(Benchmark):
+    """Every thread pushes and pops `n` values on one shared stack."""
+
+    @override
+    def setUp(self) -> None:
+        self.n = 10000
+        self.threads = 1
+
+    def _contend(self, push: Callable[[int], None], pop: Callable[[], Any]) -> BenchmarkCallback:
+        def work() -> None:
+            for i in range(self.n):
+                push(i)
+                pop()
+
+        def contend() -> None:
+            threads: List[Thread] = [Thread(target=work) for _ in range(self.threads)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        return (contend, 1, self.n * self.threads)
+
+    @sweep((2, 4, 8, 16), attribute="threads", fit=False)
+    def benchmark_concurrent_stack(self) -> BenchmarkCallback:
+        stack: ConcurrentStack[int] = ConcurrentStack()
+        return self._contend(stack.push, stack.pop)
+
+    @sweep((2, 4, 8, 16), attribute="threads", fit=False)
+    def benchmark_locked_stack_linked_list(self) -> BenchmarkCallback:
+        stack: StackLinkedList[int] = StackLinkedList()
+        lock: Lock = Lock()
+
+        def push(value: int) -> None:
+            with lock:
+                stack.push(value)
+
+        def pop() -> None:
+            with lock:
+                stack.pop()
+
+        return self._contend(push, pop)
+
+
+@dataclass
+class _DictDoubleNode:
+    """DoubleNode as it was before slots, kept as the reference for the allocation benchmark."""
+
+    value: Any
+    next: Optional[_DictDoubleNode] = None
+    prev: Optional[_DictDoubleNode] = None
+
+
+@dataclass
+class _DictSingleNode:
+    """SingleNode as it was before slots, kept as the reference for the allocation benchmark."""
+
+    value: Any
+    next: Optional[_DictSingleNode] = None
+
+
+class NodeAllocationBenchmark(Benchmark):
+    """Keeps every node alive, so `--memory` reports the size and block count of a node.
+
+    The `dict_` variants allocate the same nodes with a per-instance `__dict__`, for comparison.
+    """
+
+    @override
+    def setUp(self) -> None:
+        self.nodes: List[Any] = []
+        self.n = 100000
+
+    def benchmark_double_node(self) -> BenchmarkCallback:
+        return (lambda: self.nodes.append(DoubleNode(1)), self.n)
+
+    def benchmark_single_node(self) -> BenchmarkCallback:
+        return (lambda: self.nodes.append(SingleNode(1)), self.n)
+
+    def benchmark_dict_double_node(self) -> BenchmarkCallback:
+        return (lambda: self.nodes.append(_DictDoubleNode(1)), self.n)
+
+    def benchmark_dict_single_node(self) -> BenchmarkCallback:
+        return (lambda: self.nodes.append(_DictSingleNode(1)), self.n)
+
+
 if __name__ == "__main__":
     benchmark.main()
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import re
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing.context import BaseContext
+from typing import IO, Callable, Dict, Final, Iterable, List, Optional, Tuple, Union
+
+DEFAULT_CHUNK_SIZE: Final[int] = 1 << 20
+
+_BRACE_RUNS: Final[re.Pattern[str]] = re.compile(r"[([{]+|[)\]}]+")
+_OPENING_BRACES: Final[Dict[int, int]] = str.maketrans(")}]", "({[")
+
+
+@dataclass
+class BraceSummary:
+    """What a stretch of input leaves unmatched: closing braces it could not match itself, then
+    opening braces still waiting for a match, each with its offset; or the offset of an error."""
+
+    closing: List[Tuple[int, str]] = field(default_factory=list)
+    opening: List[str] = field(default_factory=list)
+    offsets: List[int] = field(default_factory=list)
+    error: Optional[int] = None
+
+    def offence(self) -> Optional[int]:
+        """Offset of the error, else of the first unmatched brace; None if everything matched."""
+        if self.error is not None:
+            return self.error
+        if self.closing:
+            return self.closing[0][0]
+        if self.offsets:
+            return self.offsets[0]
+        return None
+
+
+class BraceScanner:
+    """Incremental bracket matcher; characters other than `()[]{}` are skipped.
+
+    Only unmatched opening braces are kept, so memory grows with the nesting depth rather than
+    with the input. With `defer_closing`, closing braces that find the stack empty are collected
+    for an earlier stretch of input to match, which is what the parallel mode needs.
+    """
+
+    def __init__(self, offset: int = 0, defer_closing: bool = False) -> None:
+        self._offset: int = offset
+        self._defer_closing: Final[bool] = defer_closing
+        self.summary: Final[BraceSummary] = BraceSummary()
+
+    def feed(self, chunk: str) -> bool:
+        """Scans the next chunk and returns False once an error has been found."""
+        summary: Final[BraceSummary] = self.summary
+        if summary.error is not None:
+            return False
+
+        opening: Final[List[str]] = summary.opening
+        offsets: Final[List[int]] = summary.offsets
+        for run in _BRACE_RUNS.finditer(chunk):
+            braces: str = run.group()
+            start: int = self._offset + run.start()
+            if braces[0] in "([{":
+                opening.extend(braces)
+                offsets.extend(range(start, start + len(braces)))
+                continue
+
+            # The run must close the top of the stack, innermost first
+            expected: str = braces.translate(_OPENING_BRACES)
+            matched: int = min(len(braces), len(opening))
+            if matched and "".join(opening[-matched:])[::-1] != expected[:matched]:
+                summary.error = start + _first_mismatch(opening, expected)
+                return False
+            del opening[len(opening) - matched :]
+            del offsets[len(offsets) - matched :]
+
+            if matched < len(braces):
+                if not self._defer_closing:
+                    summary.error = start + matched
+                    return False
+                summary.closing.extend(
+                    (start + i, expected[i]) for i in range(matched, len(braces))
+                )
+
+        self._offset += len(chunk)
+        return True
+
+
+def _first_mismatch(opening: List[str], expected: str) -> int:
+    i: int = 0
+    while opening[-1 - i] == expected[i]:
+        i += 1
+    return i
+
+
+def find_unbalanced_brace(
+    source: Union[IO[str], Iterable[str]], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Optional[int]:
+    """Returns None if the brackets in `source` are balanced, or the offset of the first offence.
+
+    That is the first closing brace without a matching opening one or, if the input ends with
+    unclosed braces, the outermost of those. `source` is a text file, read `chunk_size` characters
+    at a time, or any iterable of string chunks.
+    """
+    scanner: Final[BraceScanner] = BraceScanner()
+    for chunk in _read_chunks(source, chunk_size):
+        if not scanner.feed(chunk):
+            break
+    return scanner.summary.offence()
+
+
+def find_unbalanced_brace_in_file(
+    path: Union[str, os.PathLike[str]],
+    jobs: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Optional[int]:
+    """Parallel `find_unbalanced_brace` over a file split into one byte range per job.
+
+    Every job summarizes its range and the summaries are combined in order, so the result is the
+    same as a sequential scan. Offsets are in bytes: the file is read as Latin-1, which keeps the
+    ASCII braces intact in any ASCII-compatible encoding such as UTF-8.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    size: Final[int] = os.path.getsize(path)
+    if size == 0:
+        return None
+
+    step: Final[int] = -(-size // jobs)
+    combined: Final[BraceSummary] = BraceSummary()
+    context: BaseContext = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(jobs, mp_context=context) as executor:
+        futures: List[Future[BraceSummary]] = [
+            executor.submit(
+                _summarize_range, os.fspath(path), start, min(start + step, size), chunk_size
+            )
+            for start in range(0, size, step)
+        ]
+        for future in futures:
+            combine_summaries(combined, future.result())
+            if combined.error is not None:
+                executor.shutdown(cancel_futures=True)
+                break
+
+    return combined.offence()
+
+
+def combine_summaries(left: BraceSummary, right: BraceSummary) -> None:
+    """Appends the summary of the following stretch of input to `left`, in place."""
+    if left.error is not None:
+        return
+
+    for offset, brace in right.closing:
+        if not left.opening or left.opening[-1] != brace:
+            left.error = offset
+            return
+        left.opening.pop()
+        left.offsets.pop()
+
+    left.opening.extend(right.opening)
+    left.offsets.extend(right.offsets)
+    left.error = right.error
+
+
+def _summarize_range(path: str, start: int, stop: int, chunk_size: int) -> BraceSummary:
+    scanner: Final[BraceScanner] = BraceScanner(start, defer_closing=True)
+    with open(path, "rb") as file:
+        file.seek(start)
+        remaining: int = stop - start
+        while remaining > 0:
+            chunk: bytes = file.read(min(chunk_size, remaining))
+            if not chunk or not scanner.feed(chunk.decode("latin-1")):
+                break
+            remaining -= len(chunk)
+    return scanner.summary
+
+
+def _read_chunks(source: Union[IO[str], Iterable[str]], chunk_size: int) -> Iterable[str]:
+    if isinstance(source, str):
+        return (source,)
+    read: Optional[Callable[[int], str]] = getattr(source, "read", None)
+    if read is not None:
+        return iter(lambda: read(chunk_size), "")
+    return source
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+from typing import Final, Generic, Iterable, Iterator, List, Optional, cast
+
+from common.extra_typing import override
+from lab2.linked_list.linked_list import ILinkedList, T
+
+
+class ArrayDequeList(ILinkedList[T], Generic[T]):
+    """ILinkedList over a growable ring buffer: O(1) amortized ends and O(1) indexing."""
+
+    _INITIAL_CAPACITY: Final[int] = 8
+
+    def __init__(self) -> None:
+        self._buffer: List[Optional[T]] = [None] * self._INITIAL_CAPACITY
+        self._head: int = 0
+        self._length: int = 0
+
+    def _physical(self, index: int) -> int:
+        return (self._head + index) % len(self._buffer)
+
+    def _check_index(self, index: int) -> None:
+        if index < 0 or index >= self._length:
+            raise IndexError("Index out of range")
+
+    def _grow_if_full(self) -> None:
+        if self._length == len(self._buffer):
+            self._reserve(2 * len(self._buffer))
+
+    def _reserve(self, capacity: int) -> None:
+        if capacity <= len(self._buffer):
+            return
+
+        buffer: List[Optional[T]] = self._values()
+        buffer.extend([None] * (capacity - self._length))
+        self._buffer = buffer
+        self._head = 0
+
+    def _values(self) -> List[Optional[T]]:
+        end: int = self._head + self._length
+        if end <= len(self._buffer):
+            return self._buffer[self._head : end]
+        return self._buffer[self._head :] + self._buffer[: end - len(self._buffer)]
+
+    # Create
+    @override
+    def add(self, value: T) -> None:
+        self.add_in_tail(value)
+
+    @override
+    def add_in_head(self, value: T) -> None:
+        self._grow_if_full()
+        self._head = (self._head - 1) % len(self._buffer)
+        self._buffer[self._head] = value
+        self._length += 1
+
+    @override
+    def add_in_tail(self, value: T) -> None:
+        self._grow_if_full()
+        self._buffer[self._physical(self._length)] = value
+        self._length += 1
+
+    @override
+    def insert(self, index: int, value: T) -> None:
+        if index < 0 or index > self._length:
+            raise IndexError("Index out of range")
+
+        if index < self._length // 2:
+            self.add_in_head(value)
+            for i in range(index):
+                self._buffer[self._physical(i)] = self._buffer[self._physical(i + 1)]
+        else:
+            self.add_in_tail(value)
+            for i in range(self._length - 1, index, -1):
+                self._buffer[self._physical(i)] = self._buffer[self._physical(i - 1)]
+
+        self._buffer[self._physical(index)] = value
+
+    @override
+    def extend(self, values: Iterable[T]) -> None:
+        new_values: List[T] = list(values)
+        capacity: int = len(self._buffer)
+        while capacity < self._length + len(new_values):
+            capacity *= 2
+        self._reserve(capacity)
+
+        for value in new_values:
+            self._buffer[self._physical(self._length)] = value
+            self._length += 1
+
+    # Read
+    @override
+    def element_at(self, index: int) -> T:
+        self._check_index(index)
+        return cast(T, self._buffer[self._physical(index)])
+
+    @override
+    def element_at_or_none(self, index: int) -> Optional[T]:
+        try:
+            return self.element_at(index)
+        except IndexError:
+            return None
+
+    @override
+    def __getitem__(self, index: int) -> T:
+        return self.element_at(index)
+
+    @override
+    def contains(self, value: T) -> bool:
+        return self.index_of(value) != -1
+
+    @override
+    def __contains__(self, value: T) -> bool:
+        return self.contains(value)
+
+    def index_of(self, value: T) -> int:
+        for i in range(self._length):
+            if self._buffer[self._physical(i)] == value:
+                return i
+        return -1
+
+    # Update
+    @override
+    def update(self, index: int, value: T) -> None:
+        self._check_index(index)
+        self._buffer[self._physical(index)] = value
+
+    @override
+    def __setitem__(self, index: int, value: T) -> None:
+        self.update(index, value)
+
+    @override
+    def clear(self) -> None:
+        self._buffer = [None] * self._INITIAL_CAPACITY
+        self._head = 0
+        self._length = 0
+
+    # Delete
+    @override
+    def remove(self, value: T) -> bool:
+        index: Final[int] = self.index_of(value)
+        if index == -1:
+            return False
+
+        self.remove_at(index)
+        return True
+
+    @override
+    def remove_at(self, index: int) -> None:
+        self._check_index(index)
+
+        if index < self._length // 2:
+            for i in range(index, 0, -1):
+                self._buffer[self._physical(i)] = self._buffer[self._physical(i - 1)]
+            self._buffer[self._head] = None
+            self._head = self._physical(1)
+        else:
+            for i in range(index, self._length - 1):
+                self._buffer[self._physical(i)] = self._buffer[self._physical(i + 1)]
+            self._buffer[self._physical(self._length - 1)] = None
+
+        self._length -= 1
+
+    @override
+    def __delitem__(self, index: int) -> None:
+        return self.remove_at(index)
+
+    # Utility
+    @override
+    def is_empty(self) -> bool:
+        return self._length == 0
+
+    @override
+    def __bool__(self) -> bool:
+        return not self.is_empty()
+
+    @override
+    def __len__(self) -> int:
+        return self._length
+
+    @override
+    def __str__(self) -> str:
+        return "[" + " -> ".join(str(value) for value in self) + "]"
+
+    @override
+    def to_list(self) -> List[T]:
+        return cast(List[T], self._values())
+
+    # Iteration
+    @override
+    def __iter__(self) -> Iterator[T]:
+        buffer: List[T] = cast(List[T], self._buffer)
+        head: int = self._head
+        capacity: int = len(buffer)
+
+        for i in range(self._length):
+            yield buffer[(head + i) % capacity]
+
+    @override
+    def __reversed__(self) -> Iterator[T]:
+        for i in range(self._length - 1, -1, -1):
+            yield cast(T, self._buffer[self._physical(i)])
+
+    @override
+    def reverse(self) -> None:
+        left, right = 0, self._length - 1
+        while left < right:
+            physical_left, physical_right = self._physical(left), self._physical(right)
+            self._buffer[physical_left], self._buffer[physical_right] = (
+                self._buffer[physical_right],
+                self._buffer[physical_left],
+            )
+            left += 1
+            right -= 1
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from typing import Generic, Iterable, Optional
+
+from common.extra_typing import Self, override
+from common.instrumentation import OperationCounts
+from lab2.linked_list.doubly_linked_list import DoubleNode, DoublyLinkedList
+from lab2.linked_list.linked_list import T
+
+
+class CountingNode(DoubleNode[T], Generic[T]):
+    """Node counting `value` reads/writes and `next`/`prev` hops, for benchmark instrumentation."""
+
+    def __init__(self, value: T, counts: OperationCounts) -> None:
+        self._value: T = value
+        self._next: Optional[DoubleNode[T]] = None
+        self._prev: Optional[DoubleNode[T]] = None
+        self.counts: OperationCounts = counts
+
+    @property
+    def value(self) -> T:
+        self.counts.reads += 1
+        return self._value
+
+    @value.setter
+    def value(self, value: T) -> None:
+        self.counts.writes += 1
+        self._value = value
+
+    @property
+    def next(self) -> Optional[DoubleNode[T]]:
+        self.counts.node_hops += 1
+        return self._next
+
+    @next.setter
+    def next(self, node: Optional[DoubleNode[T]]) -> None:
+        self._next = node
+
+    @property
+    def prev(self) -> Optional[DoubleNode[T]]:
+        self.counts.node_hops += 1
+        return self._prev
+
+    @prev.setter
+    def prev(self, node: Optional[DoubleNode[T]]) -> None:
+        self._prev = node
+
+
+class CountingDoublyLinkedList(DoublyLinkedList[T], Generic[T]):
+    """DoublyLinkedList whose nodes count operations, so node-based algorithms can be measured."""
+
+    def __init__(self, counts: Optional[OperationCounts] = None, values: Iterable[T] = ()) -> None:
+        super().__init__()
+        self.counts: OperationCounts = counts if counts is not None else OperationCounts()
+        for value in values:
+            self.add_in_tail(value)
+
+    @override
+    def _create_node(self, value: T) -> CountingNode[T]:
+        self.counts.writes += 1
+        return CountingNode(value, self.counts)
+
+    @override
+    def _empty_like(self) -> Self:
+        return type(self)(self.counts)
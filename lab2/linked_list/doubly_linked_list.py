@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Final, Generic, Iterator, Optional
+from typing import Any, Callable, Final, Generic, Iterable, Iterator, List, Optional, Tuple
 
-from common.extra_typing import override
+from common.comparable import default_compare
+from common.extra_typing import Self, override
 from lab2.linked_list.linked_list import ILinkedList, T
 
 
-@dataclass
+@dataclass(slots=True)
 class DoubleNode(Generic[T]):
     value: T
     next: Optional[DoubleNode[T]] = None
@@ -18,8 +19,13 @@ class DoublyLinkedList(ILinkedList[T], Generic[T]):
     def __init__(self) -> None:
         self._head: Optional[DoubleNode[T]] = None
         self._tail: Optional[DoubleNode[T]] = None
-        self._current: Optional[DoubleNode[T]] = None
         self._length: int = 0
+        # Last node reached by index, so that near-sequential access walks from it
+        self._finger: Optional[DoubleNode[T]] = None
+        self._finger_index: int = 0
+
+    def _create_node(self, value: T) -> DoubleNode[T]:
+        return DoubleNode(value)
 
     # Create
     @override
@@ -28,7 +34,7 @@ class DoublyLinkedList(ILinkedList[T], Generic[T]):
 
     @override
     def add_in_head(self, value: T) -> None:
-        node: Final[DoubleNode[T]] = DoubleNode(value)
+        node: Final[DoubleNode[T]] = self._create_node(value)
         if self._head is None:
             self._head = node
             self._tail = node
@@ -37,10 +43,11 @@ class DoublyLinkedList(ILinkedList[T], Generic[T]):
             self._head.prev = node
             self._head = node
         self._length += 1
+        self._finger_index += 1
 
     @override
     def add_in_tail(self, value: T) -> None:
-        node: Final[DoubleNode[T]] = DoubleNode(value)
+        node: Final[DoubleNode[T]] = self._create_node(value)
         if self._tail is None:
             self._head = node
             self._tail = node
@@ -58,13 +65,48 @@ class DoublyLinkedList(ILinkedList[T], Generic[T]):
             self.add_in_tail(value)
         else:
             current: Final[DoubleNode[T]] = self._efficient_get_node_by_index(index)
-            node: Final[DoubleNode[T]] = DoubleNode(value)
+            node: Final[DoubleNode[T]] = self._create_node(value)
             node.prev = current.prev
             node.next = current
             assert current.prev is not None
             current.prev.next = node
             current.prev = node
             self._length += 1
+            self._finger = node
+
+    @override
+    def extend(self, values: Iterable[T]) -> None:
+        tail: Optional[DoubleNode[T]] = self._tail
+        count: int = 0
+
+        for value in list(values) if values is self else values:
+            node: DoubleNode[T] = self._create_node(value)
+            node.prev = tail
+            if tail is None:
+                self._head = node
+            else:
+                tail.next = node
+            tail = node
+            count += 1
+
+        self._tail = tail
+        self._length += count
+
+    def splice(self, other: DoublyLinkedList[T]) -> None:
+        """Moves all nodes of `other` to the tail of this list in O(1), leaving `other` empty."""
+        if other is self:
+            raise ValueError("Cannot splice a list into itself")
+        if other._head is None:
+            return
+
+        if self._tail is None:
+            self._head = other._head
+        else:
+            self._tail.next = other._head
+            other._head.prev = self._tail
+        self._tail = other._tail
+        self._length += other._length
+        other.clear()
 
     # Read
     def _efficient_get_node_by_index(self, index: int) -> DoubleNode[T]:
@@ -72,18 +114,26 @@ class DoublyLinkedList(ILinkedList[T], Generic[T]):
             raise IndexError("Index out of range")
 
         current: Optional[DoubleNode[T]] = None
+        steps: int = 0
         if index < self._length // 2:
-            current = self._head
-            for _ in range(index):
-                assert current is not None
-                current = current.next
+            current, steps = self._head, index
         else:
-            current = self._tail
-            for _ in range(self._length - 1, index, -1):
-                assert current is not None
-                current = current.prev
+            current, steps = self._tail, index - self._length + 1
+
+        if self._finger is not None and abs(index - self._finger_index) < abs(steps):
+            current, steps = self._finger, index - self._finger_index
+
+        while steps > 0:
+            assert current is not None
+            current = current.next
+            steps -= 1
+        while steps < 0:
+            assert current is not None
+            current = current.prev
+            steps += 1
 
         assert current is not None
+        self._finger, self._finger_index = current, index
         return current
 
     def _get_node_by_predicate(
@@ -111,6 +161,22 @@ class DoublyLinkedList(ILinkedList[T], Generic[T]):
     def __getitem__(self, index: int) -> T:
         return self.element_at(index)
 
+    @override
+    def slice(self, start: int, stop: int) -> Self:
+        start, stop, _ = slice(start, stop).indices(self._length)
+        copy: Self = self._empty_like()
+        if start >= stop:
+            return copy
+
+        current: Optional[DoubleNode[T]] = self._efficient_get_node_by_index(start)
+        values: List[T] = []
+        for _ in range(stop - start):
+            assert current is not None
+            values.append(current.value)
+            current = current.next
+        copy.extend(values)
+        return copy
+
     @override
     def contains(self, value: T) -> bool:
         for element in self:
@@ -135,8 +201,8 @@ class DoublyLinkedList(ILinkedList[T], Generic[T]):
     def clear(self) -> None:
         self._head = None
         self._tail = None
-        self._current = None
         self._length = 0
+        self._finger = None
 
     # Delete
     @override
@@ -147,35 +213,119 @@ class DoublyLinkedList(ILinkedList[T], Generic[T]):
         if current is None:
             return False
 
-        if current.prev is not None:
-            current.prev.next = current.next
-        else:
-            self._head = current.next
-        if current.next is not None:
-            current.next.prev = current.prev
-        else:
-            self._tail = current.prev
-
-        self._length -= 1
+        self._finger = None
+        self._unlink(current)
         return True
 
     @override
     def remove_at(self, index: int) -> None:
         current: Final[DoubleNode[T]] = self._efficient_get_node_by_index(index)
-        if current.prev is not None:
-            current.prev.next = current.next
+        self._unlink(current)
+        self._finger = current.next
+
+    def _unlink(self, node: DoubleNode[T]) -> None:
+        if node.prev is not None:
+            node.prev.next = node.next
         else:
-            self._head = current.next
-        if current.next is not None:
-            current.next.prev = current.prev
+            self._head = node.next
+        if node.next is not None:
+            node.next.prev = node.prev
         else:
-            self._tail = current.prev
+            self._tail = node.prev
         self._length -= 1
 
+    @override
+    def remove_if(self, predicate: Callable[[T], bool]) -> int:
+        removed: int = 0
+        current: Optional[DoubleNode[T]] = self._head
+
+        while current is not None:
+            following: Optional[DoubleNode[T]] = current.next
+            if predicate(current.value):
+                if current.prev is not None:
+                    current.prev.next = following
+                else:
+                    self._head = following
+                if following is not None:
+                    following.prev = current.prev
+                else:
+                    self._tail = current.prev
+                removed += 1
+            current = following
+
+        if removed:
+            self._length -= removed
+            self._finger = None
+        return removed
+
     @override
     def __delitem__(self, index: int) -> None:
         return self.remove_at(index)
 
+    # Sort
+    def sort(
+        self,
+        key: Optional[Callable[[T], Any]] = None,
+        compare: Callable[[Any, Any], bool] = default_compare,
+    ) -> None:
+        """Stable bottom-up merge sort that relinks the existing nodes; `compare` is "less than"."""
+        if self._length < 2:
+            return
+
+        less: Final[Callable[[T, T], bool]] = _keyed(compare, key)
+        head: Optional[DoubleNode[T]] = self._head
+        width: int = 1
+        while width < self._length:
+            sorted_head: Optional[DoubleNode[T]] = None
+            sorted_tail: Optional[DoubleNode[T]] = None
+            rest: Optional[DoubleNode[T]] = head
+            while rest is not None:
+                left: DoubleNode[T] = rest
+                right: Optional[DoubleNode[T]] = _cut(left, width)
+                rest = _cut(right, width)
+                merged_head, merged_tail = _merge(left, right, less)
+                if sorted_tail is None:
+                    sorted_head = merged_head
+                else:
+                    sorted_tail.next = merged_head
+                sorted_tail = merged_tail
+            head = sorted_head
+            width *= 2
+
+        self._relink(head)
+
+    def merge_sorted(
+        self,
+        other: DoublyLinkedList[T],
+        key: Optional[Callable[[T], Any]] = None,
+        compare: Callable[[Any, Any], bool] = default_compare,
+    ) -> None:
+        """Merges the nodes of `other` in linear time, leaving it empty; both must be sorted.
+
+        On equal values the nodes of this list come first, so the merge is stable.
+        """
+        if other is self:
+            raise ValueError("Cannot merge a list into itself")
+        if other._head is None:
+            return
+
+        head, _ = _merge(self._head, other._head, _keyed(compare, key))
+        self._length += other._length
+        other.clear()
+        self._relink(head)
+
+    def _relink(self, head: Optional[DoubleNode[T]]) -> None:
+        """Restores `prev` pointers and the tail after the nodes were chained through `next`."""
+        previous: Optional[DoubleNode[T]] = None
+        current: Optional[DoubleNode[T]] = head
+        while current is not None:
+            current.prev = previous
+            previous, current = current, current.next
+
+        self._head = head
+        self._tail = previous
+        self._finger = None
+
     # Utility
     @override
     def is_empty(self) -> bool:
@@ -193,19 +343,25 @@ class DoublyLinkedList(ILinkedList[T], Generic[T]):
     def __str__(self) -> str:
         return "[" + " -> ".join(str(value) for value in self) + "]"
 
+    @override
+    def to_list(self) -> List[T]:
+        values: List[T] = []
+        current: Optional[DoubleNode[T]] = self._head
+
+        while current is not None:
+            values.append(current.value)
+            current = current.next
+
+        return values
+
     # Iteration
     @override
     def __iter__(self) -> Iterator[T]:
-        self._current = self._head
-        return self
+        current: Optional[DoubleNode[T]] = self._head
 
-    @override
-    def __next__(self) -> T:
-        if self._current is None:
-            raise StopIteration
-        value: Final[T] = self._current.value
-        self._current = self._current.next
-        return value
+        while current is not None:
+            yield current.value
+            current = current.next
 
     @override
     def __reversed__(self) -> Iterator[T]:
@@ -219,6 +375,65 @@ class DoublyLinkedList(ILinkedList[T], Generic[T]):
     def reverse(self) -> None:
         current: Optional[DoubleNode[T]] = self._head
         self._head, self._tail = self._tail, self._head
+        self._finger_index = self._length - 1 - self._finger_index
         while current is not None:
             current.next, current.prev = current.prev, current.next
             current = current.prev
+
+
+def _keyed(
+    compare: Callable[[Any, Any], bool], key: Optional[Callable[[T], Any]]
+) -> Callable[[T, T], bool]:
+    if key is None:
+        return compare
+    return lambda left, right: compare(key(left), key(right))
+
+
+def _cut(node: Optional[DoubleNode[T]], count: int) -> Optional[DoubleNode[T]]:
+    """Ends the chain starting at `node` after `count` nodes and returns the rest of it."""
+    for _ in range(count - 1):
+        if node is None:
+            return None
+        node = node.next
+    if node is None:
+        return None
+
+    rest: Optional[DoubleNode[T]] = node.next
+    node.next = None
+    return rest
+
+
+def _merge(
+    left: Optional[DoubleNode[T]],
+    right: Optional[DoubleNode[T]],
+    less: Callable[[T, T], bool],
+) -> Tuple[Optional[DoubleNode[T]], Optional[DoubleNode[T]]]:
+    """Merges two sorted chains linked through `next` and returns the head and tail of the result.
+
+    Only `next` is maintained; ties take the node from `left`.
+    """
+    head: Optional[DoubleNode[T]] = None
+    tail: Optional[DoubleNode[T]] = None
+    while left is not None and right is not None:
+        node: DoubleNode[T]
+        if less(right.value, left.value):
+            node, right = right, right.next
+        else:
+            node, left = left, left.next
+        if tail is None:
+            head = node
+        else:
+            tail.next = node
+        tail = node
+
+    rest: Optional[DoubleNode[T]] = left if left is not None else right
+    if tail is None:
+        return rest, None if rest is None else _last(rest)
+    tail.next = rest
+    return head, tail if rest is None else _last(rest)
+
+
+def _last(node: DoubleNode[T]) -> DoubleNode[T]:
+    while node.next is not None:
+        node = node.next
+    return node
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Generic, Iterable, Optional
+
+from common.comparable import default_compare
+from common.extra_typing import override
+from lab2.linked_list.doubly_linked_list import DoubleNode, DoublyLinkedList
+from lab2.linked_list.linked_list import T
+
+
+class IndexedDoublyLinkedList(DoublyLinkedList[T], Generic[T]):
+    """DoublyLinkedList keeping a value -> nodes dictionary in sync, for O(1) lookups by value.
+
+    Values must be hashable. `contains` is O(1); `remove` and the `move_to_*` primitives are O(1)
+    for values stored once and scan only when a value has duplicates, to keep first-match order.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Nodes are keyed by id, since dataclass nodes compare by value
+        self._nodes: Dict[T, Dict[int, DoubleNode[T]]] = {}
+
+    def _index(self, node: DoubleNode[T]) -> None:
+        self._nodes.setdefault(node.value, {})[id(node)] = node
+
+    def _forget(self, node: DoubleNode[T]) -> None:
+        nodes: Dict[int, DoubleNode[T]] = self._nodes[node.value]
+        del nodes[id(node)]
+        if not nodes:
+            del self._nodes[node.value]
+
+    def _index_from(self, node: Optional[DoubleNode[T]]) -> None:
+        while node is not None:
+            self._index(node)
+            node = node.next
+
+    def _get_node_by_value(self, value: T) -> Optional[DoubleNode[T]]:
+        nodes: Optional[Dict[int, DoubleNode[T]]] = self._nodes.get(value)
+        if nodes is None:
+            return None
+        if len(nodes) == 1:
+            return next(iter(nodes.values()))
+        return self._get_node_by_predicate(lambda node: id(node) in nodes)
+
+    # Create
+    @override
+    def add_in_head(self, value: T) -> None:
+        super().add_in_head(value)
+        assert self._head is not None
+        self._index(self._head)
+
+    @override
+    def add_in_tail(self, value: T) -> None:
+        super().add_in_tail(value)
+        assert self._tail is not None
+        self._index(self._tail)
+
+    @override
+    def insert(self, index: int, value: T) -> None:
+        # Inserts at either end go through the indexing add_in_head/add_in_tail
+        at_end: bool = index == 0 or index == self._length
+        super().insert(index, value)
+        if not at_end:
+            assert self._finger is not None
+            self._index(self._finger)
+
+    @override
+    def extend(self, values: Iterable[T]) -> None:
+        tail: Optional[DoubleNode[T]] = self._tail
+        super().extend(values)
+        self._index_from(self._head if tail is None else tail.next)
+
+    @override
+    def splice(self, other: DoublyLinkedList[T]) -> None:
+        tail: Optional[DoubleNode[T]] = self._tail
+        super().splice(other)
+        self._index_from(self._head if tail is None else tail.next)
+
+    @override
+    def merge_sorted(
+        self,
+        other: DoublyLinkedList[T],
+        key: Optional[Callable[[T], Any]] = None,
+        compare: Callable[[Any, Any], bool] = default_compare,
+    ) -> None:
+        if other is not self:
+            self._index_from(other._head)
+        super().merge_sorted(other, key, compare)
+
+    # Read
+    @override
+    def contains(self, value: T) -> bool:
+        return value in self._nodes
+
+    # Update
+    @override
+    def update(self, index: int, value: T) -> None:
+        node: DoubleNode[T] = self._efficient_get_node_by_index(index)
+        self._forget(node)
+        node.value = value
+        self._index(node)
+
+    @override
+    def clear(self) -> None:
+        super().clear()
+        self._nodes.clear()
+
+    def move_to_front(self, value: T) -> bool:
+        node: Optional[DoubleNode[T]] = self._get_node_by_value(value)
+        if node is None:
+            return False
+
+        if node is not self._head:
+            self._unlink(node)
+            node.prev, node.next = None, self._head
+            assert self._head is not None
+            self._head.prev = node
+            self._head = node
+            self._length += 1
+            self._finger = None
+        return True
+
+    def move_to_back(self, value: T) -> bool:
+        node: Optional[DoubleNode[T]] = self._get_node_by_value(value)
+        if node is None:
+            return False
+
+        if node is not self._tail:
+            self._unlink(node)
+            node.prev, node.next = self._tail, None
+            assert self._tail is not None
+            self._tail.next = node
+            self._tail = node
+            self._length += 1
+            self._finger = None
+        return True
+
+    # Delete
+    @override
+    def remove(self, value: T) -> bool:
+        node: Optional[DoubleNode[T]] = self._get_node_by_value(value)
+        if node is None:
+            return False
+
+        self._forget(node)
+        self._unlink(node)
+        self._finger = None
+        return True
+
+    @override
+    def remove_at(self, index: int) -> None:
+        self._forget(self._efficient_get_node_by_index(index))
+        super().remove_at(index)
+
+    @override
+    def remove_if(self, predicate: Callable[[T], bool]) -> int:
+        removed: int = super().remove_if(predicate)
+        if removed:
+            self._nodes.clear()
+            self._index_from(self._head)
+        return removed
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Generic, Iterator, Optional, TypeVar
+from typing import Callable, Generic, Iterable, Iterator, List, Optional, TypeVar
+
+from common.extra_typing import Self
 
 T = TypeVar("T")
 
@@ -20,6 +22,16 @@ class ILinkedList(ABC, Generic[T]):
     @abstractmethod
     def insert(self, index: int, value: T) -> None: ...
 
+    def extend(self, values: Iterable[T]) -> None:
+        for value in list(values) if values is self else values:
+            self.add_in_tail(value)
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[T]) -> Self:
+        linked_list: Self = cls()
+        linked_list.extend(values)
+        return linked_list
+
     # Read
     @abstractmethod
     def element_at(self, index: int) -> T: ...
@@ -27,6 +39,18 @@ class ILinkedList(ABC, Generic[T]):
     @abstractmethod
     def element_at_or_none(self, index: int) -> Optional[T]: ...
 
+    def slice(self, start: int, stop: int) -> Self:
+        """Copies the values in `[start, stop)`, with the bounds clamped as in list slicing."""
+        start, stop, _ = slice(start, stop).indices(len(self))
+        values: List[T] = self.to_list()[start:stop]
+        copy: Self = self._empty_like()
+        copy.extend(values)
+        return copy
+
+    def _empty_like(self) -> Self:
+        """Returns an empty list configured like this one, e.g. for `slice` to fill."""
+        return type(self)()
+
     @abstractmethod
     def __getitem__(self, index: int) -> T: ...
 
@@ -53,6 +77,15 @@ class ILinkedList(ABC, Generic[T]):
     @abstractmethod
     def remove_at(self, index: int) -> None: ...
 
+    def remove_if(self, predicate: Callable[[T], bool]) -> int:
+        """Removes every value matching `predicate` in one pass and returns how many were removed."""
+        values: List[T] = self.to_list()
+        kept: List[T] = [value for value in values if not predicate(value)]
+        if len(kept) != len(values):
+            self.clear()
+            self.extend(kept)
+        return len(values) - len(kept)
+
     @abstractmethod
     def __delitem__(self, index: int) -> None: ...
 
@@ -69,13 +102,13 @@ class ILinkedList(ABC, Generic[T]):
     @abstractmethod
     def __str__(self) -> str: ...
 
+    def to_list(self) -> List[T]:
+        return list(self)
+
     # Iteration
     @abstractmethod
     def __iter__(self) -> Iterator[T]: ...
 
-    @abstractmethod
-    def __next__(self) -> T: ...
-
     @abstractmethod
     def __reversed__(self) -> Iterator[T]: ...
 
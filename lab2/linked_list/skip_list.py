@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from random import Random
+from typing import Final, Generic, Iterable, Iterator, List, Optional, Tuple, cast
+
+from common.extra_typing import Self, override
+from lab2.linked_list.linked_list import ILinkedList, T
+
+
+@dataclass(slots=True)
+class SkipNode(Generic[T]):
+    value: T
+    next: List[Optional[SkipNode[T]]]
+    # span[level] is how many positions next[level] is ahead of this node
+    span: List[int]
+    prev: Optional[SkipNode[T]] = None
+
+
+class SkipList(ILinkedList[T], Generic[T]):
+    """Indexable skip list: forward pointers carry spans, so positional operations are O(log n).
+
+    The header sits at position 0 and the value at index `i` at position `i + 1`; a pointer to
+    None spans up to position `len + 1`. Levels are drawn from a seeded `Random`, so the shape is
+    reproducible for a given seed and sequence of operations.
+    """
+
+    MAX_LEVEL: Final[int] = 32
+    PROBABILITY: Final[float] = 0.25
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        self._seed: Final[Optional[int]] = seed
+        self._random: Final[Random] = Random(seed)
+        self._header: SkipNode[T] = self._create_header()
+        self._tail: Optional[SkipNode[T]] = None
+        self._level: int = 1
+        self._length: int = 0
+
+    @override
+    def _empty_like(self) -> Self:
+        return type(self)(self._seed)
+
+    def _create_header(self) -> SkipNode[T]:
+        return SkipNode(cast(T, None), [None] * self.MAX_LEVEL, [1] * self.MAX_LEVEL)
+
+    def _random_level(self) -> int:
+        level: int = 1
+        while level < self.MAX_LEVEL and self._random.random() < self.PROBABILITY:
+            level += 1
+        return level
+
+    def _check_index(self, index: int) -> None:
+        if index < 0 or index >= self._length:
+            raise IndexError("Index out of range")
+
+    # Create
+    @override
+    def add(self, value: T) -> None:
+        self.add_in_tail(value)
+
+    @override
+    def add_in_head(self, value: T) -> None:
+        self.insert(0, value)
+
+    @override
+    def add_in_tail(self, value: T) -> None:
+        self.insert(self._length, value)
+
+    @override
+    def insert(self, index: int, value: T) -> None:
+        if index < 0 or index > self._length:
+            raise IndexError("Index out of range")
+
+        nodes, positions = self._path(index)
+        self._link(nodes, positions, index, value)
+
+    @override
+    def extend(self, values: Iterable[T]) -> None:
+        nodes, positions = self._path(self._length)
+        for value in list(values) if values is self else values:
+            self._link(nodes, positions, self._length, value)
+
+    def _path(self, index: int) -> Tuple[List[SkipNode[T]], List[int]]:
+        """Returns the last node before position `index + 1` on every level, with its position."""
+        nodes: List[SkipNode[T]] = [self._header] * self._level
+        positions: List[int] = [0] * self._level
+
+        node: SkipNode[T] = self._header
+        position: int = 0
+        for level in range(self._level - 1, -1, -1):
+            following: Optional[SkipNode[T]] = node.next[level]
+            while following is not None and position + node.span[level] <= index:
+                position += node.span[level]
+                node = following
+                following = node.next[level]
+            nodes[level] = node
+            positions[level] = position
+
+        return nodes, positions
+
+    def _link(self, nodes: List[SkipNode[T]], positions: List[int], index: int, value: T) -> None:
+        """Links a new node at `index` and moves the path onto it, so appends can reuse the path."""
+        level: Final[int] = self._random_level()
+        while self._level < level:
+            self._header.span[self._level] = self._length + 1
+            nodes.append(self._header)
+            positions.append(0)
+            self._level += 1
+
+        previous: Final[SkipNode[T]] = nodes[0]
+        node: SkipNode[T] = SkipNode(value, [None] * level, [0] * level)
+        for i in range(level):
+            node.next[i] = nodes[i].next[i]
+            node.span[i] = positions[i] + nodes[i].span[i] - index
+            nodes[i].next[i] = node
+            nodes[i].span[i] = index + 1 - positions[i]
+            nodes[i] = node
+            positions[i] = index + 1
+
+        for i in range(level, self._level):
+            nodes[i].span[i] += 1
+
+        node.prev = None if previous is self._header else previous
+        following: Optional[SkipNode[T]] = node.next[0]
+        if following is None:
+            self._tail = node
+        else:
+            following.prev = node
+        self._length += 1
+
+    # Read
+    def _get_node_by_index(self, index: int) -> SkipNode[T]:
+        self._check_index(index)
+
+        node: SkipNode[T] = self._header
+        position: int = 0
+        target: Final[int] = index + 1
+        for level in range(self._level - 1, -1, -1):
+            following: Optional[SkipNode[T]] = node.next[level]
+            while following is not None and position + node.span[level] <= target:
+                position += node.span[level]
+                node = following
+                following = node.next[level]
+            if position == target:
+                break
+
+        return node
+
+    @override
+    def element_at(self, index: int) -> T:
+        return self._get_node_by_index(index).value
+
+    @override
+    def element_at_or_none(self, index: int) -> Optional[T]:
+        try:
+            return self.element_at(index)
+        except IndexError:
+            return None
+
+    @override
+    def __getitem__(self, index: int) -> T:
+        return self.element_at(index)
+
+    @override
+    def contains(self, value: T) -> bool:
+        return self.index_of(value) != -1
+
+    @override
+    def __contains__(self, value: T) -> bool:
+        return self.contains(value)
+
+    def index_of(self, value: T) -> int:
+        for index, current in enumerate(self):
+            if current == value:
+                return index
+        return -1
+
+    # Update
+    @override
+    def update(self, index: int, value: T) -> None:
+        self._get_node_by_index(index).value = value
+
+    @override
+    def __setitem__(self, index: int, value: T) -> None:
+        self.update(index, value)
+
+    @override
+    def clear(self) -> None:
+        self._header = self._create_header()
+        self._tail = None
+        self._level = 1
+        self._length = 0
+
+    # Delete
+    @override
+    def remove(self, value: T) -> bool:
+        index: Final[int] = self.index_of(value)
+        if index == -1:
+            return False
+
+        self.remove_at(index)
+        return True
+
+    @override
+    def remove_at(self, index: int) -> None:
+        self._check_index(index)
+
+        nodes, _ = self._path(index)
+        node: Final[Optional[SkipNode[T]]] = nodes[0].next[0]
+        assert node is not None
+
+        for i in range(self._level):
+            if nodes[i].next[i] is node:
+                nodes[i].next[i] = node.next[i]
+                nodes[i].span[i] += node.span[i] - 1
+            else:
+                nodes[i].span[i] -= 1
+
+        following: Final[Optional[SkipNode[T]]] = node.next[0]
+        if following is None:
+            self._tail = node.prev
+        else:
+            following.prev = node.prev
+
+        while self._level > 1 and self._header.next[self._level - 1] is None:
+            self._level -= 1
+        self._length -= 1
+
+    @override
+    def __delitem__(self, index: int) -> None:
+        return self.remove_at(index)
+
+    # Utility
+    @override
+    def is_empty(self) -> bool:
+        return self._length == 0
+
+    @override
+    def __bool__(self) -> bool:
+        return not self.is_empty()
+
+    @override
+    def __len__(self) -> int:
+        return self._length
+
+    @override
+    def __str__(self) -> str:
+        return "[" + " -> ".join(str(value) for value in self) + "]"
+
+    # Iteration
+    @override
+    def __iter__(self) -> Iterator[T]:
+        node: Optional[SkipNode[T]] = self._header.next[0]
+        while node is not None:
+            yield node.value
+            node = node.next[0]
+
+    @override
+    def __reversed__(self) -> Iterator[T]:
+        node: Optional[SkipNode[T]] = self._tail
+        while node is not None:
+            yield node.value
+            node = node.prev
+
+    @override
+    def reverse(self) -> None:
+        values: Final[List[T]] = self.to_list()
+        values.reverse()
+        self.clear()
+        self.extend(values)
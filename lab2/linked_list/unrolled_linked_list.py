@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import Final, Generic, Iterable, Iterator, List, Optional, Tuple
+
+from common.extra_typing import Self, override
+from lab2.linked_list.linked_list import ILinkedList, T
+
+
+@dataclass(slots=True)
+class BlockNode(Generic[T]):
+    values: List[T] = field(default_factory=list)
+    next: Optional[BlockNode[T]] = None
+    prev: Optional[BlockNode[T]] = None
+
+
+class UnrolledLinkedList(ILinkedList[T], Generic[T]):
+    """Doubly linked list of blocks holding up to `block_size` values each.
+
+    Full blocks are split in half on insert, and a block that drops below half of its capacity
+    is merged with its successor when both fit into one block.
+    """
+
+    DEFAULT_BLOCK_SIZE: Final[int] = 64
+
+    def __init__(self, block_size: int = DEFAULT_BLOCK_SIZE) -> None:
+        if block_size < 2:
+            raise ValueError("Block size must be at least 2")
+
+        self._block_size: Final[int] = block_size
+        self._head: Optional[BlockNode[T]] = None
+        self._tail: Optional[BlockNode[T]] = None
+        self._length: int = 0
+        # Last block reached by index and the index of its first value
+        self._finger: Optional[BlockNode[T]] = None
+        self._finger_start: int = 0
+
+    @property
+    def block_size(self) -> int:
+        return self._block_size
+
+    @override
+    def _empty_like(self) -> Self:
+        return type(self)(self._block_size)
+
+    # Create
+    @override
+    def add(self, value: T) -> None:
+        self.add_in_tail(value)
+
+    @override
+    def add_in_head(self, value: T) -> None:
+        if self._head is None or len(self._head.values) >= self._block_size:
+            self._link_before(self._head, BlockNode())
+        assert self._head is not None
+        self._head.values.insert(0, value)
+        self._length += 1
+        self._finger = None
+
+    @override
+    def add_in_tail(self, value: T) -> None:
+        if self._tail is None or len(self._tail.values) >= self._block_size:
+            self._link_after(self._tail, BlockNode())
+        assert self._tail is not None
+        self._tail.values.append(value)
+        self._length += 1
+
+    @override
+    def insert(self, index: int, value: T) -> None:
+        if index == self._length:
+            self.add_in_tail(value)
+            return
+
+        block, offset = self._get_block_by_index(index)
+        if len(block.values) >= self._block_size:
+            self._split(block)
+            if offset > len(block.values):
+                offset -= len(block.values)
+                assert block.next is not None
+                block = block.next
+
+        block.values.insert(offset, value)
+        self._length += 1
+        self._finger = None
+
+    @override
+    def extend(self, values: Iterable[T]) -> None:
+        pending: List[T] = list(values)
+        start: int = 0
+
+        if self._tail is not None:
+            start = self._block_size - len(self._tail.values)
+            self._tail.values.extend(pending[:start])
+
+        for i in range(start, len(pending), self._block_size):
+            self._link_after(self._tail, BlockNode(pending[i : i + self._block_size]))
+
+        self._length += len(pending)
+
+    # Read
+    def _get_block_by_index(self, index: int) -> Tuple[BlockNode[T], int]:
+        if index < 0 or index >= self._length:
+            raise IndexError("Index out of range")
+
+        finger: Optional[BlockNode[T]] = self._finger
+        if finger is not None and index >= self._finger_start:
+            offset: int = index - self._finger_start
+            if offset < len(finger.values):
+                return finger, offset
+            if finger.next is not None and offset - len(finger.values) < len(finger.next.values):
+                self._finger, self._finger_start = finger.next, index - offset + len(finger.values)
+                return finger.next, offset - len(finger.values)
+
+        position: Final[int] = index
+        block: Optional[BlockNode[T]]
+        if index < self._length // 2:
+            block = self._head
+            while block is not None and index >= len(block.values):
+                index -= len(block.values)
+                block = block.next
+        else:
+            index -= self._length
+            block = self._tail
+            while block is not None and -index > len(block.values):
+                index += len(block.values)
+                block = block.prev
+            assert block is not None
+            index += len(block.values)
+
+        assert block is not None
+        self._finger, self._finger_start = block, position - index
+        return block, index
+
+    @override
+    def element_at(self, index: int) -> T:
+        block, offset = self._get_block_by_index(index)
+        return block.values[offset]
+
+    @override
+    def element_at_or_none(self, index: int) -> Optional[T]:
+        try:
+            return self.element_at(index)
+        except IndexError:
+            return None
+
+    @override
+    def __getitem__(self, index: int) -> T:
+        return self.element_at(index)
+
+    @override
+    def contains(self, value: T) -> bool:
+        block: Optional[BlockNode[T]] = self._head
+        while block is not None:
+            if value in block.values:
+                return True
+            block = block.next
+        return False
+
+    @override
+    def __contains__(self, value: T) -> bool:
+        return self.contains(value)
+
+    # Update
+    @override
+    def update(self, index: int, value: T) -> None:
+        block, offset = self._get_block_by_index(index)
+        block.values[offset] = value
+
+    @override
+    def __setitem__(self, index: int, value: T) -> None:
+        self.update(index, value)
+
+    @override
+    def clear(self) -> None:
+        self._head = None
+        self._tail = None
+        self._length = 0
+        self._finger = None
+
+    # Delete
+    @override
+    def remove(self, value: T) -> bool:
+        block: Optional[BlockNode[T]] = self._head
+        while block is not None:
+            if value in block.values:
+                block.values.remove(value)
+                self._length -= 1
+                self._finger = None
+                self._rebalance(block)
+                return True
+            block = block.next
+        return False
+
+    @override
+    def remove_at(self, index: int) -> None:
+        block, offset = self._get_block_by_index(index)
+        del block.values[offset]
+        self._length -= 1
+        self._finger = None
+        self._rebalance(block)
+
+    @override
+    def __delitem__(self, index: int) -> None:
+        return self.remove_at(index)
+
+    # Blocks
+    def _link_after(self, anchor: Optional[BlockNode[T]], block: BlockNode[T]) -> None:
+        block.prev = anchor
+        if anchor is None:
+            block.next = self._head
+            self._head = block
+        else:
+            block.next = anchor.next
+            anchor.next = block
+
+        if block.next is None:
+            self._tail = block
+        else:
+            block.next.prev = block
+
+    def _link_before(self, anchor: Optional[BlockNode[T]], block: BlockNode[T]) -> None:
+        self._link_after(anchor.prev if anchor is not None else self._tail, block)
+
+    def _unlink(self, block: BlockNode[T]) -> None:
+        if block.prev is None:
+            self._head = block.next
+        else:
+            block.prev.next = block.next
+        if block.next is None:
+            self._tail = block.prev
+        else:
+            block.next.prev = block.prev
+
+    def _split(self, block: BlockNode[T]) -> None:
+        middle: Final[int] = len(block.values) // 2
+        self._link_after(block, BlockNode(block.values[middle:]))
+        del block.values[middle:]
+
+    def _rebalance(self, block: BlockNode[T]) -> None:
+        if not block.values:
+            self._unlink(block)
+            return
+
+        following: Optional[BlockNode[T]] = block.next
+        if (
+            following is not None
+            and len(block.values) < self._block_size // 2
+            and len(block.values) + len(following.values) <= self._block_size
+        ):
+            block.values.extend(following.values)
+            self._unlink(following)
+
+    # Utility
+    @override
+    def is_empty(self) -> bool:
+        return self._length == 0
+
+    @override
+    def __bool__(self) -> bool:
+        return not self.is_empty()
+
+    @override
+    def __len__(self) -> int:
+        return self._length
+
+    @override
+    def __str__(self) -> str:
+        return "[" + " -> ".join(str(value) for value in self) + "]"
+
+    @override
+    def to_list(self) -> List[T]:
+        values: List[T] = []
+        block: Optional[BlockNode[T]] = self._head
+        while block is not None:
+            values.extend(block.values)
+            block = block.next
+        return values
+
+    # Iteration
+    @override
+    def __iter__(self) -> Iterator[T]:
+        return chain.from_iterable(self._blocks())
+
+    def _blocks(self) -> Iterator[List[T]]:
+        block: Optional[BlockNode[T]] = self._head
+        while block is not None:
+            yield block.values
+            block = block.next
+
+    @override
+    def __reversed__(self) -> Iterator[T]:
+        block: Optional[BlockNode[T]] = self._tail
+        while block is not None:
+            yield from reversed(block.values)
+            block = block.prev
+
+    @override
+    def reverse(self) -> None:
+        block: Optional[BlockNode[T]] = self._head
+        self._head, self._tail = self._tail, self._head
+        self._finger = None
+        while block is not None:
+            block.values.reverse()
+            block.next, block.prev = block.prev, block.next
+            block = block.prev
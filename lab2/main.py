@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Union
+import re
+from typing import Dict, Final, List, Union
 
 from lab2.linked_list.doubly_linked_list import DoublyLinkedList
+from lab2.stack.array_stack import ArrayStack
 from lab2.stack.not_growable_stack import NotGrowableStack
 from lab2.stack.stack import IStack, StackOverflowException
 from lab2.stack.stack_linked_list import StackLinkedList
@@ -33,22 +35,30 @@ def linked_list() -> None:
     print(list, end=end)
 
 
+_BRACE_RUNS: Final[re.Pattern[str]] = re.compile(r"[([{]+|[)\]}]+|.", re.DOTALL)
+_OPENING_BRACES: Final[Dict[int, int]] = str.maketrans(")}]", "({[")
+
+
 def is_valid_braces_sequence(braces: Union[List[str], str]) -> bool:
-    braces_list: List[str] = list(braces) if isinstance(braces, str) else braces
-    stack: IStack[str] = StackLinkedList()
-    matches: Dict[str, str] = {
-        ")": "(",
-        "}": "{",
-        "]": "[",
-    }
-
-    for brace in braces_list:
-        if brace in ("(", "{", "["):
-            stack.push(brace)
-            continue
-
-        peek: Optional[str] = stack.pop_or_none()
-        if peek is None or matches.get(brace, None) != peek:
+    if not isinstance(braces, str):
+        # Any element other than a single brace makes the sequence invalid
+        if any(len(brace) != 1 for brace in braces):
+            return False
+        braces = "".join(braces)
+    if len(braces) % 2 != 0:
+        return False
+
+    # Dropping adjacent pairs keeps validity and leaves the stack only the nested runs
+    braces = braces.replace("()", "").replace("[]", "").replace("{}", "")
+
+    stack: ArrayStack[str] = ArrayStack(len(braces) // 2)
+    # Runs of opening braces are pushed and runs of closing ones are popped as a batch
+    for run in _BRACE_RUNS.findall(braces):
+        if run[0] in "([{":
+            stack.push_many(run)
+        elif run[0] not in ")]}" or len(run) > len(stack):
+            return False
+        elif "".join(stack.pop_many(len(run))) != run.translate(_OPENING_BRACES):
             return False
 
     return stack.is_empty()
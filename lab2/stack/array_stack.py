@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from typing import Final, Iterable, List, Optional, cast
+
+from common.extra_typing import override
+from lab2.stack.stack import IStack, StackEmptyException, T
+
+
+class ArrayStack(IStack[T]):
+    """Stack over a contiguous buffer that doubles when full and never shrinks.
+
+    `push_many`/`pop_many` move whole batches with slice assignment instead of one call per value.
+    """
+
+    _MIN_GROWTH: Final[int] = 8
+
+    def __init__(self, capacity: int = 0) -> None:
+        if capacity < 0:
+            raise ValueError("Capacity must be greater than or equal to 0")
+
+        self._buffer: List[Optional[T]] = [None] * capacity
+        self._length: int = 0
+
+    def _reserve(self, capacity: int) -> None:
+        if capacity > len(self._buffer):
+            growth: int = max(capacity, 2 * len(self._buffer), self._MIN_GROWTH)
+            self._buffer.extend([None] * (growth - len(self._buffer)))
+
+    @override
+    def push(self, value: T) -> None:
+        if self._length == len(self._buffer):
+            self._reserve(self._length + 1)
+        self._buffer[self._length] = value
+        self._length += 1
+
+    def push_many(self, values: Iterable[T]) -> None:
+        """Pushes `values` in order, so the last one ends up on top."""
+        batch: List[T] = list(values)
+        end: Final[int] = self._length + len(batch)
+        self._reserve(end)
+        self._buffer[self._length : end] = batch
+        self._length = end
+
+    @override
+    def peek(self) -> T:
+        if self._length == 0:
+            raise StackEmptyException("Stack is empty")
+        return cast(T, self._buffer[self._length - 1])
+
+    @override
+    def peek_or_none(self) -> Optional[T]:
+        return self._buffer[self._length - 1] if self._length > 0 else None
+
+    @override
+    def pop(self) -> T:
+        if self._length == 0:
+            raise StackEmptyException("Stack is empty")
+        self._length -= 1
+        value: Final[Optional[T]] = self._buffer[self._length]
+        self._buffer[self._length] = None
+        return cast(T, value)
+
+    @override
+    def pop_or_none(self) -> Optional[T]:
+        return self.pop() if self._length > 0 else None
+
+    def pop_many(self, count: int) -> List[T]:
+        """Pops `count` values, top first.
+
+        Raises `StackEmptyException` and leaves the stack unchanged if it holds fewer values.
+        """
+        if count < 0:
+            raise ValueError("Count must be greater than or equal to 0")
+        if count > self._length:
+            raise StackEmptyException("Stack is empty")
+
+        start: Final[int] = self._length - count
+        values: List[T] = cast(List[T], self._buffer[start : self._length])
+        values.reverse()
+        self._buffer[start : self._length] = [None] * count
+        self._length = start
+        return values
+
+    @override
+    def clear(self) -> None:
+        self._buffer[: self._length] = [None] * self._length
+        self._length = 0
+
+    @override
+    @property
+    def capacity(self) -> int:
+        return len(self._buffer)
+
+    @override
+    def is_empty(self) -> bool:
+        return self._length == 0
+
+    @override
+    def __bool__(self) -> bool:
+        return not self.is_empty()
+
+    @override
+    def __len__(self) -> int:
+        return self._length
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from threading import Condition, Lock
+from typing import Final, Optional, cast
+
+from common.extra_typing import override
+from lab2.stack.stack import IStack, StackEmptyException, StackOverflowException, T
+from lab2.stack.stack_linked_list import StackLinkedList
+
+
+class ConcurrentStack(IStack[T]):
+    """Thread-safe stack: `pop` waits for a value and, when bounded, `push` waits for room.
+
+    Both follow `queue.Queue`: with `block=False`, or once `timeout` seconds pass, they raise
+    `StackEmptyException`/`StackOverflowException` instead of waiting further.
+
+    There is no lock-free variant: Python exposes no compare-and-swap primitive to build one on,
+    and under the GIL a CAS loop would serialize just like this lock while losing blocking waits.
+    """
+
+    def __init__(self, capacity: Optional[int] = None) -> None:
+        if capacity is not None and capacity <= 0:
+            raise ValueError("Capacity must be positive")
+
+        self._delegate: Final[StackLinkedList[T]] = StackLinkedList()
+        self._capacity: Final[Optional[int]] = capacity
+        self._lock: Final[Lock] = Lock()
+        self._not_empty: Final[Condition] = Condition(self._lock)
+        self._not_full: Final[Condition] = Condition(self._lock)
+        # Threads blocked in pop/push, so the uncontended paths skip notify
+        self._waiting_pops: int = 0
+        self._waiting_pushes: int = 0
+
+    def _is_full(self) -> bool:
+        return self._capacity is not None and len(self._delegate) >= self._capacity
+
+    def _wait_for_room(self, block: bool, timeout: Optional[float]) -> bool:
+        if not block:
+            return False
+        self._waiting_pushes += 1
+        try:
+            return self._not_full.wait_for(lambda: not self._is_full(), timeout)
+        finally:
+            self._waiting_pushes -= 1
+
+    def _wait_for_value(self, block: bool, timeout: Optional[float]) -> bool:
+        if not block:
+            return False
+        self._waiting_pops += 1
+        try:
+            return self._not_empty.wait_for(lambda: not self._delegate.is_empty(), timeout)
+        finally:
+            self._waiting_pops -= 1
+
+    def _notify_room(self) -> None:
+        if self._waiting_pushes:
+            self._not_full.notify()
+
+    @override
+    def push(self, value: T, block: bool = True, timeout: Optional[float] = None) -> None:
+        with self._lock:
+            if self._is_full() and not self._wait_for_room(block, timeout):
+                raise StackOverflowException("Stack is full")
+            self._delegate.push(value)
+            if self._waiting_pops:
+                self._not_empty.notify()
+
+    @override
+    def peek(self) -> T:
+        with self._lock:
+            return self._delegate.peek()
+
+    @override
+    def peek_or_none(self) -> Optional[T]:
+        with self._lock:
+            return self._delegate.peek_or_none()
+
+    @override
+    def pop(self, block: bool = True, timeout: Optional[float] = None) -> T:
+        with self._lock:
+            if self._delegate.is_empty() and not self._wait_for_value(block, timeout):
+                raise StackEmptyException("Stack is empty")
+            # The delegate's pop takes a stored None for an empty stack, so emptiness is checked above
+            value: T = cast(T, self._delegate.pop_or_none())
+            self._notify_room()
+            return value
+
+    @override
+    def pop_or_none(self) -> Optional[T]:
+        with self._lock:
+            if self._delegate.is_empty():
+                return None
+            value: Optional[T] = self._delegate.pop_or_none()
+            self._notify_room()
+            return value
+
+    @override
+    def clear(self) -> None:
+        with self._lock:
+            self._delegate.clear()
+            if self._waiting_pushes:
+                self._not_full.notify_all()
+
+    @override
+    @property
+    def capacity(self) -> int:
+        with self._lock:
+            return self._capacity if self._capacity is not None else len(self._delegate)
+
+    @override
+    def is_empty(self) -> bool:
+        with self._lock:
+            return self._delegate.is_empty()
+
+    @override
+    def __bool__(self) -> bool:
+        return not self.is_empty()
+
+    @override
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._delegate)
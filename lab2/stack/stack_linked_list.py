@@ -7,7 +7,7 @@ from common.extra_typing import override
 from lab2.stack.stack import IStack, StackEmptyException, T
 
 
-@dataclass
+@dataclass(slots=True)
 class SingleNode(Generic[T]):
     value: T
     next: Optional[SingleNode[T]] = None
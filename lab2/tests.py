@@ -1,15 +1,35 @@
 from __future__ import annotations
 
+import io
+import os
+import tempfile
+import threading
 import unittest
-from typing import Any
+from random import Random
+from typing import Any, Dict, List, Optional
 
 from common.extra_typing import override
-from lab2.linked_list.doubly_linked_list import DoublyLinkedList
+from common.instrumentation import OperationCounts
+from lab2.braces import (
+    BraceScanner,
+    BraceSummary,
+    combine_summaries,
+    find_unbalanced_brace,
+    find_unbalanced_brace_in_file,
+)
+from lab2.linked_list.array_deque_list import ArrayDequeList
+from lab2.linked_list.counting_doubly_linked_list import CountingDoublyLinkedList, CountingNode
+from lab2.linked_list.doubly_linked_list import DoubleNode, DoublyLinkedList
+from lab2.linked_list.indexed_doubly_linked_list import IndexedDoublyLinkedList
 from lab2.linked_list.linked_list import ILinkedList
+from lab2.linked_list.skip_list import SkipList, SkipNode
+from lab2.linked_list.unrolled_linked_list import BlockNode, UnrolledLinkedList
 from lab2.main import is_valid_braces_sequence
+from lab2.stack.array_stack import ArrayStack
+from lab2.stack.concurrent_stack import ConcurrentStack
 from lab2.stack.not_growable_stack import NotGrowableStack
 from lab2.stack.stack import IStack, StackEmptyException, StackOverflowException
-from lab2.stack.stack_linked_list import StackLinkedList
+from lab2.stack.stack_linked_list import SingleNode, StackLinkedList
 
 
 class LinkedListTest(unittest.TestCase):
@@ -148,6 +168,300 @@ class LinkedListTest(unittest.TestCase):
         for i, value in enumerate(self.linked_list):
             self.assertEqual(value, 3 - i)
 
+    def test_nested_iteration(self) -> None:
+        self.linked_list.extend([1, 2, 3])
+        pairs: List[Any] = [(a, b) for a in self.linked_list for b in self.linked_list]
+        self.assertEqual(len(pairs), 9)
+        self.assertEqual(pairs[-1], (3, 3))
+
+    def test_to_list(self) -> None:
+        self.assertEqual(self.linked_list.to_list(), [])
+        self.linked_list.add(1)
+        self.linked_list.add_in_head(0)
+        self.assertEqual(self.linked_list.to_list(), [0, 1])
+
+    def test_extend(self) -> None:
+        self.linked_list.add(0)
+        self.linked_list.extend(range(1, 20))
+        self.linked_list.extend(self.linked_list)
+        self.assertEqual(len(self.linked_list), 40)
+        self.assertEqual(self.linked_list.to_list(), [*range(20), *range(20)])
+        self.assertEqual(self.linked_list[39], 19)
+
+    def test_mixed_operations_match_list(self) -> None:
+        random: Random = Random(7)
+        expected: List[int] = []
+
+        for step in range(2000):
+            operation: int = random.randrange(7)
+            index: int = random.randint(0, len(expected))
+            if operation == 0:
+                self.linked_list.add_in_head(step)
+                expected.insert(0, step)
+            elif operation == 1:
+                self.linked_list.add_in_tail(step)
+                expected.append(step)
+            elif operation == 2:
+                self.linked_list.insert(index, step)
+                expected.insert(index, step)
+            elif expected and operation == 3:
+                self.linked_list.remove_at(index % len(expected))
+                del expected[index % len(expected)]
+            elif expected and operation == 4:
+                value: int = expected[index % len(expected)]
+                self.assertTrue(self.linked_list.remove(value))
+                expected.remove(value)
+            elif operation == 5:
+                self.linked_list.reverse()
+                expected.reverse()
+            elif expected:
+                self.linked_list[index % len(expected)] = step
+                expected[index % len(expected)] = step
+
+            if expected:
+                probe: int = random.randrange(len(expected))
+                self.assertEqual(self.linked_list[probe], expected[probe])
+
+        self.assertEqual(self.linked_list.to_list(), expected)
+
+    def test_slice(self) -> None:
+        self.linked_list.extend(range(10))
+        self.assertEqual([*self.linked_list.slice(2, 5)], [2, 3, 4])
+        self.assertEqual([*self.linked_list.slice(-3, 100)], [7, 8, 9])
+        self.assertEqual([*self.linked_list.slice(5, 2)], [])
+        self.assertIsInstance(self.linked_list.slice(0, 1), type(self.linked_list))
+        self.assertEqual(len(self.linked_list), 10)
+
+    def test_remove_if(self) -> None:
+        self.linked_list.extend(range(10))
+        self.assertEqual(self.linked_list.remove_if(lambda value: value % 3 == 0), 4)
+        self.assertEqual([*self.linked_list], [1, 2, 4, 5, 7, 8])
+        self.assertEqual([*reversed(self.linked_list)], [8, 7, 5, 4, 2, 1])
+        self.assertEqual(self.linked_list[4], 7)
+        self.assertEqual(self.linked_list.remove_if(lambda value: value > 100), 0)
+        self.assertEqual(self.linked_list.remove_if(lambda value: True), 6)
+        self.assertTrue(self.linked_list.is_empty())
+
+    def test_from_iterable(self) -> None:
+        linked_list: ILinkedList[int] = type(self.linked_list).from_iterable([1, 2, 3])
+        self.assertIsInstance(linked_list, type(self.linked_list))
+        self.assertEqual([*linked_list], [1, 2, 3])
+        self.assertEqual([*reversed(linked_list)], [3, 2, 1])
+
+
+class SpliceTest(unittest.TestCase):
+    def test_splice(self) -> None:
+        first: DoublyLinkedList[int] = DoublyLinkedList.from_iterable([1, 2])
+        second: DoublyLinkedList[int] = DoublyLinkedList.from_iterable([3, 4, 5])
+        first.splice(second)
+        self.assertEqual([*first], [1, 2, 3, 4, 5])
+        self.assertEqual([*reversed(first)], [5, 4, 3, 2, 1])
+        self.assertEqual(len(first), 5)
+        self.assertEqual(first[3], 4)
+        self.assertTrue(second.is_empty())
+
+        second.splice(first)
+        self.assertEqual([*second], [1, 2, 3, 4, 5])
+        self.assertTrue(first.is_empty())
+        with self.assertRaises(ValueError):
+            second.splice(second)
+
+
+class CountingDoublyLinkedListTest(LinkedListTest):
+    @override
+    def setUp(self) -> None:
+        self.counts: OperationCounts = OperationCounts()
+        self.linked_list: ILinkedList[Any] = CountingDoublyLinkedList(self.counts)
+
+    @override
+    def tearDown(self) -> None:
+        assert isinstance(self.linked_list, CountingDoublyLinkedList)
+        node: Optional[DoubleNode[Any]] = self.linked_list._head
+        while node is not None:
+            self.assertIsInstance(node, CountingNode)
+            node = node.next
+
+    def test_slice_shares_counts(self) -> None:
+        self.linked_list.extend([1, 2, 3])
+        copy: ILinkedList[Any] = self.linked_list.slice(1, 3)
+        assert isinstance(copy, CountingDoublyLinkedList)
+        self.assertIs(copy.counts, self.counts)
+        self.assertEqual(self.counts.writes, 5)
+
+    def test_insert_counts_allocation(self) -> None:
+        self.linked_list.extend([1, 3])
+        self.assertEqual(self.counts.writes, 2)
+        self.linked_list.insert(1, 2)
+        self.assertEqual(self.counts.writes, 3)
+        self.assertEqual([*self.linked_list], [1, 2, 3])
+
+
+class IndexedDoublyLinkedListTest(LinkedListTest):
+    @override
+    def setUp(self) -> None:
+        self.linked_list: ILinkedList[Any] = IndexedDoublyLinkedList()
+
+    @override
+    def tearDown(self) -> None:
+        self._assert_index_matches(self.linked_list)
+
+    def test_move_to_front_and_back(self) -> None:
+        linked_list: IndexedDoublyLinkedList[str] = IndexedDoublyLinkedList.from_iterable("abcd")
+        self.assertTrue(linked_list.move_to_front("c"))
+        self.assertTrue(linked_list.move_to_back("a"))
+        self.assertTrue(linked_list.move_to_front("c"))
+        self.assertFalse(linked_list.move_to_back("z"))
+        self.assertEqual([*linked_list], ["c", "b", "d", "a"])
+        self.assertEqual([*reversed(linked_list)], ["a", "d", "b", "c"])
+        self.assertEqual(linked_list[2], "d")
+        self._assert_index_matches(linked_list)
+
+    def test_duplicates_keep_first_match_order(self) -> None:
+        linked_list: IndexedDoublyLinkedList[int] = IndexedDoublyLinkedList()
+        linked_list.extend([1, 2, 1, 3, 1])
+        linked_list.update(1, 1)
+        self.assertTrue(linked_list.remove(1))
+        self.assertEqual([*linked_list], [1, 1, 3, 1])
+        self.assertTrue(linked_list.move_to_back(1))
+        self.assertEqual([*linked_list], [1, 3, 1, 1])
+        linked_list.splice(DoublyLinkedList.from_iterable([4, 1]))
+        self.assertEqual(linked_list.remove_if(lambda value: value == 1), 4)
+        self.assertEqual([*linked_list], [3, 4])
+        self.assertFalse(linked_list.contains(1))
+        self._assert_index_matches(linked_list)
+
+    def test_sort_and_merge_keep_index(self) -> None:
+        linked_list: IndexedDoublyLinkedList[int] = IndexedDoublyLinkedList.from_iterable([3, 1, 2])
+        linked_list.sort()
+        linked_list.merge_sorted(DoublyLinkedList.from_iterable([0, 2, 5]))
+        self.assertEqual([*linked_list], [0, 1, 2, 2, 3, 5])
+        self.assertTrue(linked_list.move_to_front(5))
+        self._assert_index_matches(linked_list)
+
+    def _assert_index_matches(self, linked_list: ILinkedList[Any]) -> None:
+        assert isinstance(linked_list, IndexedDoublyLinkedList)
+        nodes: Dict[Any, int] = {}
+        current: Optional[DoubleNode[Any]] = linked_list._head
+        while current is not None:
+            self.assertIs(linked_list._nodes[current.value][id(current)], current)
+            nodes[current.value] = nodes.get(current.value, 0) + 1
+            current = current.next
+        self.assertEqual({value: len(ids) for value, ids in linked_list._nodes.items()}, nodes)
+
+
+class ArrayDequeListTest(LinkedListTest):
+    @override
+    def setUp(self) -> None:
+        self.linked_list: ILinkedList[Any] = ArrayDequeList()
+
+    def test_wraps_around_buffer(self) -> None:
+        for i in range(20):
+            self.linked_list.add_in_head(-i - 1)
+            self.linked_list.add_in_tail(i)
+        self.linked_list.insert(5, 100)
+        self.linked_list.insert(35, 200)
+        self.linked_list.remove_at(2)
+        self.linked_list.remove_at(37)
+
+        expected: List[int] = [*range(-20, 0), *range(20)]
+        expected.insert(5, 100)
+        expected.insert(35, 200)
+        del expected[2]
+        del expected[37]
+        self.assertEqual([*self.linked_list], expected)
+        self.assertEqual([*reversed(self.linked_list)], expected[::-1])
+
+
+class UnrolledLinkedListTest(LinkedListTest):
+    @override
+    def setUp(self) -> None:
+        self.linked_list: ILinkedList[Any] = UnrolledLinkedList(4)
+
+    def test_slice_keeps_block_size(self) -> None:
+        self.linked_list.extend(range(10))
+        copy: ILinkedList[Any] = self.linked_list.slice(2, 9)
+        assert isinstance(copy, UnrolledLinkedList)
+        self.assertEqual(copy.block_size, 4)
+        self.assertListEqual([*copy], [*range(2, 9)])
+        self.assertEqual(UnrolledLinkedList(4).slice(0, 1).block_size, 4)
+
+    def test_blocks_are_split_and_merged(self) -> None:
+        linked_list: UnrolledLinkedList[int] = UnrolledLinkedList(4)
+        linked_list.extend(range(10))
+        for _ in range(6):
+            linked_list.insert(1, -1)
+        self.assertTrue(all(0 < len(values) <= 4 for values in self._blocks(linked_list)))
+
+        for _ in range(12):
+            linked_list.remove_at(len(linked_list) // 2)
+        self.assertEqual(len(linked_list), 4)
+        self.assertTrue(all(0 < len(values) <= 4 for values in self._blocks(linked_list)))
+        self.assertLessEqual(len(self._blocks(linked_list)), 2)
+
+    def _blocks(self, linked_list: UnrolledLinkedList[int]) -> List[List[int]]:
+        blocks: List[List[int]] = []
+        block: Optional[BlockNode[int]] = linked_list._head
+        while block is not None:
+            blocks.append(block.values)
+            block = block.next
+        return blocks
+
+
+class SkipListTest(LinkedListTest):
+    @override
+    def setUp(self) -> None:
+        self.linked_list: ILinkedList[Any] = SkipList(seed=1)
+
+    def test_slice_keeps_seed(self) -> None:
+        self.linked_list.extend(range(50))
+        copy: ILinkedList[Any] = self.linked_list.slice(10, 40)
+        expected: SkipList[int] = SkipList(seed=1)
+        expected.extend(range(10, 40))
+        assert isinstance(copy, SkipList)
+        self.assertEqual(copy._level, expected._level)
+        self.assertListEqual(self._levels(copy), self._levels(expected))
+
+    def _levels(self, skip_list: SkipList[Any]) -> List[int]:
+        levels: List[int] = []
+        node: Optional[SkipNode[Any]] = skip_list._header.next[0]
+        while node is not None:
+            levels.append(len(node.next))
+            node = node.next[0]
+        return levels
+
+    def test_spans_match_positions(self) -> None:
+        linked_list: SkipList[int] = SkipList(seed=3)
+        expected: List[int] = []
+        random: Random = Random(11)
+        for i in range(300):
+            index: int = random.randint(0, len(expected))
+            linked_list.insert(index, i)
+            expected.insert(index, i)
+        for _ in range(150):
+            index = random.randrange(len(expected))
+            linked_list.remove_at(index)
+            del expected[index]
+
+        self.assertEqual([*linked_list], expected)
+        self.assertEqual([linked_list[i] for i in range(len(expected))], expected)
+
+        positions: Dict[int, int] = {id(linked_list._header): 0}
+        node: Optional[SkipNode[int]] = linked_list._header.next[0]
+        for position in range(1, len(expected) + 1):
+            assert node is not None
+            positions[id(node)] = position
+            node = node.next[0]
+
+        for level in range(linked_list._level):
+            current: SkipNode[int] = linked_list._header
+            while current.next[level] is not None:
+                following: Optional[SkipNode[int]] = current.next[level]
+                assert following is not None
+                self.assertEqual(
+                    positions[id(current)] + current.span[level], positions[id(following)]
+                )
+                current = following
+
 
 class StackTest(unittest.TestCase):
     @override
@@ -226,6 +540,134 @@ class StackTest(unittest.TestCase):
         self.assertEqual(len(self.stack), 1)
 
 
+class ArrayStackTest(StackTest):
+    @override
+    def setUp(self) -> None:
+        self.stack: IStack[Any] = ArrayStack()
+
+    @override
+    def test_capacity(self) -> None:
+        self.assertEqual(self.stack.capacity, 0)
+        self.stack.push(1)
+        self.assertGreaterEqual(self.stack.capacity, 1)
+        self.assertEqual(ArrayStack(16).capacity, 16)
+
+    def test_push_many_and_pop_many(self) -> None:
+        stack: ArrayStack[int] = ArrayStack(2)
+        stack.push_many(range(5))
+        stack.push(5)
+        self.assertEqual(len(stack), 6)
+        self.assertEqual(stack.pop_many(3), [5, 4, 3])
+        with self.assertRaises(StackEmptyException):
+            stack.pop_many(4)
+        self.assertEqual(stack.pop_many(0), [])
+        self.assertEqual(stack.pop_many(3), [2, 1, 0])
+        self.assertTrue(stack.is_empty())
+
+    def test_stores_none(self) -> None:
+        self.stack.push(None)
+        self.assertEqual(len(self.stack), 1)
+        self.assertIsNone(self.stack.pop())
+        with self.assertRaises(StackEmptyException):
+            self.stack.pop()
+
+
+class ConcurrentStackTest(unittest.TestCase):
+    def test_push_and_pop(self) -> None:
+        stack: ConcurrentStack[int] = ConcurrentStack()
+        stack.push(1)
+        stack.push(2)
+        self.assertEqual(stack.peek(), 2)
+        self.assertEqual(stack.pop(), 2)
+        self.assertEqual(stack.pop_or_none(), 1)
+        self.assertIsNone(stack.pop_or_none())
+        self.assertFalse(stack)
+        self.assertEqual(stack.capacity, 0)
+
+    def test_pop_times_out(self) -> None:
+        stack: ConcurrentStack[int] = ConcurrentStack()
+        with self.assertRaises(StackEmptyException):
+            stack.pop(block=False)
+        with self.assertRaises(StackEmptyException):
+            stack.pop(timeout=0.01)
+
+    def test_pop_waits_for_push(self) -> None:
+        stack: ConcurrentStack[int] = ConcurrentStack()
+        timer: threading.Timer = threading.Timer(0.01, stack.push, (1,))
+        timer.start()
+        self.assertEqual(stack.pop(timeout=5), 1)
+        timer.join()
+
+    def test_bounded_push_blocks(self) -> None:
+        stack: ConcurrentStack[int] = ConcurrentStack(capacity=1)
+        self.assertEqual(stack.capacity, 1)
+        stack.push(1)
+        with self.assertRaises(StackOverflowException):
+            stack.push(2, block=False)
+        with self.assertRaises(StackOverflowException):
+            stack.push(2, timeout=0.01)
+
+        timer: threading.Timer = threading.Timer(0.01, stack.pop)
+        timer.start()
+        stack.push(3, timeout=5)
+        timer.join()
+        self.assertEqual(stack.pop(), 3)
+
+    def test_none_values(self) -> None:
+        stack: ConcurrentStack[Optional[int]] = ConcurrentStack()
+        stack.push(None)
+        stack.push(None)
+        self.assertIsNone(stack.pop(block=False))
+        self.assertEqual(len(stack), 1)
+        self.assertIsNone(stack.pop_or_none())
+        self.assertFalse(stack)
+        with self.assertRaises(StackEmptyException):
+            stack.pop(block=False)
+
+    def test_pop_or_none_of_none_makes_room(self) -> None:
+        stack: ConcurrentStack[Optional[int]] = ConcurrentStack(capacity=1)
+        stack.push(None)
+        timer: threading.Timer = threading.Timer(0.01, stack.pop_or_none)
+        timer.start()
+        stack.push(1, timeout=5)
+        timer.join()
+        self.assertEqual(stack.pop(), 1)
+
+    def test_producers_and_consumers(self) -> None:
+        stack: ConcurrentStack[int] = ConcurrentStack(capacity=4)
+        producers: int = 4
+        n: int = 1000
+        popped: List[int] = []
+
+        def produce(start: int) -> None:
+            for value in range(start, start + n):
+                stack.push(value, timeout=5)
+
+        def consume() -> None:
+            for _ in range(n):
+                popped.append(stack.pop(timeout=5))
+
+        threads: List[threading.Thread] = [
+            threading.Thread(target=produce, args=(i * n,)) for i in range(producers)
+        ]
+        threads.extend(threading.Thread(target=consume) for _ in range(producers))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(popped), list(range(producers * n)))
+        self.assertTrue(stack.is_empty())
+
+
+class NodeTest(unittest.TestCase):
+    def test_nodes_are_slotted(self) -> None:
+        for node in (DoubleNode(1), SingleNode(1)):
+            self.assertFalse(hasattr(node, "__dict__"))
+            with self.assertRaises(AttributeError):
+                setattr(node, "extra", 1)
+
+
 class BracesTest(unittest.TestCase):
     def test_is_valid_braces_sequence(self) -> None:
         self.assertTrue(is_valid_braces_sequence("()"))
@@ -238,6 +680,89 @@ class BracesTest(unittest.TestCase):
         self.assertFalse(is_valid_braces_sequence("()[]{}("))
         self.assertTrue(is_valid_braces_sequence("([{()[]{}}])"))
 
+    def test_is_valid_braces_sequence_matches_stack_walk(self) -> None:
+        random: Random = Random(5)
+        matches: Dict[str, str] = {")": "(", "}": "{", "]": "["}
+        for _ in range(500):
+            braces: str = "".join(random.choices("(){}[]", k=random.randint(0, 12)))
+            stack: List[str] = []
+            expected: bool = True
+            for brace in braces:
+                if brace in "([{":
+                    stack.append(brace)
+                elif not stack or stack.pop() != matches[brace]:
+                    expected = False
+                    break
+            expected = expected and not stack
+
+            self.assertEqual(is_valid_braces_sequence(braces), expected, braces)
+            self.assertEqual(is_valid_braces_sequence(list(braces)), expected, braces)
+
+    def test_is_valid_braces_sequence_rejects_other_values(self) -> None:
+        self.assertFalse(is_valid_braces_sequence("(a)"))
+        self.assertFalse(is_valid_braces_sequence("(\n)"))
+        self.assertFalse(is_valid_braces_sequence(["()"]))
+        self.assertFalse(is_valid_braces_sequence(["(", "", ")"]))
+        self.assertTrue(is_valid_braces_sequence(["(", ")"]))
+
+    def test_find_unbalanced_brace(self) -> None:
+        self.assertIsNone(find_unbalanced_brace('{"a": [1, (2)], "b": {}}'))
+        self.assertEqual(find_unbalanced_brace("ab)"), 2)
+        self.assertEqual(find_unbalanced_brace("x(a[b)c]"), 5)
+        self.assertEqual(find_unbalanced_brace(["a(b", "[c", "]"]), 1)
+        self.assertEqual(find_unbalanced_brace(io.StringIO("(" * 10 + ")" * 11), 3), 20)
+
+    def test_find_unbalanced_brace_matches_stack_walk(self) -> None:
+        random: Random = Random(9)
+        for _ in range(300):
+            text: str = "".join(random.choices("(){}[]ab", k=random.randint(0, 40)))
+            if random.random() < 0.5:
+                text = self._balanced(random, random.randint(0, 20)) + text[:2]
+            cuts: List[int] = sorted(random.sample(range(len(text) + 1), min(3, len(text) + 1)))
+            chunks: List[str] = [text[i:j] for i, j in zip([0, *cuts], [*cuts, len(text)])]
+
+            expected: Optional[int] = self._first_offence(text)
+            self.assertEqual(find_unbalanced_brace(chunks), expected, text)
+
+            summary: BraceSummary = BraceSummary()
+            for chunk, start in zip(chunks, [0, *cuts]):
+                scanner: BraceScanner = BraceScanner(start, defer_closing=True)
+                scanner.feed(chunk)
+                combine_summaries(summary, scanner.summary)
+            self.assertEqual(summary.offence(), expected, text)
+
+    def test_find_unbalanced_brace_in_file(self) -> None:
+        random: Random = Random(3)
+        text: str = "".join(self._balanced(random, 50) + "é" for _ in range(200))
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "braces.txt")
+            for content in (text, text + ")", text[:-40] + "]" + text[-40:], "(" + text):
+                with open(path, "w", encoding="utf-8") as file:
+                    file.write(content)
+                expected: Optional[int] = self._first_offence(content)
+                if expected is not None:
+                    expected = len(content[:expected].encode("utf-8"))
+                self.assertEqual(
+                    find_unbalanced_brace_in_file(path, jobs=3, chunk_size=64), expected
+                )
+
+    def _balanced(self, random: Random, pairs: int) -> str:
+        text: str = ""
+        for _ in range(pairs):
+            opening, closing = random.choice(("()", "[]", "{}"))
+            text = random.choice((opening + text + closing, text + opening + closing))
+        return text
+
+    def _first_offence(self, text: str) -> Optional[int]:
+        matches: Dict[str, str] = {")": "(", "}": "{", "]": "["}
+        stack: List[int] = []
+        for offset, char in enumerate(text):
+            if char in "([{":
+                stack.append(offset)
+            elif char in matches and (not stack or text[stack.pop()] != matches[char]):
+                return offset
+        return stack[0] if stack else None
+
 
 if __name__ == "__main__":
     unittest.main()
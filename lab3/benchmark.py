@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from random import randint, sample
 from typing import List
 
 from common import benchmark
@@ -8,7 +7,7 @@ from common.benchmark import Benchmark, BenchmarkCallback
 from common.extra_typing import override
 from lab3.serializers.ordered_binary_tree_serializer import OrderedBinaryTreeSerializer
 from lab3.trees.avl_tree import AVLTree
-from lab3.trees.ordered_binary_tree import IOrderedBinaryTree
+from lab3.trees.ordered_binary_tree import IOrderedBinaryTree, TraversalType
 from lab3.trees.ternary_trie import TernaryTrie
 from lab3.trees.trie import ITrie
 
@@ -20,13 +19,18 @@ class AVLTreeBenchmark(Benchmark):
         self.n: int = 100000
 
     def benchmark_insert(self) -> BenchmarkCallback:
+        values: List[int] = self.fixtures.integers(self.n, 0, self.n)
+        index: int = 0
+
         def callback() -> None:
-            self.tree.insert(randint(0, self.n))
+            nonlocal index
+            self.tree.insert(values[index])
+            index += 1
 
         return callback, self.n
 
     def benchmark_delete(self) -> BenchmarkCallback:
-        values: List[int] = sample(range(self.n), self.n)
+        values: List[int] = self.fixtures.permutation(self.n)
         index: int = 0
 
         for value in values:
@@ -43,11 +47,58 @@ class AVLTreeBenchmark(Benchmark):
         for i in range(self.n):
             self.tree.insert(i)
 
+        values: List[int] = self.fixtures.integers(self.n, 0, self.n)
+        index: int = 0
+
         def callback() -> None:
-            self.tree.contains(randint(0, self.n))
+            nonlocal index
+            self.tree.contains(values[index])
+            index += 1
 
         return callback, self.n
 
+    def benchmark_select(self) -> BenchmarkCallback:
+        tree: AVLTree[int] = AVLTree.from_sorted(range(self.n))
+        indices: List[int] = self.fixtures.integers(self.n, 0, self.n - 1)
+        index: int = 0
+
+        def callback() -> None:
+            nonlocal index
+            tree.select(indices[index])
+            index += 1
+
+        return callback, self.n
+
+    def benchmark_count_range(self) -> BenchmarkCallback:
+        tree: AVLTree[int] = AVLTree.from_sorted(range(self.n))
+        lows: List[int] = self.fixtures.integers(self.n, 0, self.n)
+        index: int = 0
+
+        def callback() -> None:
+            nonlocal index
+            tree.count_range(lows[index], lows[index] + 1000)
+            index += 1
+
+        return callback, self.n
+
+    def benchmark_in_order(self) -> BenchmarkCallback:
+        for value in self.fixtures.permutation(self.n):
+            self.tree.insert(value)
+
+        def callback() -> None:
+            for _ in self.tree.generator(TraversalType.IN_ORDER):
+                pass
+
+        return callback, 1, self.n
+
+    def benchmark_from_sorted(self) -> BenchmarkCallback:
+        values: List[int] = [*range(self.n)]
+
+        def callback() -> None:
+            AVLTree.from_sorted(values)
+
+        return callback, 1, self.n
+
 
 class AVLTreeStateHydratedBenchmark(Benchmark):
     @override
@@ -65,8 +116,8 @@ class AVLTreeStateHydratedBenchmark(Benchmark):
             pass
 
     def benchmark_file_save(self) -> BenchmarkCallback:
-        for i in range(self.n):
-            self.tree.insert(randint(0, self.n))
+        for value in self.fixtures.integers(self.n, 0, self.n):
+            self.tree.insert(value)
 
         self.n = 1
 
@@ -76,8 +127,8 @@ class AVLTreeStateHydratedBenchmark(Benchmark):
         return callback, self.n
 
     def benchmark_file_load(self) -> BenchmarkCallback:
-        for i in range(self.n):
-            self.tree.insert(randint(0, self.n))
+        for value in self.fixtures.integers(self.n, 0, self.n):
+            self.tree.insert(value)
 
         OrderedBinaryTreeSerializer.save_tree_to_file(self.tree, "data.json")
         self.tree.clear()
@@ -95,22 +146,24 @@ class TernaryTrieBenchmark(Benchmark):
         self.trie: ITrie[str, int] = TernaryTrie()
         self.n: int = 100000
 
-    def _rand_string(self, n: int) -> str:
-        return "".join([chr(randint(97, 122)) for _ in range(n)])
-
     def benchmark_insert(self) -> BenchmarkCallback:
+        keys: List[str] = self.fixtures.strings(self.n, 10)
+        values: List[int] = self.fixtures.integers(self.n, 0, self.n)
+        index: int = 0
 
         def callback() -> None:
-            self.trie.put(self._rand_string(10), randint(0, self.n))
+            nonlocal index
+            self.trie.put(keys[index], values[index])
+            index += 1
 
         return callback, self.n
 
     def benchmark_delete(self) -> BenchmarkCallback:
-        keys: List[str] = [self._rand_string(10) for _ in range(self.n)]
+        keys: List[str] = self.fixtures.strings(self.n, 10)
         index: int = 0
 
-        for key in keys:
-            self.trie.put(key, randint(0, self.n))
+        for key, value in zip(keys, self.fixtures.integers(self.n, 0, self.n)):
+            self.trie.put(key, value)
 
         def callback() -> None:
             nonlocal index
@@ -120,13 +173,18 @@ class TernaryTrieBenchmark(Benchmark):
         return callback, self.n
 
     def benchmark_contains(self) -> BenchmarkCallback:
-        keys: List[str] = [self._rand_string(10) for _ in range(self.n)]
+        keys: List[str] = self.fixtures.strings(self.n, 10)
+
+        for key, value in zip(keys, self.fixtures.integers(self.n, 0, self.n)):
+            self.trie.put(key, value)
 
-        for key in keys:
-            self.trie.put(key, randint(0, self.n))
+        queries: List[str] = self.fixtures.random.choices(keys, k=self.n)
+        index: int = 0
 
         def callback() -> None:
-            self.trie.contains(keys[randint(0, self.n - 1)])
+            nonlocal index
+            self.trie.contains(queries[index])
+            index += 1
 
         return callback, self.n
 
@@ -20,15 +20,19 @@ class OrderedBinaryTreeSerializer:
 
     @staticmethod
     def load_tree_from_file(tree: IOrderedBinaryTree[T], filename: str, data_type: Type[T]) -> None:
-        tree.clear()
         with open(filename, "r", encoding="utf-8") as f:
             data: List[Union[Dict[str, Any], T]] = json.load(f)
             nodes: List[T] = [
                 OrderedBinaryTreeSerializer.dict_to_node(d, data_type) if isinstance(d, dict) else d
                 for d in data
             ]
-        for item in nodes:
-            tree.insert(item)
+        try:
+            tree.load_pre_order(nodes)
+        except ValueError:
+            # Not a pre-order this tree can take as is, e.g. an unbalanced SearchTree for an AVLTree
+            tree.clear()
+            for item in nodes:
+                tree.insert(item)
 
     @staticmethod
     def node_to_dict(node: T) -> OrderedBinaryTreeSerializer._Result[T]:
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import bisect
+import json
+import random
+import sys
 import unittest
 from dataclasses import dataclass
 from functools import total_ordering
-from typing import Any, List, Tuple
+from typing import Any, Callable, List, Optional, Tuple
 
 from common.extra_typing import override
+from common.metrics import ClassMetrics, registry
 from lab3.serializers.ordered_binary_tree_serializer import OrderedBinaryTreeSerializer
-from lab3.trees.avl_tree import AVLTree
+from lab3.trees.avl_tree import AVLNode, AVLTree
 from lab3.trees.ordered_binary_tree import (
     IOrderedBinaryTree,
     OrderedBinaryTreeEmptyException,
@@ -164,6 +169,19 @@ class SearchTreeTest(unittest.TestCase):
         self.assertListEqual(in_order, [-1, 1, 2, 3, 4, 5])
         self.assertListEqual(post_order, [-1, 2, 4, 5, 3, 1])
 
+    def test_degenerate_tree(self) -> None:
+        n: int = 5 * sys.getrecursionlimit()
+        for value in range(n):
+            self.tree.insert(value)
+        self.assertTrue(self.tree.contains(n - 1))
+        self.assertEqual(self.tree.find_max(), n - 1)
+        self.assertListEqual(_get_in_order_tree(self.tree), [*range(n)])
+        self.assertListEqual(_get_post_order_tree(self.tree), [*range(n - 1, -1, -1)])
+        self.assertEqual(str(self.tree).count("\n"), n + 1)
+        for value in range(0, n, 2):
+            self.tree.delete(value)
+        self.assertListEqual(_get_pre_order_tree(self.tree), [*range(1, n, 2)])
+
 
 class AVLTreeTest(unittest.TestCase):
     @override
@@ -314,6 +332,186 @@ class AVLTreeTest(unittest.TestCase):
         self.assertListEqual(post_order, [-1, 2, 1, 4, 5, 3])
 
 
+class TreeMetricsTest(unittest.TestCase):
+    def test_avl_tree_metrics(self) -> None:
+        init: Callable[..., None] = AVLTree.__init__
+        left_rotate: object = AVLTree.__dict__["_left_rotate"]
+        built_before: AVLTree[int] = AVLTree.from_sorted(range(7))
+        registry.enable()
+        try:
+            registry.reset()
+            tree: AVLTree[int] = AVLTree()
+            for value in range(1, 8):
+                tree.insert(value)
+            tree.delete(1)
+            tree.contains(4)
+            untracked: ClassMetrics = registry.snapshot()["AVLTree"]
+            registry.track(built_before)
+            metrics: ClassMetrics = registry.snapshot()["AVLTree"]
+        finally:
+            registry.disable()
+
+        self.assertEqual(untracked.instances, 1)
+        self.assertEqual(metrics.instances, 2)
+        self.assertDictEqual(metrics.operations, {"insert": 7, "delete": 1, "contains": 1})
+        self.assertEqual(metrics.events["rotations"], 4)
+        self.assertEqual(metrics.gauges["size"].total, 13)
+        self.assertEqual(metrics.gauges["height"].max, 3)
+        self.assertIs(AVLTree.__init__, init)
+        self.assertIs(AVLTree.insert, SearchTree.insert)
+        self.assertIs(AVLTree.__dict__["_left_rotate"], left_rotate)
+        self.assertNotIn("insert", AVLTree.__dict__)
+        self.assertRaises(ValueError, registry.track, SearchTree())
+
+    def test_ternary_trie_metrics(self) -> None:
+        put: Callable[..., None] = TernaryTrie.put
+        registry.enable()
+        try:
+            registry.reset()
+            trie: TernaryTrie[str, int] = TernaryTrie()
+            trie.put("she", 1)
+            trie.put("sells", 2)
+            trie.put("sea", 3)
+            trie.get_or_none("sea")
+            trie.delete("she")
+            metrics: ClassMetrics = registry.snapshot()["TernaryTrie"]
+        finally:
+            registry.disable()
+
+        self.assertEqual(metrics.instances, 1)
+        # delete looks the key up through get_or_none
+        self.assertDictEqual(metrics.operations, {"put": 3, "get_or_none": 2, "delete": 1})
+        self.assertEqual(metrics.gauges["keys"].max, 2)
+        self.assertEqual(metrics.gauges["nodes"].max, trie._count_nodes())
+        self.assertGreaterEqual(metrics.gauges["nodes"].max, len("sells") + 1)
+        self.assertIs(TernaryTrie.put, put)
+
+
+class OrderStatisticTest(unittest.TestCase):
+    @override
+    def setUp(self) -> None:
+        self.tree: AVLTree[int] = AVLTree()
+
+    def _assert_sizes(self, node: Optional[AVLNode[int]]) -> int:
+        if node is None:
+            return 0
+        size: int = self._assert_sizes(node.left) + self._assert_sizes(node.right) + 1
+        self.assertEqual(node.size, size)
+        return size
+
+    def test_rank(self) -> None:
+        self.assertEqual(self.tree.rank(1), 0)
+        for value in (10, 20, 30, 40):
+            self.tree.insert(value)
+        self.assertEqual(self.tree.rank(5), 0)
+        self.assertEqual(self.tree.rank(10), 0)
+        self.assertEqual(self.tree.rank(25), 2)
+        self.assertEqual(self.tree.rank(40), 3)
+        self.assertEqual(self.tree.rank(50), 4)
+
+    def test_select(self) -> None:
+        self.assertRaises(IndexError, self.tree.select, 0)
+        for value in (30, 10, 40, 20):
+            self.tree.insert(value)
+        self.assertListEqual([self.tree.select(i) for i in range(4)], [10, 20, 30, 40])
+        self.assertRaises(IndexError, self.tree.select, -1)
+        self.assertRaises(IndexError, self.tree.select, 4)
+
+    def test_count_range(self) -> None:
+        for value in (10, 20, 30, 40):
+            self.tree.insert(value)
+        self.assertEqual(self.tree.count_range(10, 40), 4)
+        self.assertEqual(self.tree.count_range(15, 30), 2)
+        self.assertEqual(self.tree.count_range(20, 20), 1)
+        self.assertEqual(self.tree.count_range(21, 29), 0)
+        self.assertEqual(self.tree.count_range(40, 10), 0)
+
+    def test_sizes_follow_updates(self) -> None:
+        generator: random.Random = random.Random(7)
+        values: List[int] = []
+        for _ in range(500):
+            value: int = generator.randrange(200)
+            if generator.random() < 0.6:
+                self.tree.insert(value)
+                if value not in values:
+                    bisect.insort(values, value)
+            else:
+                self.tree.delete(value)
+                if value in values:
+                    values.remove(value)
+            self.assertEqual(self._assert_sizes(self.tree._root), len(values))
+
+        for index, value in enumerate(values):
+            self.assertEqual(self.tree.select(index), value)
+            self.assertEqual(self.tree.rank(value), index)
+        self.assertEqual(self.tree.count_range(50, 150), sum(50 <= v <= 150 for v in values))
+
+    def test_sizes_after_bulk_load(self) -> None:
+        tree: AVLTree[int] = AVLTree.from_sorted(range(100))
+        self._assert_sizes(tree._root)
+        self.assertEqual(tree.select(42), 42)
+        tree.load_pre_order([3, 1, -1, 2, 5, 4])
+        self._assert_sizes(tree._root)
+        self.assertEqual(tree.count_range(0, 4), 4)
+
+
+class BulkLoadTest(unittest.TestCase):
+    def _assert_balanced(self, node: Optional[AVLNode[int]]) -> int:
+        if node is None:
+            return -1
+        left: int = self._assert_balanced(node.left)
+        right: int = self._assert_balanced(node.right)
+        self.assertLessEqual(abs(left - right), 1)
+        self.assertEqual(node.height, 1 + max(left, right))
+        return node.height
+
+    def test_from_sorted(self) -> None:
+        for n in (0, 1, 2, 7, 8, 100):
+            tree: AVLTree[int] = AVLTree.from_sorted(range(n))
+            self.assertEqual(tree.size, n)
+            self.assertListEqual(_get_in_order_tree(tree), [*range(n)])
+            self.assertEqual(self._assert_balanced(tree._root), n.bit_length() - 1)
+        tree.insert(100)
+        tree.delete(0)
+        self.assertEqual(self._assert_balanced(tree._root), 6)
+
+    def test_from_sorted_unsorted(self) -> None:
+        self.assertRaises(ValueError, AVLTree.from_sorted, [1, 3, 2])
+        self.assertRaises(ValueError, SearchTree.from_sorted, [1, 1])
+
+    def test_from_iterable(self) -> None:
+        tree: AVLTree[int] = AVLTree.from_iterable([5, 3, 5, 1, 4, 1, 2])
+        self.assertEqual(tree.size, 5)
+        self.assertListEqual(_get_pre_order_tree(tree), [3, 2, 1, 5, 4])
+        self._assert_balanced(tree._root)
+        self.assertListEqual(_get_in_order_tree(SearchTree.from_iterable([2, 2, 1])), [1, 2])
+
+    def test_load_pre_order(self) -> None:
+        values: List[int] = [3, 1, -1, 2, 5, 4]
+        trees: List[IOrderedBinaryTree[int]] = [SearchTree(), AVLTree()]
+        for tree in trees:
+            tree.insert(0)
+            tree.load_pre_order(values)
+            self.assertEqual(tree.size, 6)
+            self.assertListEqual(_get_pre_order_tree(tree), values)
+            self.assertListEqual(_get_in_order_tree(tree), sorted(values))
+
+        chain: SearchTree[int] = SearchTree()
+        chain.load_pre_order([4, 1, 2, 3, 5])
+        self.assertListEqual(_get_post_order_tree(chain), [3, 2, 1, 5, 4])
+
+    def test_load_pre_order_invalid(self) -> None:
+        for values in ([3, 1, 2, 0], [2, 1, 3, 1], [1, 1]):
+            tree: SearchTree[int] = SearchTree()
+            self.assertRaises(ValueError, tree.load_pre_order, values)
+            self.assertEqual(tree.size, 0)
+
+        avl: AVLTree[int] = AVLTree()
+        self.assertRaises(ValueError, avl.load_pre_order, [1, 2, 3])
+        self.assertEqual(avl.size, 0)
+        self.assertIsNone(avl._root)
+
+
 class TreeStateSaveTest(unittest.TestCase):
     @dataclass
     @total_ordering
@@ -412,6 +610,25 @@ class TreeStateSaveTest(unittest.TestCase):
             ],
         )
 
+    def test_search_tree_file_in_avl_tree(self) -> None:
+        search_tree: IOrderedBinaryTree[int] = SearchTree()
+        for value in (1, 2, 3, 4):
+            search_tree.insert(value)
+        OrderedBinaryTreeSerializer.save_tree_to_file(search_tree, "search_tree.json")
+        tree: IOrderedBinaryTree[int] = AVLTree()
+        OrderedBinaryTreeSerializer.load_tree_from_file(tree, "search_tree.json", int)
+        self.assertEqual(tree.size, 4)
+        self.assertListEqual(_get_pre_order_tree(tree), [2, 1, 3, 4])
+
+    def test_file_not_in_pre_order(self) -> None:
+        with open("search_tree.json", "w", encoding="utf-8") as f:
+            json.dump([3, 1, 2, 1], f)
+        for tree in (SearchTree[int](), AVLTree[int]()):
+            tree.insert(10)
+            OrderedBinaryTreeSerializer.load_tree_from_file(tree, "search_tree.json", int)
+            self.assertEqual(tree.size, 3)
+            self.assertListEqual(_get_in_order_tree(tree), [1, 2, 3])
+
 
 class TernaryTrieStrTest(unittest.TestCase):
     @override
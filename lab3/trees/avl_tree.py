@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Final, Generic, Optional, cast
+from typing import Final, Generic, List, Optional
 
 from common.extra_typing import contravariant_args, override
+from common.metrics import registry
 from lab3.trees.ordered_binary_tree import BinaryNode, T
 from lab3.trees.search_tree import SearchTree
 
@@ -11,6 +12,8 @@ from lab3.trees.search_tree import SearchTree
 @dataclass
 class AVLNode(BinaryNode[T], Generic[T]):
     height: int = 0
+    # Number of nodes in the subtree rooted here
+    size: int = 1
     left: Optional[AVLNode[T]] = None
     right: Optional[AVLNode[T]] = None
 
@@ -26,6 +29,12 @@ class AVLTree(SearchTree[T], Generic[T]):
     def _update_height(self, node: AVLNode[T]) -> None:
         node.height = max(self._get_height(node.left), self._get_height(node.right)) + 1
 
+    def _get_size(self, node: Optional[AVLNode[T]]) -> int:
+        return 0 if node is None else node.size
+
+    def _update_size(self, node: AVLNode[T]) -> None:
+        node.size = self._get_size(node.left) + self._get_size(node.right) + 1
+
     def _get_balance(self, node: Optional[AVLNode[T]]) -> int:
         return 0 if node is None else self._get_height(node.right) - self._get_height(node.left)
 
@@ -42,6 +51,8 @@ class AVLTree(SearchTree[T], Generic[T]):
         node.right.right = right
         self._update_height(node.right)
         self._update_height(node)
+        self._update_size(node.right)
+        self._update_size(node)
 
     def _left_rotate(self, node: AVLNode[T]) -> None:
         assert node.right is not None
@@ -53,6 +64,8 @@ class AVLTree(SearchTree[T], Generic[T]):
         node.left.left = left
         self._update_height(node.left)
         self._update_height(node)
+        self._update_size(node.left)
+        self._update_size(node)
 
     def _balance(self, node: AVLNode[T]) -> None:
         balance: Final[int] = self._get_balance(node)
@@ -69,29 +82,89 @@ class AVLTree(SearchTree[T], Generic[T]):
             self._left_rotate(node)
 
     @override
-    def insert(self, value: T) -> None:
-        node: Final[AVLNode[T]] = AVLNode(value)
-        if self._root is None:
-            self._root = node
-            self._size += 1
-        else:
-            self._insert(self._root, node)
+    def _create_node(self, value: T) -> AVLNode[T]:
+        return AVLNode(value)
 
     @override
     @contravariant_args
-    def _insert(self, parent: AVLNode[T], new_node: AVLNode[T]) -> None:  # type: ignore[override]
-        super()._insert(parent, new_node)  # indirect recursion
-
-        self._update_height(parent)
-        self._balance(parent)
+    def _on_load(self, nodes: List[AVLNode[T]]) -> None:  # type: ignore[override]
+        # Children come after their parent, so backwards every node sees its children's heights
+        for node in reversed(nodes):
+            left: int = -1
+            right: int = -1
+            size: int = 1
+            if node.left is not None:
+                left = node.left.height
+                size += node.left.size
+            if node.right is not None:
+                right = node.right.height
+                size += node.right.size
+            if right - left > 1 or left - right > 1:
+                self.clear()
+                raise ValueError(f"Subtree at {node.value} is not balanced")
+            node.height = (left if left > right else right) + 1
+            node.size = size
 
     @override
     @contravariant_args
-    def _delete(self, parent: Optional[AVLNode[T]], value: T) -> Optional[AVLNode[T]]:  # type: ignore[override]
-        parent = cast(Optional[AVLNode[T]], super()._delete(parent, value))  # indirect recursion
-
-        if parent is not None:
-            self._update_height(parent)
-            self._balance(parent)
-
-        return parent
+    def _retrace(self, path: List[AVLNode[T]]) -> None:  # type: ignore[override]
+        # Rotations swap values, so every node on the path stays the root of its subtree.
+        # Rebalancing stops once a height is unchanged, but every size on the path is off by one
+        rebalancing: bool = True
+        for node in reversed(path):
+            if rebalancing:
+                height: int = node.height
+                self._update_height(node)
+                self._balance(node)
+                rebalancing = node.height != height
+            left: Optional[AVLNode[T]] = node.left
+            right: Optional[AVLNode[T]] = node.right
+            node.size = (
+                (0 if left is None else left.size) + (0 if right is None else right.size) + 1
+            )
+
+    def rank(self, value: T) -> int:
+        """Returns how many values are less than `value`, in O(log n)."""
+        return self._count_before(value, inclusive=False)
+
+    def select(self, index: int) -> T:
+        """Returns the value at `index` in sorted order, in O(log n)."""
+        if index < 0 or index >= self._size:
+            raise IndexError("Index out of range")
+
+        node: Optional[AVLNode[T]] = self._root
+        while node is not None:
+            left: int = self._get_size(node.left)
+            if index < left:
+                node = node.left
+            elif index > left:
+                index -= left + 1
+                node = node.right
+            else:
+                return node.value
+        raise AssertionError("Subtree sizes are out of sync")
+
+    def count_range(self, low: T, high: T) -> int:
+        """Returns how many values lie in `[low, high]`, in O(log n)."""
+        if high < low:
+            return 0
+        return self._count_before(high, inclusive=True) - self._count_before(low, inclusive=False)
+
+    def _count_before(self, value: T, inclusive: bool) -> int:
+        count: int = 0
+        node: Optional[AVLNode[T]] = self._root
+        while node is not None:
+            if node.value < value or (inclusive and not value < node.value):
+                count += 1 if node.left is None else node.left.size + 1
+                node = node.right
+            else:
+                node = node.left
+        return count
+
+
+registry.register(
+    AVLTree,
+    operations=("insert", "delete", "contains"),
+    events={"rotations": ("_left_rotate", "_right_rotate")},
+    gauges={"size": len, "height": lambda tree: tree._get_height(tree._root) + 1},
+)
@@ -3,7 +3,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Callable, Generic, Iterator, Optional, TypeVar
+from typing import Callable, Generic, Iterable, Iterator, Optional, TypeVar
 
 from common.comparable import Comparable
 
@@ -59,6 +59,12 @@ class IOrderedBinaryTree(ABC, Generic[T]):
     @abstractmethod
     def generator(self, traverse_type: TraversalType = TraversalType.IN_ORDER) -> Iterator[T]: ...
 
+    def load_pre_order(self, values: Iterable[T]) -> None:
+        """Replaces the contents with `values`, listed in pre-order as `generator` yields them."""
+        self.clear()
+        for value in values:
+            self.insert(value)
+
     @abstractmethod
     def __str__(self) -> str: ...
 
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import Callable, Final, Generic, Iterator, List, Optional
+from itertools import islice, pairwise
+from typing import Callable, Final, Generic, Iterable, Iterator, List, Optional, Tuple
 
-from common.extra_typing import contravariant_args, override
+from common.extra_typing import Self, override
 from lab3.trees.ordered_binary_tree import (
     BinaryNode,
     IOrderedBinaryTree,
@@ -22,83 +23,166 @@ class SearchTree(IOrderedBinaryTree[T], Generic[T]):
     def size(self) -> int:
         return self._size
 
+    @classmethod
+    def from_sorted(cls, values: Iterable[T]) -> Self:
+        """Builds a perfectly balanced tree from strictly increasing values in O(n)."""
+        tree: Final[Self] = cls()
+        nodes: Final[List[BinaryNode[T]]] = [tree._create_node(value) for value in values]
+        for previous, following in pairwise(nodes):
+            if not previous.value < following.value:
+                raise ValueError("Values must be strictly increasing")
+
+        # Middle of every range becomes its root; ranges are taken parents first
+        order: Final[List[BinaryNode[T]]] = []
+        ranges: List[Tuple[int, int]] = [(0, len(nodes))] if nodes else []
+        while ranges:
+            start, stop = ranges.pop()
+            middle: int = (start + stop) // 2
+            node: BinaryNode[T] = nodes[middle]
+            order.append(node)
+            if start < middle:
+                node.left = nodes[(start + middle) // 2]
+                ranges.append((start, middle))
+            if middle + 1 < stop:
+                node.right = nodes[(middle + 1 + stop) // 2]
+                ranges.append((middle + 1, stop))
+
+        tree._root = order[0] if order else None
+        tree._size = len(nodes)
+        tree._on_load(order)
+        return tree
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[T]) -> Self:
+        """Sorts and deduplicates `values`, then builds a balanced tree in O(n log n)."""
+        sorted_values: Final[List[T]] = sorted(values)
+        return cls.from_sorted(
+            value for i, value in enumerate(sorted_values) if i == 0 or sorted_values[i - 1] < value
+        )
+
+    @override
+    def load_pre_order(self, values: Iterable[T]) -> None:
+        """Rebuilds the exact tree `values` were listed from, in O(n) and without rebalancing.
+
+        Raises ValueError, leaving the tree empty, if `values` is not a search tree pre-order.
+        """
+        self.clear()
+        nodes: Final[List[BinaryNode[T]]] = [self._create_node(value) for value in values]
+        # Nodes still able to take a right child, and the value everything next must exceed
+        stack: List[BinaryNode[T]] = nodes[:1]
+        lower: Optional[T] = None
+
+        for node in islice(nodes, 1, None):
+            value: T = node.value
+            if value < stack[-1].value and (lower is None or lower < value):
+                stack[-1].left = node
+            else:
+                parent: Optional[BinaryNode[T]] = None
+                while stack and stack[-1].value < value:
+                    parent = stack.pop()
+                if parent is None or (stack and not value < stack[-1].value):
+                    raise ValueError(f"{value} breaks the search tree pre-order")
+                parent.right = node
+                lower = parent.value
+            stack.append(node)
+
+        self._root = nodes[0] if nodes else None
+        self._size = len(nodes)
+        self._on_load(nodes)
+
+    def _on_load(self, nodes: List[BinaryNode[T]]) -> None:
+        """Called after `nodes` were linked in bulk, each listed after its parent."""
+
+    def _create_node(self, value: T) -> BinaryNode[T]:
+        return BinaryNode(value)
+
     @override
     def insert(self, value: T) -> None:
-        node: Final[BinaryNode[T]] = BinaryNode(value)
         if self._root is None:
-            self._root = node
+            self._root = self._create_node(value)
             self._size += 1
+            return
+
+        path: List[BinaryNode[T]] = []
+        node: Optional[BinaryNode[T]] = self._root
+        while node is not None:
+            path.append(node)
+            if value > node.value:
+                node = node.right
+            elif value < node.value:
+                node = node.left
+            else:
+                return
+
+        parent: Final[BinaryNode[T]] = path[-1]
+        if value > parent.value:
+            parent.right = self._create_node(value)
         else:
-            self._insert(self._root, node)
-
-    @contravariant_args
-    def _insert(self, parent: BinaryNode[T], new_node: BinaryNode[T]) -> None:
-        if new_node.value > parent.value:
-            if parent.right is None:
-                parent.right = new_node
-                self._size += 1
-            self._insert(parent.right, new_node)
-        elif new_node.value < parent.value:
-            if parent.left is None:
-                parent.left = new_node
-                self._size += 1
-            self._insert(parent.left, new_node)
+            parent.left = self._create_node(value)
+        self._size += 1
+        self._retrace(path)
+
+    def _retrace(self, path: List[BinaryNode[T]]) -> None:
+        """Called with the root-to-parent path of the node that was linked or unlinked."""
 
     @override
     def contains(self, value: T) -> bool:
-        return self._contains(self._root, value)
-
-    def _contains(self, node: Optional[BinaryNode[T]], value: T) -> bool:
-        if node is None:
-            return False
-        if node.value == value:
-            return True
-        return self._contains(node.right if value > node.value else node.left, value)
+        node: Optional[BinaryNode[T]] = self._root
+        while node is not None:
+            if node.value == value:
+                return True
+            node = node.right if value > node.value else node.left
+        return False
 
     @override
     def find_max(self) -> T:
-        return self._find_max(self._root)
-
-    def _find_max(self, node: Optional[BinaryNode[T]]) -> T:
-        if node is None:
+        if self._root is None:
             raise OrderedBinaryTreeEmptyException("Tree is empty")
-        if node.right is None:
-            return node.value
-        return self._find_max(node.right)
+        return self._find_max_node(self._root).value
+
+    def _find_max_node(self, node: BinaryNode[T]) -> BinaryNode[T]:
+        while node.right is not None:
+            node = node.right
+        return node
 
     @override
     def find_min(self) -> T:
-        return self._find_min(self._root)
-
-    def _find_min(self, node: Optional[BinaryNode[T]]) -> T:
+        node: Optional[BinaryNode[T]] = self._root
         if node is None:
             raise OrderedBinaryTreeEmptyException("Tree is empty")
-        if node.left is None:
-            return node.value
-        return self._find_min(node.left)
+        while node.left is not None:
+            node = node.left
+        return node.value
 
     @override
     def delete(self, value: T) -> None:
-        self._root = self._delete(self._root, value)
+        path: List[BinaryNode[T]] = []
+        node: Optional[BinaryNode[T]] = self._root
+        while node is not None and node.value != value:
+            path.append(node)
+            node = node.right if value > node.value else node.left
+        if node is None:
+            return
 
-    @contravariant_args
-    def _delete(self, parent: Optional[BinaryNode[T]], value: T) -> Optional[BinaryNode[T]]:
-        if parent is None:
-            return None
-        if value > parent.value:
-            parent.right = self._delete(parent.right, value)
-        elif value < parent.value:
-            parent.left = self._delete(parent.left, value)
+        # A node with two children takes the maximum of its left subtree, which is unlinked instead
+        if node.left is not None and node.right is not None:
+            path.append(node)
+            predecessor: BinaryNode[T] = node.left
+            while predecessor.right is not None:
+                path.append(predecessor)
+                predecessor = predecessor.right
+            node.value = predecessor.value
+            node = predecessor
+
+        child: Final[Optional[BinaryNode[T]]] = node.left if node.right is None else node.right
+        if not path:
+            self._root = child
+        elif path[-1].left is node:
+            path[-1].left = child
         else:
-            if parent.left is None:
-                self._size -= 1
-                return parent.right
-            if parent.right is None:
-                self._size -= 1
-                return parent.left
-            parent.value = self._find_max(parent.left)
-            parent.left = self._delete(parent.left, parent.value)
-        return parent
+            path[-1].right = child
+        self._size -= 1
+        self._retrace(path)
 
     @override
     def clear(self) -> None:
@@ -111,65 +195,58 @@ class SearchTree(IOrderedBinaryTree[T], Generic[T]):
         action: Callable[[T], None],
         traverse_type: TraversalType = TraversalType.IN_ORDER,
     ) -> None:
-        match traverse_type:
-            case TraversalType.PRE_ORDER:
-                self._pre_order(self._root, action)
-            case TraversalType.IN_ORDER:
-                self._in_order(self._root, action)
-            case TraversalType.POST_ORDER:
-                self._post_order(self._root, action)
-
-    def _pre_order(self, node: Optional[BinaryNode[T]], action: Callable[[T], None]) -> None:
-        if node is None:
-            return
-        action(node.value)
-        self._pre_order(node.left, action)
-        self._pre_order(node.right, action)
-
-    def _in_order(self, node: Optional[BinaryNode[T]], action: Callable[[T], None]) -> None:
-        if node is None:
-            return
-        self._in_order(node.left, action)
-        action(node.value)
-        self._in_order(node.right, action)
-
-    def _post_order(self, node: Optional[BinaryNode[T]], action: Callable[[T], None]) -> None:
-        if node is None:
-            return
-        self._post_order(node.left, action)
-        self._post_order(node.right, action)
-        action(node.value)
+        for value in self.generator(traverse_type):
+            action(value)
 
     @override
     def generator(self, traverse_type: TraversalType = TraversalType.IN_ORDER) -> Iterator[T]:
         match traverse_type:
             case TraversalType.PRE_ORDER:
-                yield from self._pre_order_generator(self._root)
+                return self._pre_order_generator()
             case TraversalType.IN_ORDER:
-                yield from self._in_order_generator(self._root)
+                return self._in_order_generator()
             case TraversalType.POST_ORDER:
-                yield from self._post_order_generator(self._root)
+                return self._post_order_generator()
 
-    def _pre_order_generator(self, node: Optional[BinaryNode[T]]) -> Iterator[T]:
-        if node is None:
-            return
-        yield node.value
-        yield from self._pre_order_generator(node.left)
-        yield from self._pre_order_generator(node.right)
+    def _pre_order_generator(self) -> Iterator[T]:
+        stack: List[BinaryNode[T]] = [] if self._root is None else [self._root]
+        while stack:
+            node: BinaryNode[T] = stack.pop()
+            yield node.value
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
 
-    def _in_order_generator(self, node: Optional[BinaryNode[T]]) -> Iterator[T]:
-        if node is None:
-            return
-        yield from self._in_order_generator(node.left)
-        yield node.value
-        yield from self._in_order_generator(node.right)
+    def _in_order_generator(self) -> Iterator[T]:
+        stack: List[BinaryNode[T]] = []
+        node: Optional[BinaryNode[T]] = self._root
+        while True:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            if not stack:
+                return
+            current: BinaryNode[T] = stack.pop()
+            yield current.value
+            node = current.right
 
-    def _post_order_generator(self, node: Optional[BinaryNode[T]]) -> Iterator[T]:
-        if node is None:
-            return
-        yield from self._post_order_generator(node.left)
-        yield from self._post_order_generator(node.right)
-        yield node.value
+    def _post_order_generator(self) -> Iterator[T]:
+        stack: List[BinaryNode[T]] = []
+        node: Optional[BinaryNode[T]] = self._root
+        last: Optional[BinaryNode[T]] = None
+        while True:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            if not stack:
+                return
+            top: BinaryNode[T] = stack[-1]
+            if top.right is not None and top.right is not last:
+                node = top.right
+            else:
+                yield top.value
+                last = stack.pop()
 
     @override
     def __str__(self) -> str:
@@ -177,22 +254,17 @@ class SearchTree(IOrderedBinaryTree[T], Generic[T]):
         if self._root is None:
             return f"{class_name} is empty"
         result: List[str] = [f"{class_name}\n"]
-        self._create_str_tree(result, "", self._root, True)
-        return "".join(result)
-
-    def _create_str_tree(
-        self,
-        result: List[str],
-        prefix: str,
-        node: BinaryNode[T],
-        is_tail: bool,
-    ) -> None:
-        if node.right is not None:
-            new_prefix = prefix + ("│   " if is_tail else "    ")
-            self._create_str_tree(result, new_prefix, node.right, False)
-
-        result.append(prefix + ("└── " if is_tail else "┌── ") + str(node.value) + "\n")
+        # Right subtree first, so the tree reads top to bottom when printed sideways
+        stack: List[Tuple[BinaryNode[T], str, bool, bool]] = [(self._root, "", True, False)]
+        while stack:
+            node, prefix, is_tail, expanded = stack.pop()
+            if expanded:
+                result.append(prefix + ("└── " if is_tail else "┌── ") + str(node.value) + "\n")
+                continue
 
-        if node.left is not None:
-            new_prefix = prefix + ("    " if is_tail else "│   ")
-            self._create_str_tree(result, new_prefix, node.left, True)
+            if node.left is not None:
+                stack.append((node.left, prefix + ("    " if is_tail else "│   "), True, False))
+            stack.append((node, prefix, is_tail, True))
+            if node.right is not None:
+                stack.append((node.right, prefix + ("│   " if is_tail else "    "), False, False))
+        return "".join(result)
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Final, Generic, Iterator, Optional, Tuple
+from typing import Callable, Final, Generic, Iterator, List, Optional, Tuple
 
 from common.comparable import Comparable
 from common.extra_typing import override
+from common.metrics import registry
 from lab3.models.number import *
 from lab3.models.student import *
 from lab3.trees.trie import *
@@ -254,6 +255,25 @@ class TernaryTrie(ITrie[K, V], Generic[K, V]):
             assert node.key is not None and node.value is not None
             yield node.key, node.value
 
+    def _count_nodes(self) -> int:
+        count: int = 0
+        stack: List[Optional[TernaryTrieNode[K, V]]] = [self._root]
+
+        while stack:
+            node: Optional[TernaryTrieNode[K, V]] = stack.pop()
+            if node is not None:
+                count += 1
+                stack.extend((node.left, node.middle, node.right))
+
+        return count
+
     @override
     def __str__(self) -> str:
         return f"TernaryTrie({', '.join(f'{key}: {value}' for key, value in self.generator())})"
+
+
+registry.register(
+    TernaryTrie,
+    operations=("put", "get_or_none", "delete"),
+    gauges={"keys": len, "nodes": lambda trie: trie._count_nodes()},
+)
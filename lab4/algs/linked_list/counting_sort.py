@@ -37,4 +37,4 @@ def counting_sort_through_public_api(
         sorted_array[positions[shifted_key]] = element
 
     linked_list.clear()
-    [linked_list.add(element) for element in sorted_array]
+    linked_list.extend(sorted_array)
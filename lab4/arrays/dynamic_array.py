@@ -5,6 +5,7 @@ from abc import ABC, abstractmethod
 from typing import Any, Final, Iterator, Optional, Sequence, Union, cast, overload
 
 from common.extra_typing import override
+from common.metrics import registry
 from lab4.arrays.array import ArrayIndexOutOfBoundsException, IArray, T
 
 _CArray = ctypes.Array[Any]
@@ -190,3 +191,11 @@ class DynamicArray(IArray[T]):
     @override
     def __str__(self) -> str:
         return f"DynamicArray({self._array[:self._size]})"
+
+
+registry.register(
+    DynamicArray,
+    operations=("add", "insert", "__getitem__", "update", "remove_at"),
+    events={"resizes": ("_resize",)},
+    gauges={"size": len, "capacity": lambda array: array._capacity},
+)
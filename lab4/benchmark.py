@@ -1,9 +1,13 @@
-from random import randint, sample
+from itertools import islice
+from random import Random
 from typing import List
 
 from common import benchmark
 from common.benchmark import Benchmark, BenchmarkCallback
+from common.comparable import default_compare
 from common.extra_typing import override
+from common.instrumentation import counting_compare, counting_sequence
+from lab2.linked_list.counting_doubly_linked_list import CountingDoublyLinkedList
 from lab2.linked_list.doubly_linked_list import DoublyLinkedList
 from lab4.algs.arrays.insertion_sort import insertion_sort
 from lab4.algs.arrays.merge_sort import merge_sort, merge_sort_in_place
@@ -14,6 +18,7 @@ from lab4.algs.linked_list.gnome_sort import (
 )
 from lab4.arrays.array import IArray
 from lab4.arrays.dynamic_array import DynamicArray
+from lab4.models.book import Book, book_generator
 
 
 class DynamicArrayBenchmark(Benchmark):
@@ -29,15 +34,19 @@ class DynamicArrayBenchmark(Benchmark):
         return callback, self.n
 
     def benchmark_get(self) -> BenchmarkCallback:
-        self.array.add_all(sample(range(self.n), self.n))
+        self.array.add_all(self.fixtures.permutation(self.n))
+        indexes: List[int] = self.fixtures.integers(self.n, 0, self.n - 1)
+        index: int = 0
 
         def callback() -> None:
-            self.array.element_at(randint(0, len(self.array) - 1))
+            nonlocal index
+            self.array.element_at(indexes[index])
+            index += 1
 
         return callback, self.n
 
     def benchmark_remove(self) -> BenchmarkCallback:
-        random_values: List[int] = sample(range(self.n), self.n)
+        random_values: List[int] = self.fixtures.permutation(self.n)
         self.array.add_all(random_values)
         index: int = 0
 
@@ -55,30 +64,39 @@ class SortingBenchmark(Benchmark):
         self.array_n = 1000
         self.linked_list_n = 1000
 
-        self.array: List[int] = sample(range(self.array_n), self.array_n)
+        self.compare = counting_compare(default_compare, self.operations)
+        self.array: List[int] = counting_sequence(
+            self.fixtures.permutation(self.array_n), self.operations
+        )
 
-        self.linked_list: DoublyLinkedList[int] = DoublyLinkedList()
-        [self.linked_list.add(x) for x in sample(range(self.linked_list_n), self.linked_list_n)]
+        self.linked_list: DoublyLinkedList[int] = (
+            DoublyLinkedList()
+            if self.operations is None
+            else CountingDoublyLinkedList(self.operations)
+        )
+        [self.linked_list.add(x) for x in self.fixtures.permutation(self.linked_list_n)]
 
     def benchmark_insertion_sort(self) -> BenchmarkCallback:
         def callback() -> None:
-            insertion_sort(self.array)
+            insertion_sort(self.array, self.compare)
 
         return callback, 1, self.array_n
 
     def benchmark_merge_sort(self) -> BenchmarkCallback:
         def callback() -> None:
-            merge_sort(self.array)
+            merge_sort(self.array, self.compare)
 
         return callback, 1, self.array_n
 
     def benchmark_merge_sort_in_place(self) -> BenchmarkCallback:
         def callback() -> None:
-            merge_sort_in_place(self.array)
+            merge_sort_in_place(self.array, self.compare)
 
         return callback, 1, self.array_n
 
     def benchmark_counting_sort(self) -> BenchmarkCallback:
+        # Counting sort makes no comparisons and calls the key selector once per element,
+        # so there is no compare to count; the list's reads, writes and hops are counted
         def callback() -> None:
             counting_sort_through_public_api(self.linked_list, lambda x: x)
 
@@ -86,16 +104,51 @@ class SortingBenchmark(Benchmark):
 
     def benchmark_gnome_sort_through_public_api(self) -> BenchmarkCallback:
         def callback() -> None:
-            gnome_sort_through_public_api(self.linked_list)
+            gnome_sort_through_public_api(self.linked_list, self.compare)
 
         return callback, 1, self.linked_list_n
 
     def benchmark_gnome_sort_through_node(self) -> BenchmarkCallback:
         def callback() -> None:
-            gnome_sort_through_node(self.linked_list)
+            gnome_sort_through_node(self.linked_list, self.compare)
 
         return callback, 1, self.linked_list_n
 
+    def benchmark_merge_sort_through_relinking(self) -> BenchmarkCallback:
+        def callback() -> None:
+            self.linked_list.sort(compare=self.compare)
+
+        return callback, 1, self.linked_list_n
+
+
+class BookSortingBenchmark(Benchmark):
+    @override
+    def setUp(self) -> None:
+        self.n = 1000
+
+        def generate(random: Random) -> List[Book]:
+            return [*islice(book_generator(random), self.n)]
+
+        self.books: List[Book] = counting_sequence(
+            self.fixtures.cached("books", generate, self.n), self.operations
+        )
+
+    def benchmark_merge_sort_by_price(self) -> BenchmarkCallback:
+        compare = counting_compare(lambda a, b: a.price < b.price, self.operations)
+
+        def callback() -> None:
+            merge_sort(self.books, compare)
+
+        return callback, 1, self.n
+
+    def benchmark_merge_sort_by_author(self) -> BenchmarkCallback:
+        compare = counting_compare(lambda a, b: a.author < b.author, self.operations)
+
+        def callback() -> None:
+            merge_sort(self.books, compare)
+
+        return callback, 1, self.n
+
 
 if __name__ == "__main__":
     benchmark.main()
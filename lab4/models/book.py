@@ -2,8 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from functools import total_ordering
-from random import randint
-from typing import Generator
+from random import Random
+from typing import Generator, Optional
 
 
 @dataclass
@@ -38,12 +38,14 @@ class Book:
         return f"Book(author: {self.author}, publisher: {self.publisher}, pages: {self.pages}, price: {self.price}, isbn: {self.isbn})"
 
 
-def book_generator() -> Generator[Book]:
+def book_generator(random: Optional[Random] = None) -> Generator[Book]:
+    rng: Random = random if random is not None else Random()
+
     while True:
         yield Book(
-            f"Author {randint(1, 100)}",
-            f"Publisher {randint(1, 100)}",
-            randint(1, 1000),
-            randint(1, 1000),
-            f"ISBN {randint(1, 100)}",
+            f"Author {rng.randint(1, 100)}",
+            f"Publisher {rng.randint(1, 100)}",
+            rng.randint(1, 1000),
+            rng.randint(1, 1000),
+            f"ISBN {rng.randint(1, 100)}",
         )
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import unittest
 from random import randint
-from typing import Callable, Generator, List, Optional
+from typing import Callable, Generator, List, Optional, Tuple
 
 from common.extra_typing import override
+from common.metrics import ClassMetrics, registry
 from lab2.linked_list.doubly_linked_list import DoublyLinkedList
 from lab2.linked_list.linked_list import ILinkedList
 from lab4.algs.arrays.insertion_sort import insertion_sort
@@ -163,6 +164,23 @@ class ArrayTest(unittest.TestCase):
         self.array.add_all([1, 2, 3, 4])
         self.assertEqual([*reversed(self.array)], [4, 3, 2, 1])
 
+    def test_metrics(self) -> None:
+        add: Callable[[DynamicArray[int], int], None] = DynamicArray.add
+        registry.enable()
+        try:
+            registry.reset()
+            array: DynamicArray[int] = DynamicArray(1)
+            array.add_all([1, 2, 3, 4, 5])
+            metrics: ClassMetrics = registry.snapshot()["DynamicArray"]
+        finally:
+            registry.disable()
+
+        self.assertEqual(metrics.operations["add"], 5)
+        self.assertEqual(metrics.events["resizes"], 3)
+        self.assertEqual(metrics.gauges["size"].max, 5)
+        self.assertEqual(metrics.gauges["capacity"].max, 8)
+        self.assertIs(DynamicArray.add, add)
+
 
 class SortingTest(unittest.TestCase):
     @override
@@ -248,6 +266,34 @@ class SortingTest(unittest.TestCase):
 
         self._test_sorting(_sort)
 
+    def test_sort_through_relinking(self) -> None:
+        def _sort(array: List[int]) -> List[int]:
+            linked_list: DoublyLinkedList[int] = DoublyLinkedList.from_iterable(array)
+            linked_list.sort()
+            self.assertEqual([*reversed(linked_list)], [*linked_list][::-1])
+            return [x for x in linked_list]
+
+        self._test_sorting(_sort)
+
+    def test_sort_through_relinking_is_stable(self) -> None:
+        pairs: List[Tuple[int, int]] = [(randint(0, 5), i) for i in range(200)]
+        linked_list: DoublyLinkedList[Tuple[int, int]] = DoublyLinkedList.from_iterable(pairs)
+        linked_list.sort(key=lambda pair: pair[0], compare=lambda a, b: a > b)
+        self.assertListEqual([*linked_list], sorted(pairs, key=lambda pair: -pair[0]))
+        self.assertEqual(linked_list[100], sorted(pairs, key=lambda pair: -pair[0])[100])
+
+    def test_merge_sorted(self) -> None:
+        for _ in range(self.random_iteration):
+            left: List[int] = sorted(next(self._random_list_generator(randint(0, 10))))
+            right: List[int] = sorted(next(self._random_list_generator(randint(0, 10))))
+            linked_list: DoublyLinkedList[int] = DoublyLinkedList.from_iterable(left)
+            other: DoublyLinkedList[int] = DoublyLinkedList.from_iterable(right)
+            linked_list.merge_sorted(other)
+            self.assertListEqual([*linked_list], sorted(left + right))
+            self.assertListEqual([*reversed(linked_list)], sorted(left + right, reverse=True))
+            self.assertEqual(len(linked_list), len(left) + len(right))
+            self.assertTrue(other.is_empty())
+
     def test_counting_sort_through_public_api(self) -> None:
         self.random_size = 10
         self.random_iteration = 10
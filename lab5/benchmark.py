@@ -1,9 +1,11 @@
-from random import randint
 from typing import List
 
 from common import benchmark
 from common.benchmark import Benchmark, BenchmarkCallback
+from common.comparable import default_compare_to
 from common.extra_typing import override
+from common.instrumentation import counting_compare, counting_sequence
+from lab2.linked_list.counting_doubly_linked_list import CountingDoublyLinkedList
 from lab2.linked_list.doubly_linked_list import DoublyLinkedList
 from lab4.arrays.dynamic_array import DynamicArray
 from lab5.algs.fibonacci_search import fibonacci_search
@@ -20,47 +22,63 @@ class SearchBenchmark(Benchmark):
         self.lower_bound: int = -1000
         self.upper_bound: int = 1000
 
-        self.list: List[int] = [
-            randint(self.lower_bound, self.upper_bound) for _ in range(self.list_n)
-        ]
+        values: List[int] = self.fixtures.integers(self.list_n, self.lower_bound, self.upper_bound)
+
+        self.compare = counting_compare(default_compare_to, self.operations)
+        self.list: List[int] = counting_sequence(values, self.operations)
         self.array: DynamicArray[int] = DynamicArray()
-        self.array.add_all(self.list)
-        self.linked_list: DoublyLinkedList[int] = DoublyLinkedList()
-        [self.linked_list.add(x) for x in self.list]
+        self.array.add_all(values)
+        self.array = counting_sequence(self.array, self.operations)
+        self.linked_list: DoublyLinkedList[int] = (
+            DoublyLinkedList()
+            if self.operations is None
+            else CountingDoublyLinkedList(self.operations)
+        )
+        [self.linked_list.add(x) for x in values]
+
+        self.queries: List[int] = self.fixtures.integers(
+            max(self.list_n, self.array_n, self.linked_list_n), self.lower_bound, self.upper_bound
+        )
+        self.index: int = 0
+
+    def _next_query(self) -> int:
+        query: int = self.queries[self.index]
+        self.index += 1
+        return query
 
     def benchmark_fibonacci_search_list(self) -> BenchmarkCallback:
         def callback() -> None:
-            fibonacci_search(self.list, randint(self.lower_bound, self.upper_bound))
+            fibonacci_search(self.list, self._next_query(), self.compare)
 
         return callback, self.list_n
 
     def benchmark_fibonacci_search_array(self) -> BenchmarkCallback:
         def callback() -> None:
-            fibonacci_search(self.array, randint(self.lower_bound, self.upper_bound))
+            fibonacci_search(self.array, self._next_query(), self.compare)
 
         return callback, self.array_n
 
     def benchmark_fibonacci_search_linked_list(self) -> BenchmarkCallback:
         def callback() -> None:
-            fibonacci_search(self.linked_list, randint(self.lower_bound, self.upper_bound))
+            fibonacci_search(self.linked_list, self._next_query(), self.compare)
 
         return callback, self.linked_list_n
 
     def benchmark_interpolation_search_list(self) -> BenchmarkCallback:
         def callback() -> None:
-            interpolation_search(self.list, randint(self.lower_bound, self.upper_bound))
+            interpolation_search(self.list, self._next_query(), self.compare)
 
         return callback, self.list_n
 
     def benchmark_interpolation_search_array(self) -> BenchmarkCallback:
         def callback() -> None:
-            interpolation_search(self.array, randint(self.lower_bound, self.upper_bound))
+            interpolation_search(self.array, self._next_query(), self.compare)
 
         return callback, self.array_n
 
     def benchmark_interpolation_search_linked_list(self) -> BenchmarkCallback:
         def callback() -> None:
-            interpolation_search(self.linked_list, randint(self.lower_bound, self.upper_bound))
+            interpolation_search(self.linked_list, self._next_query(), self.compare)
 
         return callback, self.linked_list_n
 
@@ -1,8 +1,8 @@
-from random import randint, sample
-from typing import List
+from typing import List, Tuple
 
 from common import benchmark
-from common.benchmark import Benchmark, BenchmarkCallback
+from common.benchmark import Benchmark, BenchmarkCallback, sweep
+from common.complexity import geometric_sizes
 from common.extra_typing import override
 from lab6.algs.adjacency_matrix.dijkstra import dijkstra
 from lab6.algs.adjacency_matrix.topological_sort import topological_sort
@@ -18,8 +18,9 @@ class GraphBenchmark(Benchmark):
 
         self.n: int = 2500
 
+    @sweep(geometric_sizes(250, 2500, 4))
     def benchmark_add_vertex(self) -> BenchmarkCallback:
-        values: List[int] = sample(range(self.n), self.n)
+        values: List[int] = self.fixtures.permutation(self.n)
         index: int = 0
 
         def callback() -> None:
@@ -30,10 +31,10 @@ class GraphBenchmark(Benchmark):
         return callback, self.n
 
     def benchmark_remove_vertex(self) -> BenchmarkCallback:
-        values: List[int] = sample(range(self.n), self.n)
+        values: List[int] = self.fixtures.permutation(self.n)
         index: int = 0
 
-        self.graph.add_all(sample(range(self.n), self.n))
+        self.graph.add_all(self.fixtures.permutation(self.n))
 
         def callback() -> None:
             nonlocal index
@@ -43,7 +44,7 @@ class GraphBenchmark(Benchmark):
         return callback, self.n
 
     def benchmark_traverse_dfs(self) -> BenchmarkCallback:
-        values: List[int] = sample(range(self.n), self.n)
+        values: List[int] = self.fixtures.permutation(self.n)
 
         self.graph.add_all(values)
 
@@ -53,7 +54,7 @@ class GraphBenchmark(Benchmark):
         return callback, 5, self.n
 
     def benchmark_traverse_bfs(self) -> BenchmarkCallback:
-        values: List[int] = sample(range(self.n), self.n)
+        values: List[int] = self.fixtures.permutation(self.n)
 
         self.graph.add_all(values)
 
@@ -63,22 +64,32 @@ class GraphBenchmark(Benchmark):
         return callback, 5, self.n
 
     def benchmark_get_path(self) -> BenchmarkCallback:
-        values: List[int] = sample(range(self.n), self.n)
+        values: List[int] = self.fixtures.permutation(self.n)
 
         self.graph.add_all(values)
 
+        pairs: List[Tuple[int, int]] = self.fixtures.pairs(self.n, 0, self.n - 1)
+        index: int = 0
+
         def callback() -> None:
-            self.graph.get_path(randint(0, self.n - 1), randint(0, self.n - 1))
+            nonlocal index
+            self.graph.get_path(*pairs[index])
+            index += 1
 
         return callback, self.n
 
     def benchmark_get_all_paths(self) -> BenchmarkCallback:
-        values: List[int] = sample(range(self.n), self.n)
+        values: List[int] = self.fixtures.permutation(self.n)
 
         self.graph.add_all(values)
 
+        pairs: List[Tuple[int, int]] = self.fixtures.pairs(self.n, 0, self.n - 1)
+        index: int = 0
+
         def callback() -> None:
-            self.graph.get_all_paths(randint(0, self.n - 1), randint(0, self.n - 1))
+            nonlocal index
+            self.graph.get_all_paths(*pairs[index])
+            index += 1
 
         return callback, self.n
 
@@ -100,7 +111,7 @@ class GraphHydratedBenchmark(Benchmark):
             pass
 
     def benchmark_file_save(self) -> BenchmarkCallback:
-        self.graph.add_all(sample(range(self.n), self.n))
+        self.graph.add_all(self.fixtures.permutation(self.n))
 
         def callback() -> None:
             GraphSerializer.save_graph_to_file(self.graph, self.filename)
@@ -108,7 +119,7 @@ class GraphHydratedBenchmark(Benchmark):
         return callback, 1, self.n
 
     def benchmark_file_load(self) -> BenchmarkCallback:
-        self.graph.add_all(sample(range(self.n), self.n))
+        self.graph.add_all(self.fixtures.permutation(self.n))
 
         GraphSerializer.save_graph_to_file(self.graph, self.filename)
         self.graph.clear()
@@ -126,19 +137,29 @@ class GraphAlgsBenchmark(Benchmark):
 
     def benchmark_directed_dijkstra(self) -> BenchmarkCallback:
         directed_graph: AdjacencyMatrixGraph[int, int] = AdjacencyMatrixGraph(is_directed=True)
-        directed_graph.add_all(sample(range(self.n), self.n))
+        directed_graph.add_all(self.fixtures.permutation(self.n))
+
+        pairs: List[Tuple[int, int]] = self.fixtures.pairs(self.n, 0, self.n - 1)
+        index: int = 0
 
         def callback() -> None:
-            dijkstra(directed_graph, randint(0, self.n - 1), randint(0, self.n - 1))
+            nonlocal index
+            dijkstra(directed_graph, *pairs[index])
+            index += 1
 
         return callback, self.n
 
     def benchmark_undirected_dijkstra(self) -> BenchmarkCallback:
         undirected_graph: AdjacencyMatrixGraph[int, int] = AdjacencyMatrixGraph(is_directed=False)
-        undirected_graph.add_all(sample(range(self.n), self.n))
+        undirected_graph.add_all(self.fixtures.permutation(self.n))
+
+        pairs: List[Tuple[int, int]] = self.fixtures.pairs(self.n, 0, self.n - 1)
+        index: int = 0
 
         def callback() -> None:
-            dijkstra(undirected_graph, randint(0, self.n - 1), randint(0, self.n - 1))
+            nonlocal index
+            dijkstra(undirected_graph, *pairs[index])
+            index += 1
 
         return callback, self.n
 
@@ -149,7 +170,7 @@ class GraphAlgsBenchmark(Benchmark):
         ]
 
         for directed_graph in directed_graphs:
-            directed_graph.add_all(sample(range(elements_count), elements_count))
+            directed_graph.add_all(self.fixtures.permutation(elements_count))
 
         index: int = 0
 
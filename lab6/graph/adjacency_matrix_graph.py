@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Callable, Iterator, List, Optional, Tuple, TypeVar, cast
 
 from common.extra_typing import override
+from common.metrics import registry
 from lab6.graph.graph import (
     GraphTraversalType,
     IGraph,
@@ -465,3 +466,13 @@ class AdjacencyMatrixGraph(IGraph[T, Weight]):
         ]
 
         return f"{self.__class__.__name__}:\n" + "\n".join(str_matrix)
+
+
+registry.register(
+    AdjacencyMatrixGraph,
+    operations=("add", "remove", "connect", "disconnect", "get_path"),
+    gauges={
+        "vertices": lambda graph: graph.vertex_count,
+        "edges": lambda graph: graph.edge_count,
+    },
+)
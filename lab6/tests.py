@@ -3,9 +3,10 @@ from __future__ import annotations
 import unittest
 from dataclasses import dataclass
 from functools import total_ordering
-from typing import List
+from typing import Callable, List
 
 from common.extra_typing import override
+from common.metrics import ClassMetrics, registry
 from lab6.algs.adjacency_matrix.dijkstra import NegativeWeightException, dijkstra
 from lab6.algs.adjacency_matrix.topological_sort import (
     CycleInGraphException,
@@ -871,6 +872,33 @@ class GraphTest(unittest.TestCase):
             [["A"]],
         )
 
+    def test_metrics(self) -> None:
+        connect: Callable[..., None] = AdjacencyMatrixGraph.connect
+        init: Callable[..., None] = AdjacencyMatrixGraph.__init__
+        registry.enable()
+        try:
+            registry.reset()
+            graph: AdjacencyMatrixGraph[str, int] = AdjacencyMatrixGraph(is_directed=True)
+            graph.add_all(["A", "B", "C", "D"])
+            graph.connect_all([("A", "B", 1), ("B", "C", 2), ("C", "D", 3)])
+            graph.disconnect("C", "D")
+            graph.remove("D")
+            graph.get_path("A", "C")
+            metrics: ClassMetrics = registry.snapshot()["AdjacencyMatrixGraph"]
+        finally:
+            registry.disable()
+
+        self.assertEqual(metrics.instances, 1)
+        # disconnect goes through connect with no weight
+        self.assertDictEqual(
+            metrics.operations,
+            {"add": 4, "remove": 1, "connect": 4, "disconnect": 1, "get_path": 1},
+        )
+        self.assertEqual(metrics.gauges["vertices"].max, 3)
+        self.assertEqual(metrics.gauges["edges"].max, 2)
+        self.assertIs(AdjacencyMatrixGraph.connect, connect)
+        self.assertIs(AdjacencyMatrixGraph.__init__, init)
+
 
 class GraphSerializationTests(unittest.TestCase):
     @dataclass